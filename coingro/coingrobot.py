@@ -36,6 +36,7 @@ from coingro.exceptions import (
 )
 from coingro.exchange import timeframe_to_minutes, timeframe_to_seconds
 from coingro.exchange.exchange import timeframe_to_next_date
+from coingro.metrics import PROCESS_DURATION, PROCESS_PHASE_DURATION, SIGNAL_LATENCY, registry
 from coingro.misc import safe_value_fallback, safe_value_fallback2
 from coingro.mixins import LoggingMixin
 from coingro.persistence import Order, PairLocks, Trade, cleanup_db, init_db
@@ -119,6 +120,8 @@ class CoingroBot(LoggingMixin):
 
         # Protect exit-logic from forcesell and vice versa
         self._exit_lock = Lock()
+        # Open orders fetched in bulk for the current iteration, by order id
+        self._synced_orders: Dict[str, Dict] = {}
         LoggingMixin.__init__(self, logger, timeframe_to_seconds(self.strategy.timeframe))
 
         self.trading_mode: TradingMode = self.config.get("trading_mode", TradingMode.SPOT)
@@ -166,6 +169,7 @@ class CoingroBot(LoggingMixin):
 
         self.check_for_open_trades()
 
+        self.strategy.cg_bot_cleanup()
         self.rpc.cleanup()
         cleanup_db()
         self.exchange.close()
@@ -190,51 +194,77 @@ class CoingroBot(LoggingMixin):
         otherwise a new trade is created.
         :return: True if one or more trades has been created or closed, False otherwise
         """
+        with registry.timer(PROCESS_DURATION):
+            try:
+                self._process()
+            finally:
+                # Prefetched rates and orders are only valid for this iteration - also if
+                # it failed, as force_entry / force_exit would otherwise use stale rates.
+                self.exchange.clear_rate_snapshot()
+                self._synced_orders = {}
+        self.last_process = datetime.now(timezone.utc)
+
+    def _process(self) -> None:
+        """
+        Run all phases of one bot iteration, recording the duration of each phase.
+        """
+
+        def phase(name: str):
+            return registry.timer(PROCESS_PHASE_DURATION, phase=name)
 
         # Check whether markets have to be reloaded and reload them when it's needed
-        self.exchange.reload_markets()
+        with phase("reload_markets"):
+            self.exchange.reload_markets()
 
-        self.update_closed_trades_without_assigned_fees()
+        with phase("update_fees"):
+            self.update_closed_trades_without_assigned_fees()
 
-        # Query trades from persistence layer
-        trades = Trade.get_open_trades()
+        with phase("refresh_pairlist"):
+            # Query trades from persistence layer
+            trades = Trade.get_open_trades()
 
-        self.active_pair_whitelist = self._refresh_active_whitelist(trades)
+            self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
         # Refreshing candles
-        self.dataprovider.refresh(
-            self.pairlists.create_pair_list(self.active_pair_whitelist),
-            self.strategy.gather_informative_pairs(),
-        )
+        with phase("refresh_data"):
+            self.dataprovider.refresh(
+                self.pairlists.create_pair_list(self.active_pair_whitelist),
+                self.strategy.gather_informative_pairs(),
+            )
 
-        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
+        with phase("analyze"):
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
 
-        self.strategy.analyze(self.active_pair_whitelist)
+            self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
+        with self._exit_lock, phase("manage_open_orders"):
+            self._synced_orders = self._fetch_orders_bulk(Order.get_open_orders())
             # Check for exchange cancelations, timeouts and user requested replace
             self.manage_open_orders()
 
         # Protect from collisions with force_exit.
         # Without this, coingro my try to recreate stoploss_on_exchange orders
         # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
+        with self._exit_lock, phase("exit_positions"):
             trades = Trade.get_open_trades()
+            self._prefetch_rates(trades)
             # First process current opened trades (positions)
             self.exit_positions(trades)
 
         # Check if we need to adjust our current positions before attempting to buy new trades.
         if self.strategy.position_adjustment_enable:
-            with self._exit_lock:
+            with self._exit_lock, phase("adjust_positions"):
                 self.process_open_trade_positions()
 
         # Then looking for buy opportunities
-        if self.get_free_open_trades():
-            self.enter_positions()
+        with phase("enter_positions"):
+            if self.get_free_open_trades():
+                self.enter_positions()
         if self.trading_mode == TradingMode.FUTURES:
-            self._schedule.run_pending()
-        Trade.commit()
-        self.last_process = datetime.now(timezone.utc)
+            with phase("funding_fees"):
+                self._schedule.run_pending()
+        with phase("commit"):
+            Trade.commit()
 
     def process_stopped(self) -> None:
         """
@@ -314,11 +344,16 @@ class CoingroBot(LoggingMixin):
 
         orders = Order.get_open_orders()
         logger.info(f"Updating {len(orders)} open orders.")
+        fetched_orders = self._fetch_orders_bulk(orders)
         for order in orders:
             try:
-                fo = self.exchange.fetch_order_or_stoploss_order(
-                    order.order_id, order.cg_pair, order.cg_order_side == "stoploss"
-                )
+                fo = fetched_orders.get(order.order_id)
+                if fo is None:
+                    fo = self.exchange.fetch_order_or_stoploss_order(
+                        order.order_id, order.cg_pair, order.cg_order_side == "stoploss"
+                    )
+                if order.is_unchanged(fo):
+                    continue
 
                 self.update_trade_state(
                     order.trade,
@@ -515,22 +550,33 @@ class CoingroBot(LoggingMixin):
             if (bid_check_dom.get("enabled", False)) and (
                 bid_check_dom.get("bids_to_ask_delta", 0) > 0
             ):
-                if self._check_depth_of_market(pair, bid_check_dom, side=signal):
-                    return self.execute_entry(
-                        pair,
-                        stake_amount,
-                        enter_tag=enter_tag,
-                        is_short=(signal == SignalDirection.SHORT),
-                    )
-                else:
+                if not self._check_depth_of_market(pair, bid_check_dom, side=signal):
                     return False
 
-            return self.execute_entry(
+            if self.execute_entry(
                 pair, stake_amount, enter_tag=enter_tag, is_short=(signal == SignalDirection.SHORT)
-            )
+            ):
+                self._record_signal_latency(pair)
+                return True
+            return False
         else:
             return False
 
+    def _record_signal_latency(self, pair: str) -> None:
+        """
+        Record the time between the close of the signal candle and placing the order.
+        """
+        timeframe = self.strategy.timeframe
+        analyzed_df, _ = self.dataprovider.get_analyzed_dataframe(pair, timeframe)
+        if len(analyzed_df) == 0:
+            return
+        candle_close = analyzed_df.iloc[-1]["date"] + timedelta(
+            seconds=timeframe_to_seconds(timeframe)
+        )
+        latency = (datetime.now(timezone.utc) - candle_close).total_seconds()
+        logger.debug(f"Signal to order latency: {latency:.2f} s.")
+        registry.observe(SIGNAL_LATENCY, latency)
+
     #
     # BUY / increase positions / DCA logic and methods
     #
@@ -985,6 +1031,15 @@ class CoingroBot(LoggingMixin):
     # SELL / exit positions / close trades logic and methods
     #
 
+    def _prefetch_rates(self, trades: List[Trade]) -> None:
+        """
+        Load the rates of all open trades in one batch, instead of one request per trade.
+        """
+        pairs = [trade.pair for trade in trades if trade.open_order_id is None]
+        self.exchange.prefetch_rates(pairs, "exit")
+        if self.strategy.position_adjustment_enable:
+            self.exchange.prefetch_rates(pairs, "entry")
+
     def exit_positions(self, trades: List[Any]) -> int:
         """
         Tries to execute exit orders for open trades (positions)
@@ -1102,7 +1157,7 @@ class CoingroBot(LoggingMixin):
         try:
             # First we check if there is already a stoploss on exchange
             stoploss_order = (
-                self.exchange.fetch_stoploss_order(trade.stoploss_order_id, trade.pair)
+                self._fetch_order(trade.stoploss_order_id, trade.pair, stoploss_order=True)
                 if trade.stoploss_order_id
                 else None
             )
@@ -1234,6 +1289,8 @@ class CoingroBot(LoggingMixin):
                 )
                 exited = self.execute_trade_exit(trade, exit_rate, should_exit, exit_tag=exit_tag)
                 if exited:
+                    if should_exit.exit_type == ExitType.EXIT_SIGNAL:
+                        self._record_signal_latency(trade.pair)
                     return True
         return False
 
@@ -1248,14 +1305,18 @@ class CoingroBot(LoggingMixin):
             try:
                 if not trade.open_order_id:
                     continue
-                order = self.exchange.fetch_order(trade.open_order_id, trade.pair)
+                order = self._fetch_order(trade.open_order_id, trade.pair)
             except (ExchangeError):
                 logger.info("Cannot query order for %s due to %s", trade, traceback.format_exc())
                 continue
 
-            fully_cancelled = self.update_trade_state(trade, trade.open_order_id, order)
-            not_closed = order["status"] == "open" or fully_cancelled
             order_obj = trade.select_order_by_order_id(trade.open_order_id)
+            if order_obj and order_obj.is_unchanged(order):
+                # Still open without new fills - nothing to update
+                fully_cancelled = False
+            else:
+                fully_cancelled = self.update_trade_state(trade, trade.open_order_id, order)
+            not_closed = order["status"] == "open" or fully_cancelled
 
             if not_closed:
                 if fully_cancelled or (
@@ -1268,6 +1329,28 @@ class CoingroBot(LoggingMixin):
                 else:
                     self.replace_order(order, order_obj, trade)
 
+    def _fetch_orders_bulk(self, orders: List[Order]) -> Dict[str, Dict]:
+        """
+        Fetch the current state of multiple orders at once.
+        Orders missing in the result have to be fetched individually.
+        :return: Dict of order_id -> order
+        """
+        stoploss_orders = [(o.order_id, o.cg_pair) for o in orders if o.cg_order_side == "stoploss"]
+        other_orders = [(o.order_id, o.cg_pair) for o in orders if o.cg_order_side != "stoploss"]
+        result = self.exchange.fetch_orders_bulk(other_orders)
+        result.update(self.exchange.fetch_orders_bulk(stoploss_orders, stoploss_order=True))
+        return result
+
+    def _fetch_order(self, order_id: str, pair: str, stoploss_order: bool = False) -> Dict:
+        """
+        Get an order fetched in bulk during this iteration - or fetch it from the exchange.
+        Orders from the bulk fetch are only used once, as they are outdated after handling.
+        """
+        order = self._synced_orders.pop(order_id, None)
+        if order is None:
+            order = self.exchange.fetch_order_or_stoploss_order(order_id, pair, stoploss_order)
+        return order
+
     def handle_timedout_order(self, order: Dict, trade: Trade) -> None:
         """
         Check if current analyzed order timed out and cancel if necessary.
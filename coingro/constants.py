@@ -12,6 +12,7 @@ DEFAULT_CONFIG = "config.json"
 DEFAULT_CONFIG_SAVE = f"{__id__}_config.json"
 DEFAULT_EXCHANGE = "binance"
 PROCESS_THROTTLE_SECS = 5  # sec
+CANDLE_CLOSE_OFFSET_SECS = 1.0  # sec - time for the exchange to issue a closed candle
 HYPEROPT_EPOCH = 100  # epochs
 RETRY_TIMEOUT = 30  # sec
 TIMEOUT_UNITS = ["minutes", "seconds"]
@@ -55,6 +56,8 @@ AVAILABLE_DATAHANDLERS = ["json", "jsongz", "hdf5"]
 BACKTEST_BREAKDOWNS = ["day", "week", "month"]
 BACKTEST_CACHE_AGE = ["none", "day", "week", "month"]
 BACKTEST_CACHE_DEFAULT = "day"
+BACKTEST_ENGINES = ["loop", "columnar"]
+BACKTEST_ENGINE_DEFAULT = "loop"
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = "%Y-%m-%d %H:%M:%S"
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -202,6 +205,7 @@ CONF_SCHEMA = {
         "dry_run_wallet": {"type": "number", "default": DRY_RUN_WALLET},
         "cancel_open_orders_on_exit": {"type": "boolean", "default": False},
         "process_only_new_candles": {"type": "boolean"},
+        "incremental_analysis": {"type": "boolean"},
         "minimal_roi": {
             "type": "object",
             "patternProperties": {"^[0-9.]+$": {"type": "number"}},
@@ -225,6 +229,7 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_engine": {"type": "string", "enum": BACKTEST_ENGINES},
         "bot_name": {"type": "string"},
         "unfilledtimeout": {
             "type": "object",
@@ -499,6 +504,11 @@ CONF_SCHEMA = {
                 "process_throttle_secs": {"type": "integer"},
                 "interval": {"type": "integer"},
                 "sd_notify": {"type": "boolean"},
+                # Analyze pairs on this many threads. Analyzed dataframes are only stored in the
+                # dataprovider once all pairs are analyzed - while analyzing, strategies reading
+                # other pairs via dp.get_analyzed_dataframe() get the previous iteration's result.
+                "analysis_workers": {"type": "integer", "minimum": 1},
+                "rpc_queue_size": {"type": "integer", "minimum": 0},
             },
         },
         "dataformat_ohlcv": {"type": "string", "enum": AVAILABLE_DATAHANDLERS, "default": "json"},
@@ -537,6 +547,8 @@ CONF_SCHEMA = {
                 "unknown_fee_rate": {"type": "number"},
                 "outdated_offset": {"type": "integer", "minimum": 1},
                 "markets_refresh_interval": {"type": "integer"},
+                "markets_cache_ttl": {"type": "integer", "minimum": 0},
+                "ohlcv_incremental_refresh": {"type": "boolean", "default": True},
                 "ccxt_config": {"type": "object"},
                 "ccxt_async_config": {"type": "object"},
             },
@@ -63,13 +63,19 @@ class DataProvider:
         self._pairlists = pairlists
 
     def historic_ohlcv(
-        self, pair: str, timeframe: Optional[str] = None, candle_type: str = ""
+        self,
+        pair: str,
+        timeframe: Optional[str] = None,
+        candle_type: str = "",
+        copy: bool = True,
     ) -> DataFrame:
         """
         Get stored historical candle (OHLCV) data
         :param pair: pair to get the data for
         :param timeframe: timeframe to get data for
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
+        :param copy: copy dataframe before returning if True.
+                     Use False only for read-only operations (where the dataframe is not modified)
         """
         _candle_type = (
             CandleType.from_string(candle_type)
@@ -95,10 +101,15 @@ class DataProvider:
                 data_format=self._config.get("dataformat_ohlcv", "json"),
                 candle_type=_candle_type,
             )
-        return self.__cached_pairs_backtesting[saved_pair].copy()
+        data = self.__cached_pairs_backtesting[saved_pair]
+        return data.copy() if copy else data
 
     def get_pair_dataframe(
-        self, pair: str, timeframe: Optional[str] = None, candle_type: str = ""
+        self,
+        pair: str,
+        timeframe: Optional[str] = None,
+        candle_type: str = "",
+        copy: bool = True,
     ) -> DataFrame:
         """
         Return pair candle (OHLCV) data, either live or cached historical -- depending
@@ -109,13 +120,17 @@ class DataProvider:
         :param timeframe: timeframe to get data for
         :return: Dataframe for this pair
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
+        :param copy: copy dataframe before returning if True.
+                     Use False only for read-only operations (where the dataframe is not modified)
         """
         if self.runmode in (RunMode.DRY_RUN, RunMode.LIVE):
             # Get live OHLCV data.
-            data = self.ohlcv(pair=pair, timeframe=timeframe, candle_type=candle_type)
+            data = self.ohlcv(pair=pair, timeframe=timeframe, copy=copy, candle_type=candle_type)
         else:
             # Get historical OHLCV data (cached on disk).
-            data = self.historic_ohlcv(pair=pair, timeframe=timeframe, candle_type=candle_type)
+            data = self.historic_ohlcv(
+                pair=pair, timeframe=timeframe, candle_type=candle_type, copy=copy
+            )
         if len(data) == 0:
             logger.warning(f"No data found for ({pair}, {timeframe}, {candle_type}).")
         return data
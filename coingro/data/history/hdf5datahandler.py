@@ -147,13 +147,25 @@ class HDF5DataHandler(IDataHandler):
         self, pair: str, timeframe: str, data: pd.DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Rows are appended to the pair's hdf5 table, without rewriting stored candles.
+        Stored candles from the first appended candle on are replaced.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        if data.empty:
+            return
+        key = self._pair_ohlcv_key(pair, timeframe)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        with pd.HDFStore(filename, mode="a", complevel=9, complib="blosc") as store:
+            if key in store:
+                start = data["date"].min()
+                store.remove(key, where=[f"date >= Timestamp({start.value})"])
+            store.append(key, data.loc[:, self._columns], format="table", data_columns=["date"])
 
     @classmethod
     def trades_get_pairs(cls, datadir: Path) -> List[str]:
@@ -1,6 +1,9 @@
+import asyncio
 import logging
 import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -8,7 +11,7 @@ import arrow
 from pandas import DataFrame, concat
 
 from coingro.configuration import TimeRange
-from coingro.constants import DEFAULT_DATAFRAME_COLUMNS
+from coingro.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
 from coingro.data.converter import (
     clean_ohlcv_dataframe,
     ohlcv_to_dataframe,
@@ -23,6 +26,11 @@ from coingro.misc import format_ms_time
 
 logger = logging.getLogger(__name__)
 
+# Number of pairs downloaded at the same time by refresh_backtest_ohlcv_data()
+DOWNLOAD_CONCURRENCY = 8
+# Number of times failed downloads are retried
+DOWNLOAD_RETRIES = 2
+
 
 def load_pair_history(
     pair: str,
@@ -206,6 +214,105 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _prepare_pair_download(
+    pair: str,
+    timeframe: str,
+    candle_type: CandleType,
+    *,
+    datadir: Path,
+    data_handler: IDataHandler,
+    process: str,
+    new_pairs_days: int,
+    timerange: Optional[TimeRange],
+    erase: bool,
+    prepend: bool,
+) -> Tuple[DataFrame, int, Optional[int]]:
+    """
+    Prepare downloading one pair: erase and load cached data, determine the range to download.
+    :return: Tuple of (cached data, download start ms, download end ms)
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair,
+        timeframe,
+        timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend,
+    )
+
+    logger.info(
+        f'({process}) - Download history data for "{pair}", {timeframe}, '
+        f"{candle_type} and store in {datadir}. "
+        f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+        f'{format_ms_time(until_ms) if until_ms else "now"}'
+    )
+
+    logger.debug(
+        "Current Start: %s",
+        f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else "None",
+    )
+    logger.debug(
+        "Current End: %s",
+        f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else "None",
+    )
+    # Default since_ms to 30 days if nothing is given
+    if not since_ms:
+        since_ms = arrow.utcnow().shift(days=-new_pairs_days).int_timestamp * 1000
+    return data, since_ms, until_ms
+
+
+def _store_pair_download(
+    pair: str,
+    timeframe: str,
+    candle_type: CandleType,
+    data: DataFrame,
+    new_data: List,
+    *,
+    data_handler: IDataHandler,
+    prepend: bool,
+) -> None:
+    """
+    Store downloaded candles of one pair, next to the cached data.
+    Candles after the cached data are appended, other downloads rewrite the stored data.
+    """
+    # TODO: Maybe move parsing to exchange class (?)
+    new_dataframe = ohlcv_to_dataframe(
+        new_data, timeframe, pair, fill_missing=False, drop_incomplete=True
+    )
+    if data.empty or prepend:
+        if not data.empty:
+            # Run cleaning again to ensure there were no duplicate candles
+            # Especially between existing and new data.
+            new_dataframe = clean_ohlcv_dataframe(
+                concat([data, new_dataframe], axis=0),
+                timeframe,
+                pair,
+                fill_missing=False,
+                drop_incomplete=False,
+            )
+        data_handler.ohlcv_store(pair, timeframe, data=new_dataframe, candle_type=candle_type)
+        data = new_dataframe
+    else:
+        # Only write candles after the cached data - stored candles are kept as they are.
+        new_dataframe = new_dataframe.loc[new_dataframe["date"] > data.iloc[-1]["date"]]
+        data_handler.ohlcv_append(pair, timeframe, data=new_dataframe, candle_type=candle_type)
+
+    logger.debug(
+        "New  Start: %s",
+        f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else "None",
+    )
+    logger.debug(
+        "New End: %s",
+        f"{new_dataframe.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}"
+        if not new_dataframe.empty
+        else "None",
+    )
+
+
 def _download_pair_history(
     pair: str,
     *,
@@ -224,7 +331,8 @@ def _download_pair_history(
     Download latest candles from the exchange for the pair and timeframe passed in parameters
     The data is downloaded starting from the last correct data that
     exists in a cache. If timerange starts earlier than the data in the cache,
-    the full data will be redownloaded
+    the full data will be redownloaded.
+    Candles downloaded after the cached data are appended to the stored data.
 
     :param pair: pair to download
     :param timeframe: Timeframe (e.g "5m")
@@ -236,73 +344,35 @@ def _download_pair_history(
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f"Deleting existing data for pair {pair}, {timeframe}, {candle_type}.")
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
+        data, since_ms, until_ms = _prepare_pair_download(
             pair,
             timeframe,
-            timerange,
+            candle_type,
+            datadir=datadir,
             data_handler=data_handler,
-            candle_type=candle_type,
+            process=process,
+            new_pairs_days=new_pairs_days,
+            timerange=timerange,
+            erase=erase,
             prepend=prepend,
         )
-
-        logger.info(
-            f'({process}) - Download history data for "{pair}", {timeframe}, '
-            f"{candle_type} and store in {datadir}. "
-            f'From {format_ms_time(since_ms) if since_ms else "start"} to '
-            f'{format_ms_time(until_ms) if until_ms else "now"}'
-        )
-
-        logger.debug(
-            "Current Start: %s",
-            f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else "None",
-        )
-        logger.debug(
-            "Current End: %s",
-            f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else "None",
-        )
-
-        # Default since_ms to 30 days if nothing is given
         new_data = exchange.get_historic_ohlcv(
             pair=pair,
             timeframe=timeframe,
-            since_ms=since_ms
-            if since_ms
-            else arrow.utcnow().shift(days=-new_pairs_days).int_timestamp * 1000,
+            since_ms=since_ms,
             is_new_pair=data.empty,
             candle_type=candle_type,
             until_ms=until_ms if until_ms else None,
         )
-        # TODO: Maybe move parsing to exchange class (?)
-        new_dataframe = ohlcv_to_dataframe(
-            new_data, timeframe, pair, fill_missing=False, drop_incomplete=True
-        )
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(
-                concat([data, new_dataframe], axis=0),
-                timeframe,
-                pair,
-                fill_missing=False,
-                drop_incomplete=False,
-            )
-
-        logger.debug(
-            "New  Start: %s",
-            f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else "None",
-        )
-        logger.debug(
-            "New End: %s",
-            f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else "None",
+        _store_pair_download(
+            pair,
+            timeframe,
+            candle_type,
+            data,
+            new_data,
+            data_handler=data_handler,
+            prepend=prepend,
         )
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
@@ -312,6 +382,114 @@ def _download_pair_history(
         return False
 
 
+def _download_pairs_history(
+    downloads: List[PairWithTimeframe],
+    *,
+    datadir: Path,
+    exchange: Exchange,
+    data_handler: IDataHandler,
+    new_pairs_days: int = 30,
+    timerange: Optional[TimeRange] = None,
+    erase: bool = False,
+    prepend: bool = False,
+    concurrency: int = DOWNLOAD_CONCURRENCY,
+) -> List[PairWithTimeframe]:
+    """
+    Download candles for many (pair, timeframe, candle_type) combinations concurrently.
+    Up to `concurrency` downloads run at once on the exchange's async client - requests are
+    throttled by ccxt's rate limiter. Loading and storing data happens on a single writer thread,
+    so each download is stored as soon as it completed.
+    Downloads only store complete data - failed downloads are retried from the stored data.
+    :return: List of downloads which failed
+    """
+    total = len(downloads)
+    done = 0
+
+    async def download(
+        semaphore: asyncio.Semaphore,
+        writer: ThreadPoolExecutor,
+        process: str,
+        pair: str,
+        timeframe: str,
+        candle_type: CandleType,
+    ) -> bool:
+        nonlocal done
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            try:
+                data, since_ms, until_ms = await loop.run_in_executor(
+                    writer,
+                    partial(
+                        _prepare_pair_download,
+                        pair,
+                        timeframe,
+                        candle_type,
+                        datadir=datadir,
+                        data_handler=data_handler,
+                        process=process,
+                        new_pairs_days=new_pairs_days,
+                        timerange=timerange,
+                        erase=erase,
+                        prepend=prepend,
+                    ),
+                )
+                _, _, _, new_data = await exchange._async_get_historic_ohlcv(
+                    pair=pair,
+                    timeframe=timeframe,
+                    since_ms=since_ms,
+                    is_new_pair=data.empty,
+                    raise_=True,
+                    candle_type=candle_type,
+                    until_ms=until_ms,
+                )
+                await loop.run_in_executor(
+                    writer,
+                    partial(
+                        _store_pair_download,
+                        pair,
+                        timeframe,
+                        candle_type,
+                        data,
+                        new_data,
+                        data_handler=data_handler,
+                        prepend=prepend,
+                    ),
+                )
+            except Exception:
+                logger.exception(
+                    f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
+                )
+                return False
+        done += 1
+        logger.info(
+            f"({done}/{total}) - Downloaded {len(new_data)} candles for {pair}, {timeframe}, "
+            f"{candle_type}."
+        )
+        return True
+
+    async def download_all(pending: List[PairWithTimeframe]) -> List[bool]:
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            return await asyncio.gather(
+                *(
+                    download(semaphore, writer, f"{idx}/{len(pending)}", *dl)
+                    for idx, dl in enumerate(pending, start=1)
+                )
+            )
+
+    pending = downloads
+    for attempt in range(DOWNLOAD_RETRIES + 1):
+        if attempt:
+            logger.info(f"Retrying {len(pending)} failed downloads.")
+            # Erasing again would drop data stored by the failed attempt
+            erase = False
+        results = exchange.loop.run_until_complete(download_all(pending))
+        pending = [dl for dl, success in zip(pending, results) if not success]
+        if not pending:
+            break
+    return pending
+
+
 def refresh_backtest_ohlcv_data(
     exchange: Exchange,
     pairs: List[str],
@@ -332,29 +510,15 @@ def refresh_backtest_ohlcv_data(
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    process = ""
-    for idx, pair in enumerate(pairs, start=1):
+    downloads: List[PairWithTimeframe] = []
+    for pair in pairs:
         if pair not in exchange.markets:
             pairs_not_available.append(pair)
             logger.info(f"Skipping pair {pair}...")
             continue
         for timeframe in timeframes:
-
             logger.info(f"Downloading pair {pair}, interval {timeframe}.")
-            process = f"{idx}/{len(pairs)}"
-            _download_pair_history(
-                pair=pair,
-                process=process,
-                datadir=datadir,
-                exchange=exchange,
-                timerange=timerange,
-                data_handler=data_handler,
-                timeframe=str(timeframe),
-                new_pairs_days=new_pairs_days,
-                candle_type=candle_type,
-                erase=erase,
-                prepend=prepend,
-            )
+            downloads.append((pair, str(timeframe), candle_type))
         if trading_mode == "futures":
             # Predefined candletype (and timeframe) depending on exchange
             # Downloads what is necessary to backtest based on futures data.
@@ -363,19 +527,20 @@ def refresh_backtest_ohlcv_data(
             # All exchanges need FundingRate for futures trading.
             # The timeframe is aligned to the mark-price timeframe.
             for funding_candle_type in (CandleType.FUNDING_RATE, fr_candle_type):
-                _download_pair_history(
-                    pair=pair,
-                    process=process,
-                    datadir=datadir,
-                    exchange=exchange,
-                    timerange=timerange,
-                    data_handler=data_handler,
-                    timeframe=str(tf_mark),
-                    new_pairs_days=new_pairs_days,
-                    candle_type=funding_candle_type,
-                    erase=erase,
-                    prepend=prepend,
-                )
+                downloads.append((pair, str(tf_mark), funding_candle_type))
+
+    failed = _download_pairs_history(
+        downloads,
+        datadir=datadir,
+        exchange=exchange,
+        data_handler=data_handler,
+        new_pairs_days=new_pairs_days,
+        timerange=timerange,
+        erase=erase,
+        prepend=prepend,
+    )
+    for pair, timeframe, candle_type in failed:
+        logger.warning(f"Could not download data for {pair}, {timeframe}, {candle_type}.")
 
     return pairs_not_available
 
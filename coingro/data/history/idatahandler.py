@@ -110,7 +110,8 @@ class IDataHandler(ABC):
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures, without rewriting the stored data.
+        Stored candles for the same dates are replaced.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import List, Optional
 
 import numpy as np
-from pandas import DataFrame, read_json, to_datetime
+from pandas import DataFrame, concat, read_json, to_datetime
 
 from coingro import misc
 from coingro.configuration import TimeRange
@@ -21,6 +21,8 @@ class JsonDataHandler(IDataHandler):
 
     _use_zip = False
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    # Appended candles are stored in chunk files, merged into the main file once there are more
+    _max_ohlcv_chunks = 16
 
     @classmethod
     def ohlcv_get_available_data(
@@ -85,6 +87,11 @@ class JsonDataHandler(IDataHandler):
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        self._ohlcv_dump(filename, data)
+        for chunk in self._ohlcv_chunk_files(filename):
+            chunk.unlink()
+
+    def _ohlcv_dump(self, filename: Path, data: DataFrame) -> None:
         _data = data.copy()
         # Convert date to int
         _data["date"] = _data["date"].view(np.int64) // 1000 // 1000
@@ -94,6 +101,20 @@ class JsonDataHandler(IDataHandler):
             filename, orient="values", compression="gzip" if self._use_zip else None
         )
 
+    @staticmethod
+    def _ohlcv_chunk_files(filename: Path) -> List[Path]:
+        """
+        Chunk files holding candles appended to filename, in the order they were written.
+        Chunks are numbered consecutively from 1 (see ohlcv_append), so they are probed
+        one by one instead of listing the data directory.
+        """
+        chunks: List[Path] = []
+        while True:
+            chunk = filename.with_name(f"{filename.name}.part{len(chunks) + 1:04d}")
+            if not chunk.is_file():
+                return chunks
+            chunks.append(chunk)
+
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: Optional[TimeRange], candle_type: CandleType
     ) -> DataFrame:
@@ -120,6 +141,20 @@ class JsonDataHandler(IDataHandler):
         try:
             pairdata = read_json(filename, orient="values")
             pairdata.columns = self._columns
+            chunks = self._ohlcv_chunk_files(filename)
+            if chunks:
+                compression = "gzip" if self._use_zip else None
+                chunk_data = [
+                    read_json(chunk, orient="values", compression=compression) for chunk in chunks
+                ]
+                for chunk in chunk_data:
+                    chunk.columns = self._columns
+                # Candles of later chunks replace earlier ones
+                pairdata = (
+                    concat([pairdata] + chunk_data, ignore_index=True)
+                    .drop_duplicates(subset="date", keep="last")
+                    .sort_values("date", ignore_index=True)
+                )
         except ValueError:
             logger.error(f"Could not load data for {pair}.")
             return DataFrame(columns=self._columns)
@@ -141,13 +176,45 @@ class JsonDataHandler(IDataHandler):
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Candles are written to a new chunk file next to the pair's data file, instead of
+        rewriting all stored candles. Stored candles with the same date are replaced.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        chunks = self._ohlcv_chunk_files(filename)
+        if len(chunks) >= self._max_ohlcv_chunks:
+            # Merge all chunks into the main file
+            stored = self._ohlcv_load(pair, timeframe, None, candle_type)
+            merged = (
+                concat([stored, data.loc[:, self._columns]], ignore_index=True)
+                .drop_duplicates(subset="date", keep="last")
+                .sort_values("date", ignore_index=True)
+            )
+            self.ohlcv_store(pair, timeframe, merged, candle_type)
+            return
+        self._ohlcv_dump(filename.with_name(f"{filename.name}.part{len(chunks) + 1:04d}"), data)
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair, including appended chunks
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        for chunk in self._ohlcv_chunk_files(filename):
+            chunk.unlink()
+        return super().ohlcv_purge(pair, timeframe, candle_type)
 
     @classmethod
     def trades_get_pairs(cls, datadir: Path) -> List[str]:
@@ -0,0 +1,164 @@
+"""
+Bounded in-memory candle storage backing Exchange._klines
+"""
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+from pandas import DataFrame, DatetimeTZDtype
+from pandas.arrays import DatetimeArray
+
+from coingro.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
+from coingro.data.converter import clean_ohlcv_dataframe
+
+logger = logging.getLogger(__name__)
+
+OHLCV_VALUE_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+_MS_TO_NS = 1_000_000
+
+
+class _CandleBuffer:
+    """
+    Columnar candles of one pair, stored in preallocated arrays of twice the window size.
+    New candles are written behind the window - once the arrays are full, the window is
+    moved to the start of freshly allocated arrays (once per `maxlen` candles), so
+    memory stays bounded and previously returned views are never overwritten.
+    """
+
+    __slots__ = ("maxlen", "dates", "values", "start", "end")
+
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen = maxlen
+        self.dates = np.empty(2 * maxlen, dtype=np.int64)
+        self.values = np.empty((len(OHLCV_VALUE_COLUMNS), 2 * maxlen), dtype=np.float64)
+        self.start = 0
+        self.end = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.values.nbytes
+
+    def _compact(self, keep: int) -> None:
+        dates = np.empty_like(self.dates)
+        values = np.empty_like(self.values)
+        dates[:keep] = self.dates[self.end - keep : self.end]
+        values[:, :keep] = self.values[:, self.end - keep : self.end]
+        self.dates, self.values = dates, values
+        self.start, self.end = 0, keep
+
+    def extend(self, ticks: List) -> None:
+        """
+        Add candles (in ccxt format). Buffered candles from the first new candle onwards
+        (the previously incomplete candle) are replaced.
+        """
+        ticks = ticks[-self.maxlen :]
+        if not ticks:
+            return
+        dates = np.array([t[0] for t in ticks], dtype=np.int64) * _MS_TO_NS
+        self.end = self.start + int(
+            np.searchsorted(self.dates[self.start : self.end], dates[0], side="left")
+        )
+        if self.end + len(ticks) > len(self.dates):
+            self._compact(min(len(self), self.maxlen - len(ticks)))
+        end = self.end + len(ticks)
+        self.dates[self.end : end] = dates
+        self.values[:, self.end : end] = np.array(
+            [t[1:6] for t in ticks], dtype=np.float64
+        ).T
+        self.end = end
+        self.start = max(self.start, self.end - self.maxlen)
+
+    def to_dataframe(self, drop_last: bool) -> DataFrame:
+        """
+        Zero-copy, read-only dataframe view of the buffered candles.
+        """
+        end = self.end - 1 if drop_last and self.end > self.start else self.end
+        dates = self.dates[self.start : end].view("M8[ns]")
+        values = self.values[:, self.start : end]
+        dates.flags.writeable = False
+        values.flags.writeable = False
+        columns = {"date": DatetimeArray(dates, dtype=DatetimeTZDtype(tz="UTC"), copy=False)}
+        columns.update(zip(OHLCV_VALUE_COLUMNS, values))
+        return DataFrame(columns, copy=False)
+
+
+class CandleStore:
+    """
+    Holds the latest candles per (pair, timeframe, candle_type), bounded to a fixed window.
+    Dataframes handed out are read-only views into the store and stay valid after
+    further updates - only a replaced incomplete candle is updated in place.
+    """
+
+    def __init__(self) -> None:
+        self._buffers: Dict[PairWithTimeframe, _CandleBuffer] = {}
+
+    def __contains__(self, key: PairWithTimeframe) -> bool:
+        return key in self._buffers
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory allocated by all candle buffers.
+        """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def candle_count(self, key: PairWithTimeframe) -> int:
+        buffer = self._buffers.get(key)
+        return len(buffer) if buffer is not None else 0
+
+    def last_date(self, key: PairWithTimeframe) -> Optional[int]:
+        """
+        Open time (ms) of the latest buffered candle, or None if there are no candles.
+        """
+        buffer = self._buffers.get(key)
+        if not buffer:
+            return None
+        return int(buffer.dates[buffer.end - 1]) // _MS_TO_NS
+
+    def remove(self, key: PairWithTimeframe) -> None:
+        self._buffers.pop(key, None)
+
+    def update(self, key: PairWithTimeframe, ticks: List, *, maxlen: int, incremental: bool):
+        """
+        Store freshly downloaded candles (in ccxt format).
+        Incremental results are added to the buffered candles, full results replace them.
+        :param maxlen: Amount of candles to keep at most
+        """
+        buffer = self._buffers.get(key)
+        if not incremental or buffer is None or buffer.maxlen != maxlen:
+            buffer = _CandleBuffer(maxlen)
+            self._buffers[key] = buffer
+        buffer.extend(ticks)
+
+    def get_dataframe(
+        self, key: PairWithTimeframe, timeframe: str, *, drop_incomplete: bool
+    ) -> DataFrame:
+        """
+        Buffered candles as dataframe, in the format returned by `ohlcv_to_dataframe`.
+        Gapless candles are returned as read-only view, others are cleaned (and copied).
+        :param drop_incomplete: Drop the last candle, assuming it's incomplete
+        """
+        from coingro.exchange import timeframe_to_msecs
+
+        buffer = self._buffers.get(key, None) or _CandleBuffer(0)
+        dates = buffer.dates[buffer.start : buffer.end]
+        timeframe_ns = timeframe_to_msecs(timeframe) * _MS_TO_NS
+        if len(dates) == 0 or (
+            dates[0] % timeframe_ns == 0 and (np.diff(dates) == timeframe_ns).all()
+        ):
+            if drop_incomplete:
+                logger.debug("Dropping last candle")
+            return buffer.to_dataframe(drop_last=drop_incomplete)
+        return clean_ohlcv_dataframe(
+            buffer.to_dataframe(drop_last=False),
+            timeframe,
+            key[0],
+            fill_missing=True,
+            drop_incomplete=drop_incomplete,
+        )
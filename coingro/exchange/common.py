@@ -5,6 +5,7 @@ from functools import wraps
 from typing import Any, Callable, Optional, TypeVar, cast, overload
 
 from coingro.exceptions import DDosProtection, RetryableOrderError, TemporaryError
+from coingro.metrics import EXCHANGE_CALL_DURATION, registry
 from coingro.mixins import LoggingMixin
 
 logger = logging.getLogger(__name__)
@@ -113,7 +114,8 @@ def retrier_async(f):
         count = kwargs.pop("count", API_RETRY_COUNT)
         kucoin = args[0].name == "KuCoin"  # Check if the exchange is KuCoin.
         try:
-            return await f(*args, **kwargs)
+            with registry.timer(EXCHANGE_CALL_DURATION, method=f.__name__):
+                return await f(*args, **kwargs)
         except TemporaryError as ex:
             msg = f'{f.__name__}() returned exception: "{ex}". '
             if count > 0:
@@ -165,7 +167,8 @@ def retrier(_func: Optional[F] = None, *, retries=API_RETRY_COUNT):
         def wrapper(*args, **kwargs):
             count = kwargs.pop("count", retries)
             try:
-                return f(*args, **kwargs)
+                with registry.timer(EXCHANGE_CALL_DURATION, method=f.__name__):
+                    return f(*args, **kwargs)
             except (TemporaryError, RetryableOrderError) as ex:
                 msg = f'{f.__name__}() returned exception: "{ex}". '
                 if count > 0:
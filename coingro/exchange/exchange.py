@@ -9,8 +9,9 @@ import logging
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import ceil
-from threading import Lock
-from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple, Union
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Any, Callable, Coroutine, Dict, List, Literal, Optional, Tuple, Union
 
 import arrow
 import ccxt
@@ -40,6 +41,7 @@ from coingro.exceptions import (
     RetryableOrderError,
     TemporaryError,
 )
+from coingro.exchange.candle_store import CandleStore
 from coingro.exchange.common import (
     API_FETCH_ORDER_RETRY_COUNT,
     BAD_EXCHANGES,
@@ -49,6 +51,7 @@ from coingro.exchange.common import (
     retrier,
     retrier_async,
 )
+from coingro.exchange.markets_cache import MarketsCache
 from coingro.misc import chunks, deep_merge_dicts, safe_value_fallback2
 from coingro.plugins.pairlist.pairlist_helpers import expand_pairlist
 
@@ -96,6 +99,7 @@ class Exchange:
         "mark_ohlcv_timeframe": "8h",
         "ccxt_futures_name": "swap",
         "needs_trading_fees": False,  # use fetch_trading_fees to cache fees
+        "stoploss_fetch_bulk": True,  # Stoploss orders can be fetched like regular orders
     }
     _cg_has: Dict = {}
     _cg_has_futures: Dict = {}
@@ -118,6 +122,9 @@ class Exchange:
         # Lock event loop. This is necessary to avoid race-conditions when using force* commands
         # Due to funding fee fetching.
         self._loop_lock = Lock()
+        # Markets, trading fees and leverage tiers are replaced by the markets refresh thread
+        # while the bot is trading - new values are built first and swapped in under this lock.
+        self._markets_lock = Lock()
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         self._config: Dict = {}
@@ -128,6 +135,8 @@ class Exchange:
         self._pairs_last_refresh_time: Dict[PairWithTimeframe, int] = {}
         # Timestamp of last markets refresh
         self._last_markets_refresh: int = 0
+        # Refreshes markets loaded from the markets cache
+        self._markets_refresh_thread: Optional[Thread] = None
 
         # Cache for 10 minutes ...
         self._fetch_tickers_cache: TTLCache = TTLCache(maxsize=2, ttl=60 * 10)
@@ -136,9 +145,13 @@ class Exchange:
         # refreshed once every iteration.
         self._exit_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=1800)
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=1800)
+        # Tickers / order books prefetched for the current bot iteration, per side
+        self._rate_snapshot: Dict[str, Dict[str, Dict]] = {"entry": {}, "exit": {}}
 
         # Holds candles
         self._klines: Dict[PairWithTimeframe, DataFrame] = {}
+        # Holds the raw candles backing _klines, bounded to the refresh window
+        self._klines_store = CandleStore()
 
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: Dict[str, Any] = {}
@@ -149,6 +162,7 @@ class Exchange:
         logger.info(f"Using CCXT {ccxt.__version__}")
         exchange_config = config["exchange"]
         self.log_responses = exchange_config.get("log_responses", False)
+        self._ohlcv_incremental_refresh = exchange_config.get("ohlcv_incremental_refresh", True)
 
         # Leverage properties
         self.trading_mode: TradingMode = config.get("trading_mode", TradingMode.SPOT)
@@ -191,6 +205,18 @@ class Exchange:
 
         logger.info(f'Using Exchange "{self.name}"')
 
+        self._markets_cache = MarketsCache(
+            Path(config["user_data_dir"]) / "markets_cache" if "user_data_dir" in config else None,
+            key={
+                "exchange": self.id,
+                "sandbox": exchange_config.get("sandbox", False),
+                "trading_mode": TradingMode(self.trading_mode).value,
+                "stake_currency": config.get("stake_currency"),
+            },
+            ttl=exchange_config.get("markets_cache_ttl", 0) * 60,
+        )
+        markets_from_cache = False
+
         if validate:
             # Check exchange credentials
             self.validate_credentials()
@@ -198,8 +224,10 @@ class Exchange:
             # Check if timeframe is available
             self.validate_timeframes(config.get("timeframe"))
 
-            # Initial markets load
-            self._load_markets()
+            # Initial markets load - from the markets cache if possible
+            markets_from_cache = self._load_markets_cache()
+            if not markets_from_cache:
+                self._load_markets()
 
             # Check if all pairs are available
             self.validate_stakecurrency(config["stake_currency"])
@@ -219,10 +247,18 @@ class Exchange:
             exchange_config.get("markets_refresh_interval", 60) * 60
         )
 
-        if self.trading_mode != TradingMode.SPOT:
+        if self.trading_mode != TradingMode.SPOT and not markets_from_cache:
             self.fill_leverage_tiers()
         self.additional_exchange_init()
 
+        if markets_from_cache:
+            self._markets_refresh_thread = Thread(
+                target=self._refresh_markets_cache, name="markets_refresh", daemon=True
+            )
+            self._markets_refresh_thread.start()
+        elif validate:
+            self._save_markets_cache()
+
     def __del__(self):
         """
         Destructor - clean up async stuff
@@ -237,7 +273,9 @@ class Exchange:
             and self._api_async.session
         ):
             logger.info("Closing async ccxt session.")
-            self.loop.run_until_complete(self._api_async.close())
+            # Wait for a running background markets refresh
+            with self._loop_lock:
+                self.loop.run_until_complete(self._api_async.close())
 
     def _init_ccxt(
         self,
@@ -507,7 +545,8 @@ class Exchange:
     def _load_async_markets(self, reload: bool = False) -> None:
         try:
             if self._api_async:
-                self.loop.run_until_complete(self._api_async.load_markets(reload=reload))
+                with self._loop_lock:
+                    self.loop.run_until_complete(self._api_async.load_markets(reload=reload))
 
         except (asyncio.TimeoutError, ccxt.BaseError) as e:
             logger.warning("Could not load async markets. Reason: %s", e)
@@ -516,15 +555,72 @@ class Exchange:
     def _load_markets(self) -> None:
         """Initialize markets both sync and async"""
         try:
-            self._markets = self._api.load_markets()
+            markets = self._api.load_markets()
             self._load_async_markets()
-            self._last_markets_refresh = arrow.utcnow().int_timestamp
+            with self._markets_lock:
+                self._markets = markets
+                self._last_markets_refresh = arrow.utcnow().int_timestamp
             if self._cg_has["needs_trading_fees"]:
-                self._trading_fees = self.fetch_trading_fees()
+                trading_fees = self.fetch_trading_fees()
+                with self._markets_lock:
+                    self._trading_fees = trading_fees
 
         except ccxt.BaseError:
             logger.exception("Unable to initialize markets.")
 
+    def _load_markets_cache(self) -> bool:
+        """
+        Initialize markets, trading fees and leverage tiers from the markets cache.
+        :return: True if the markets cache was used
+        """
+        data = self._markets_cache.load()
+        if not data:
+            return False
+        self._api.set_markets(data["markets"], data["currencies"])
+        if self._api_async:
+            self._api_async.set_markets(data["markets"], data["currencies"])
+        with self._markets_lock:
+            self._markets = self._api.markets
+            self._trading_fees = data["trading_fees"]
+            self._leverage_tiers = data["leverage_tiers"]
+            self._last_markets_refresh = data["timestamp"]
+        logger.info(f"Loaded {len(self._markets)} markets from the markets cache.")
+        return True
+
+    def _save_markets_cache(self) -> None:
+        with self._markets_lock:
+            markets = self._markets
+            trading_fees = self._trading_fees
+            leverage_tiers = self._leverage_tiers
+        self._markets_cache.save(markets, self._api.currencies or {}, trading_fees, leverage_tiers)
+
+    def _refresh_markets_cache(self) -> None:
+        """
+        Reload markets, trading fees and leverage tiers and update the markets cache.
+        Runs in a background thread after starting from the markets cache.
+        """
+        logger.info("Refreshing markets in the background..")
+        try:
+            self._reload_markets()
+            if self._cg_has["needs_trading_fees"]:
+                trading_fees = self.fetch_trading_fees()
+                with self._markets_lock:
+                    self._trading_fees = trading_fees
+            self._save_markets_cache()
+            logger.info("Markets refreshed.")
+        except Exception:
+            logger.exception("Could not refresh markets.")
+
+    def _reload_markets(self) -> None:
+        markets = self._api.load_markets(reload=True)
+        # Also reload async markets to avoid issues with newly listed pairs
+        self._load_async_markets(reload=True)
+        leverage_tiers = self._parse_leverage_tiers()
+        with self._markets_lock:
+            self._markets = markets
+            self._leverage_tiers = leverage_tiers
+            self._last_markets_refresh = arrow.utcnow().int_timestamp
+
     def reload_markets(self) -> None:
         """Reload markets both sync and async if refresh interval has passed"""
         # Check whether markets have to be reloaded
@@ -533,13 +629,12 @@ class Exchange:
             > arrow.utcnow().int_timestamp
         ):
             return None
+        if self._markets_refresh_thread and self._markets_refresh_thread.is_alive():
+            return None
         logger.debug("Performing scheduled market reload..")
         try:
-            self._markets = self._api.load_markets(reload=True)
-            # Also reload async markets to avoid issues with newly listed pairs
-            self._load_async_markets(reload=True)
-            self._last_markets_refresh = arrow.utcnow().int_timestamp
-            self.fill_leverage_tiers()
+            self._reload_markets()
+            self._save_markets_cache()
         except ccxt.BaseError:
             logger.exception("Could not reload markets.")
 
@@ -1312,6 +1407,51 @@ class Exchange:
             return self.fetch_stoploss_order(order_id, pair)
         return self.fetch_order(order_id, pair)
 
+    def fetch_orders_bulk(
+        self, orders: List[Tuple[str, str]], stoploss_order: bool = False
+    ) -> Dict[str, Dict]:
+        """
+        Fetch multiple orders at once.
+        Pairs with multiple orders use one fetch_open_orders call where supported,
+        all other orders are fetched concurrently.
+        Orders which could not be fetched are not part of the result -
+        use fetch_order_or_stoploss_order() for these.
+        :param orders: List of (order_id, pair) tuples
+        :param stoploss_order: True if the orders are stoploss orders
+        :return: Dict of order_id -> order
+        """
+        if (
+            self._config["dry_run"]
+            or len(orders) < 2
+            or (stoploss_order and not self._cg_has["stoploss_fetch_bulk"])
+        ):
+            # Nothing to gain from fetching these orders in one batch
+            return {}
+
+        order_pairs = dict(orders)
+        result: Dict[str, Dict] = {}
+        if self.exchange_has("fetchOpenOrders"):
+            pair_count: Dict[str, int] = {}
+            for pair in order_pairs.values():
+                pair_count[pair] = pair_count.get(pair, 0) + 1
+            bulk_pairs = [pair for pair, count in pair_count.items() if count > 1]
+            open_orders = self._fetch_async_batch(bulk_pairs, self._api_async.fetch_open_orders)
+            for pair, pair_orders in open_orders.items():
+                self._log_exchange_response("fetch_open_orders", pair_orders)
+                for order in pair_orders:
+                    if order_pairs.get(order["id"]) == pair:
+                        result[order["id"]] = self._order_contracts_to_amount(order)
+
+        # Orders which are no longer open need to be fetched individually
+        remaining = [order_id for order_id in order_pairs if order_id not in result]
+        fetched = self._fetch_async_batch(
+            remaining, lambda order_id: self._api_async.fetch_order(order_id, order_pairs[order_id])
+        )
+        for order_id, order in fetched.items():
+            self._log_exchange_response("fetch_order", order)
+            result[order_id] = self._order_contracts_to_amount(order)
+        return result
+
     def check_order_canceled_empty(self, order: Dict) -> bool:
         """
         Verify if an order has been cancelled without being partially filled
@@ -1468,18 +1608,20 @@ class Exchange:
     @retrier
     def fetch_bids_asks(self, symbols: Optional[List[str]] = None, cached: bool = False) -> Dict:
         """
+        :param symbols: Only fetch bids / asks of these pairs - not cached, like get_tickers()
         :param cached: Allow cached result
         :return: fetch_tickers result
         """
         if not self.exchange_has("fetchBidsAsks"):
             return {}
-        if cached:
+        if cached and symbols is None:
             tickers = self._fetch_tickers_cache.get("fetch_bids_asks")
             if tickers:
                 return tickers
         try:
             tickers = self._api.fetch_bids_asks(symbols)
-            self._fetch_tickers_cache["fetch_bids_asks"] = tickers
+            if symbols is None:
+                self._fetch_tickers_cache["fetch_bids_asks"] = tickers
             return tickers
         except ccxt.NotSupported as e:
             raise OperationalException(
@@ -1498,17 +1640,24 @@ class Exchange:
     @retrier
     def get_tickers(self, symbols: Optional[List[str]] = None, cached: bool = False) -> Dict:
         """
+        :param symbols: Only fetch tickers of these pairs. These are not cached, as the cache
+            holds tickers of all pairs.
         :param cached: Allow cached result
         :return: fetch_tickers result
         """
+        if symbols is not None:
+            return self._fetch_tickers(symbols)
         if cached:
             tickers = self._fetch_tickers_cache.get("fetch_tickers")
             if tickers:
                 return tickers
+        tickers = self._fetch_tickers(None)
+        self._fetch_tickers_cache["fetch_tickers"] = tickers
+        return tickers
+
+    def _fetch_tickers(self, symbols: Optional[List[str]]) -> Dict:
         try:
-            tickers = self._api.fetch_tickers(symbols)
-            self._fetch_tickers_cache["fetch_tickers"] = tickers
-            return tickers
+            return self._api.fetch_tickers(symbols)
         except ccxt.NotSupported as e:
             raise OperationalException(
                 f"Exchange {self._api.name} does not support fetching tickers in batch. "
@@ -1631,10 +1780,11 @@ class Exchange:
 
         price_side_word = price_side.capitalize()
 
+        snapshot = self._rate_snapshot[side].get(pair)
         if conf_strategy.get("use_order_book", False):
 
             order_book_top = conf_strategy.get("order_book_top", 1)
-            order_book = self.fetch_l2_order_book(pair, order_book_top)
+            order_book = snapshot or self.fetch_l2_order_book(pair, order_book_top)
             logger.debug("order_book %s", order_book)
             # top 1 = index 0
             try:
@@ -1651,7 +1801,7 @@ class Exchange:
             )
         else:
             logger.debug(f"Using Last {price_side_word} / Last Price")
-            ticker = self.fetch_ticker(pair)
+            ticker = snapshot if snapshot and snapshot.get(price_side) else self.fetch_ticker(pair)
             ticker_rate = ticker[price_side]
             if ticker["last"] and ticker_rate:
                 if side == "entry" and ticker_rate > ticker["last"]:
@@ -1668,6 +1818,87 @@ class Exchange:
 
         return rate
 
+    def prefetch_rates(self, pairs: List[str], side: EntryExit) -> None:
+        """
+        Fetch the pricing data get_rate() needs for all pairs in one batch -
+        using one fetch_tickers call where supported, or concurrent requests otherwise.
+        get_rate(refresh=True) uses this data until clear_rate_snapshot() is called.
+        Pairs which failed to load are fetched by get_rate() as usual.
+        :param pairs: Pairs to get rates for
+        :param side: "entry" or "exit"
+        """
+        pairs = list(dict.fromkeys(pairs))
+        conf_strategy = self._config.get(
+            "entry_pricing" if side == "entry" else "exit_pricing", {}
+        )
+        snapshot: Dict[str, Dict] = {}
+        if len(pairs) > 1:
+            if conf_strategy.get("use_order_book", False):
+                order_book_top = conf_strategy.get("order_book_top", 1)
+                snapshot = self._fetch_rate_data_async(pairs, order_book_top)
+            elif self.exchange_has("fetchTickers"):
+                try:
+                    tickers = self.get_tickers(symbols=pairs)
+                    snapshot = {pair: tickers[pair] for pair in pairs if pair in tickers}
+                except (TemporaryError, OperationalException) as e:
+                    logger.warning(f"Could not prefetch tickers: {e}")
+            else:
+                snapshot = self._fetch_rate_data_async(pairs)
+        self._rate_snapshot[side] = snapshot
+
+    def clear_rate_snapshot(self) -> None:
+        """
+        Drop the data of prefetch_rates(), so get_rate() fetches current data again.
+        """
+        self._rate_snapshot = {"entry": {}, "exit": {}}
+
+    def _fetch_rate_data_async(
+        self, pairs: List[str], order_book_top: Optional[int] = None
+    ) -> Dict[str, Dict]:
+        """
+        Fetch tickers - or order books if order_book_top is given - for all pairs concurrently.
+        """
+        if order_book_top is None:
+            return self._fetch_async_batch(pairs, self._api_async.fetch_ticker)
+        limit = self.get_next_limit_in_list(
+            order_book_top,
+            self._cg_has["l2_limit_range"],
+            self._cg_has["l2_limit_range_required"],
+        )
+        return self._fetch_async_batch(
+            pairs, lambda pair: self._api_async.fetch_l2_order_book(pair, limit)
+        )
+
+    def _fetch_async_batch(
+        self, keys: List[Any], fetch: Callable[[Any], Coroutine]
+    ) -> Dict[Any, Any]:
+        """
+        Run fetch(key) concurrently for all keys.
+        Failed requests are logged and left out of the result.
+        :return: Dict of key -> result of fetch(key)
+        """
+
+        async def fetch_one(key):
+            return await fetch(key)
+
+        result: Dict[Any, Any] = {}
+        # Chunk requests into batches of 100 to avoid overwelming ccxt Throttling
+        for input_keys in chunks(keys, 100):
+
+            async def gather_stuff():
+                return await asyncio.gather(
+                    *(fetch_one(key) for key in input_keys), return_exceptions=True
+                )
+
+            with self._loop_lock:
+                results = self.loop.run_until_complete(gather_stuff())
+            for key, res in zip(input_keys, results):
+                if isinstance(res, Exception):
+                    logger.warning(f"Async request for {key} failed: {repr(res)}")
+                    continue
+                result[key] = res
+        return result
+
     # Fee handling
 
     @retrier
@@ -1926,7 +2157,7 @@ class Exchange:
                 if isinstance(res, Exception):
                     logger.warning(f"Async code raised an exception: {repr(res)}")
                     if raise_:
-                        raise
+                        raise res
                     continue
                 else:
                     # Deconstruct tuple if it's not an exception
@@ -1938,9 +2169,20 @@ class Exchange:
         return pair, timeframe, candle_type, data
 
     def _build_coroutine(
-        self, pair: str, timeframe: str, candle_type: CandleType, since_ms: Optional[int]
+        self,
+        pair: str,
+        timeframe: str,
+        candle_type: CandleType,
+        since_ms: Optional[int],
+        incremental_since_ms: Optional[int] = None,
     ) -> Coroutine:
 
+        if incremental_since_ms is not None:
+            # Cached candles are still recent - only the tail is required
+            return self._async_get_candle_history(
+                pair, timeframe, since_ms=incremental_since_ms, candle_type=candle_type
+            )
+
         if not since_ms and (
             self._cg_has["ohlcv_require_since"] or self.required_candle_call_count > 1
         ):
@@ -1962,6 +2204,36 @@ class Exchange:
                 pair, timeframe, since_ms=since_ms, candle_type=candle_type
             )
 
+    def _ohlcv_window_size(self, timeframe: str, candle_type: CandleType) -> int:
+        """
+        Amount of candles a full refresh returns for this timeframe.
+        Used to bound the incremental candle buffer, so both refresh modes yield the same window.
+        """
+        return self.ohlcv_candle_limit(timeframe, candle_type) * max(
+            self.required_candle_call_count, 1
+        )
+
+    def _incremental_since_ms(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> Optional[int]:
+        """
+        Timestamp (ms) to refresh the cached candles from, or None if a full refresh is required.
+        Evicts the cached candles if one call can't close the gap to now (e.g. after a time jump).
+        """
+        key = (pair, timeframe, candle_type)
+        last_candle_ms = self._klines_store.last_date(key)
+        if not self._ohlcv_incremental_refresh or last_candle_ms is None:
+            return None
+        candle_limit = self.ohlcv_candle_limit(timeframe, candle_type)
+        min_date = date_minus_candles(timeframe, candle_limit - 5)
+        if last_candle_ms < min_date.timestamp() * 1000:
+            logger.info(
+                f"Time jump detected. Evicting cache for {pair}, {timeframe}, {candle_type}"
+            )
+            self._klines_store.remove(key)
+            return None
+        return last_candle_ms
+
     def refresh_latest_ohlcv(
         self,
         pair_list: ListPairsWithTimeframes,
@@ -1974,6 +2246,8 @@ class Exchange:
         Refresh in-memory OHLCV asynchronously and set `_klines` with the result
         Loops asynchronously over pair_list and downloads all pairs async (semi-parallel).
         Only used in the dataprovider.refresh() method.
+        Pairs which are already cached only download candles since the last cached candle,
+        unless `ohlcv_incremental_refresh` is disabled in the exchange configuration.
         :param pair_list: List of 2 element tuples containing pair, interval to refresh
         :param since_ms: time since when to download, in milliseconds
         :param cache: Assign result to _klines. Usefull for one-off downloads like for pairlists
@@ -1985,6 +2259,7 @@ class Exchange:
         drop_incomplete = self._ohlcv_partial_candle if drop_incomplete is None else drop_incomplete
         input_coroutines = []
         cached_pairs = []
+        incremental_pairs = set()
         # Gather coroutines to run
         for pair, timeframe, candle_type in set(pair_list):
             if timeframe not in self.timeframes and candle_type in (
@@ -2002,9 +2277,18 @@ class Exchange:
                 or not cache
                 or self._now_is_time_to_refresh(pair, timeframe, candle_type)
             ):
+                incremental_since_ms = None
+                if cache and since_ms is None:
+                    incremental_since_ms = self._incremental_since_ms(pair, timeframe, candle_type)
+                if incremental_since_ms is not None:
+                    incremental_pairs.add((pair, timeframe, candle_type))
                 input_coroutines.append(
                     self._build_coroutine(
-                        pair, timeframe, candle_type=candle_type, since_ms=since_ms
+                        pair,
+                        timeframe,
+                        candle_type=candle_type,
+                        since_ms=since_ms,
+                        incremental_since_ms=incremental_since_ms,
                     )
                 )
 
@@ -2030,16 +2314,15 @@ class Exchange:
                     continue
                 # Deconstruct tuple (has 4 elements)
                 pair, timeframe, c_type, ticks = res
-                # keeping last candle time as last refreshed time of the pair
-                if ticks:
-                    self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[-1][0] // 1000
-                # keeping parsed dataframe in cache
-                ohlcv_df = ohlcv_to_dataframe(
-                    ticks, timeframe, pair=pair, fill_missing=True, drop_incomplete=drop_incomplete
+                results_df[(pair, timeframe, c_type)] = self._process_ohlcv_result(
+                    pair,
+                    timeframe,
+                    c_type,
+                    ticks,
+                    cache=cache,
+                    drop_incomplete=drop_incomplete,
+                    incremental=(pair, timeframe, c_type) in incremental_pairs,
                 )
-                results_df[(pair, timeframe, c_type)] = ohlcv_df
-                if cache:
-                    self._klines[(pair, timeframe, c_type)] = ohlcv_df
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
             results_df[(pair, timeframe, c_type)] = self.klines(
@@ -2048,6 +2331,42 @@ class Exchange:
 
         return results_df
 
+    def _process_ohlcv_result(
+        self,
+        pair: str,
+        timeframe: str,
+        c_type: CandleType,
+        ticks: List,
+        *,
+        cache: bool,
+        drop_incomplete: bool,
+        incremental: bool,
+    ) -> DataFrame:
+        """
+        Convert downloaded candles to a dataframe, updating the cache if requested.
+        :param incremental: ticks only contain candles since the last cached candle
+        """
+        # keeping last candle time as last refreshed time of the pair
+        if ticks:
+            self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[-1][0] // 1000
+        if not cache:
+            return ohlcv_to_dataframe(
+                ticks, timeframe, pair=pair, fill_missing=True, drop_incomplete=drop_incomplete
+            )
+        # keeping candles in the bounded store, and a (read-only) dataframe view in cache
+        key = (pair, timeframe, c_type)
+        self._klines_store.update(
+            key,
+            ticks,
+            maxlen=self._ohlcv_window_size(timeframe, c_type),
+            incremental=incremental,
+        )
+        ohlcv_df = self._klines_store.get_dataframe(
+            key, timeframe, drop_incomplete=drop_incomplete
+        )
+        self._klines[key] = ohlcv_df
+        return ohlcv_df
+
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
         interval_in_sec = timeframe_to_seconds(timeframe)
@@ -2382,11 +2701,13 @@ class Exchange:
 
                 coros = [self.get_market_leverage_tiers(symbol) for symbol in sorted(symbols)]
 
-                for input_coro in chunks(coros, 100):
-
-                    results = self.loop.run_until_complete(
-                        asyncio.gather(*input_coro, return_exceptions=True)
-                    )
+                # Release the loop between chunks, so a background refresh does not
+                # block candle refreshes of the running bot for the whole load.
+                for input_coro in chunks(coros, 10):
+                    with self._loop_lock:
+                        results = self.loop.run_until_complete(
+                            asyncio.gather(*input_coro, return_exceptions=True)
+                        )
                     for symbol, res in results:
                         tiers[symbol] = res
 
@@ -2398,17 +2719,23 @@ class Exchange:
         else:
             return {}
 
+    def _parse_leverage_tiers(self) -> Dict[str, List[Dict]]:
+        """
+        Loads the leverage tiers of all pairs and parses them into a new dictionary
+        """
+        return {
+            pair: [self.parse_leverage_tier(tier) for tier in tiers]
+            for pair, tiers in self.load_leverage_tiers().items()
+        }
+
     def fill_leverage_tiers(self) -> None:
         """
         Assigns property _leverage_tiers to a dictionary of information about the leverage
         allowed on each pair
         """
-        leverage_tiers = self.load_leverage_tiers()
-        for pair, tiers in leverage_tiers.items():
-            pair_tiers = []
-            for tier in tiers:
-                pair_tiers.append(self.parse_leverage_tier(tier))
-            self._leverage_tiers[pair] = pair_tiers
+        leverage_tiers = self._parse_leverage_tiers()
+        with self._markets_lock:
+            self._leverage_tiers = leverage_tiers
 
     def parse_leverage_tier(self, tier) -> Dict:
         info = tier.get("info", {})
@@ -2438,14 +2765,14 @@ class Exchange:
                     f"{self.name}.get_max_leverage requires argument stake_amount"
                 )
 
-            if pair not in self._leverage_tiers:
+            # Single lookup, as the markets refresh thread may replace _leverage_tiers
+            pair_tiers = self._leverage_tiers.get(pair)
+            if pair_tiers is None:
                 # Maybe raise exception because it can't be traded on futures?
                 return 1.0
 
-            pair_tiers = self._leverage_tiers[pair]
-
             if stake_amount == 0:
-                return self._leverage_tiers[pair][0]["lev"]  # Max lev for lowest amount
+                return pair_tiers[0]["lev"]  # Max lev for lowest amount
 
             for tier_index in range(len(pair_tiers)):
 
@@ -2860,13 +3187,12 @@ class Exchange:
             or self.exchange_has("fetchMarketLeverageTiers")
         ):
 
-            if pair not in self._leverage_tiers:
+            pair_tiers = self._leverage_tiers.get(pair)
+            if pair_tiers is None:
                 raise InvalidOrderException(
                     f"Maintenance margin rate for {pair} is unavailable for {self.name}"
                 )
 
-            pair_tiers = self._leverage_tiers[pair]
-
             for tier in reversed(pair_tiers):
                 if nominal_value >= tier["min"]:
                     return (tier["mmr"], tier["maintAmt"])
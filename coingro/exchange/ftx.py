@@ -29,6 +29,7 @@ class Ftx(Exchange):
         "ohlcv_volume_currency": "quote",
         "mark_ohlcv_price": "index",
         "mark_ohlcv_timeframe": "1h",
+        "stoploss_fetch_bulk": False,
     }
 
     _supported_trading_mode_margin_pairs: List[Tuple[TradingMode, MarginMode]] = [
@@ -28,6 +28,7 @@ class Gateio(Exchange):
         "order_time_in_force": ["gtc", "ioc"],
         "stoploss_order_types": {"limit": "limit"},
         "stoploss_on_exchange": True,
+        "stoploss_fetch_bulk": False,
     }
 
     _cg_has_futures: Dict = {"needs_trading_fees": True}
@@ -48,11 +48,12 @@ class Kraken(Exchange):
 
         return parent_check and market.get("darkpool", False) is False
 
-    def get_tickers(self, symbols: Optional[List[str]] = None, cached: bool = False) -> Dict:
-        # Only fetch tickers for current stake currency
-        # Otherwise the request for kraken becomes too large.
-        symbols = list(self.get_markets(quote_currencies=[self._config["stake_currency"]]))
-        return super().get_tickers(symbols=symbols, cached=cached)
+    def _fetch_tickers(self, symbols: Optional[List[str]]) -> Dict:
+        if symbols is None:
+            # Only fetch tickers for current stake currency
+            # Otherwise the request for kraken becomes too large.
+            symbols = list(self.get_markets(quote_currencies=[self._config["stake_currency"]]))
+        return super()._fetch_tickers(symbols)
 
     @retrier
     def get_balances(self) -> dict:
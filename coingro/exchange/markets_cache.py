@@ -0,0 +1,106 @@
+"""
+On-disk cache of exchange markets and leverage tiers, used to speed up bot startup
+"""
+import gzip
+import hashlib
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import rapidjson
+
+from coingro.misc import json_load
+
+logger = logging.getLogger(__name__)
+
+# Increase when the structure of the cached data changes - older caches are ignored.
+MARKETS_CACHE_VERSION = 1
+
+
+class MarketsCache:
+    """
+    Markets, currencies, trading fees and parsed leverage tiers of one exchange,
+    stored as a gzipped json file in the user data directory.
+    The cache is only valid for the exchange settings it was created with.
+    """
+
+    def __init__(self, directory: Optional[Path], key: Dict[str, Any], ttl: int) -> None:
+        """
+        :param directory: Directory to store the cache in. None disables the cache.
+        :param key: Exchange settings the cached data depends on
+        :param ttl: Maximum age of the cache in seconds. 0 disables the cache.
+        """
+        self._key = key
+        self._ttl = ttl
+        self._file: Optional[Path] = None
+        if directory and ttl > 0:
+            # Settings which share exchange and trading mode must not overwrite each other
+            key_hash = hashlib.sha256(rapidjson.dumps(key, sort_keys=True).encode()).hexdigest()
+            self._file = (
+                directory / f"{key['exchange']}_{key['trading_mode']}_{key_hash[:12]}.json.gz"
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    @property
+    def file(self) -> Optional[Path]:
+        return self._file
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        :return: Cached data, or None if there is no valid cache
+        """
+        if not self._file or not self._file.is_file():
+            return None
+        try:
+            with gzip.open(self._file) as fp:
+                data = json_load(fp)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read markets cache {self._file}: {e}")
+            return None
+
+        if data.get("version") != MARKETS_CACHE_VERSION or data.get("key") != self._key:
+            logger.info("Markets cache was created with different settings, ignoring it.")
+            return None
+        age = time.time() - data.get("timestamp", 0)
+        if age > self._ttl:
+            logger.info(f"Markets cache is outdated ({int(age // 60)} minutes old), ignoring it.")
+            return None
+        return data
+
+    def save(
+        self,
+        markets: Dict[str, Any],
+        currencies: Dict[str, Any],
+        trading_fees: Dict[str, Any],
+        leverage_tiers: Dict[str, List[Dict]],
+    ) -> None:
+        """
+        Replace the cache with the given data.
+        Failures are logged only, as the cache is not required for the bot to work.
+        """
+        if not self._file or not markets:
+            return
+        data = {
+            "version": MARKETS_CACHE_VERSION,
+            "key": self._key,
+            "timestamp": int(time.time()),
+            "markets": markets,
+            "currencies": currencies,
+            "trading_fees": trading_fees,
+            "leverage_tiers": leverage_tiers,
+        }
+        # Write to a temporary file first, so a running bot never reads a partial cache.
+        tmp_file = self._file.with_name(f"{self._file.name}.tmp")
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_file, "w") as fp:
+                rapidjson.dump(data, fp, number_mode=rapidjson.NM_NATIVE)
+            tmp_file.replace(self._file)
+            logger.debug(f"Markets cache {self._file} updated.")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write markets cache {self._file}: {e}")
+            tmp_file.unlink(missing_ok=True)
@@ -137,8 +137,7 @@ class Okx(Exchange):
         if self.trading_mode == TradingMode.SPOT:
             return float("inf")  # Not actually inf, but this probably won't matter for SPOT
 
-        if pair not in self._leverage_tiers:
+        pair_tiers = self._leverage_tiers.get(pair)
+        if pair_tiers is None:
             return float("inf")
-
-        pair_tiers = self._leverage_tiers[pair]
         return pair_tiers[-1]["max"] / leverage
@@ -0,0 +1,146 @@
+"""
+Rolling latency metrics and gauges of the running bot, exported in the Prometheus text format.
+"""
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+# Observations kept per metric and label set
+METRICS_WINDOW = 1000
+QUANTILES = (0.5, 0.9, 0.99)
+
+PROCESS_DURATION = "coingro_process_seconds"
+PROCESS_PHASE_DURATION = "coingro_process_phase_seconds"
+EXCHANGE_CALL_DURATION = "coingro_exchange_call_seconds"
+DB_QUERY_DURATION = "coingro_db_query_seconds"
+SIGNAL_LATENCY = "coingro_signal_to_order_seconds"
+WORKER_DEADLINE = "coingro_worker_deadline_timestamp_seconds"
+RPC_MESSAGES = "coingro_rpc_messages"
+
+METRICS_HELP = {
+    PROCESS_DURATION: "Duration of a bot iteration.",
+    PROCESS_PHASE_DURATION: "Duration of the phases of a bot iteration.",
+    EXCHANGE_CALL_DURATION: "Duration of exchange requests, per attempt.",
+    DB_QUERY_DURATION: "Duration of database queries.",
+    SIGNAL_LATENCY: "Time between the close of the signal candle and placing the order.",
+    WORKER_DEADLINE: "Time the worker schedules the next run of each phase for.",
+    RPC_MESSAGES: "Messages per rpc module, by state (queued, sent, failed, dropped, coalesced).",
+}
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+class RollingSummary:
+    """
+    Latest observations of a metric, plus count and sum of all observations.
+    """
+
+    __slots__ = ("values", "count", "sum")
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self.values: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.values.append(value)
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Quantile of the observations in the window (nearest rank).
+        """
+        if not self.values:
+            return math.nan
+        values = sorted(self.values)
+        return values[max(math.ceil(q * len(values)) - 1, 0)]
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return "NaN" if math.isnan(value) else repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of rolling summaries and gauges, by metric name and labels.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: Dict[str, Dict[LabelSet, RollingSummary]] = {}
+        self._gauges: Dict[str, Dict[LabelSet, float]] = {}
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._metrics.setdefault(name, {})
+            if key not in series:
+                series[key] = RollingSummary()
+            series[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """
+        Observe the duration of the with-block in seconds - also if it raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        with self._lock:
+            self._gauges.setdefault(name, {})[tuple(sorted(labels.items()))] = value
+
+    def get(self, name: str, **labels: str) -> Optional[RollingSummary]:
+        return self._metrics.get(name, {}).get(tuple(sorted(labels.items())))
+
+    def get_gauge(self, name: str, **labels: str) -> Optional[float]:
+        return self._gauges.get(name, {}).get(tuple(sorted(labels.items())))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics = {}
+            self._gauges = {}
+
+    def render(self) -> str:
+        """
+        :return: All metrics in the Prometheus text exposition format
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(set(self._metrics) | set(self._gauges)):
+                if name in METRICS_HELP:
+                    lines.append(f"# HELP {name} {METRICS_HELP[name]}")
+                if name in self._gauges:
+                    lines.append(f"# TYPE {name} gauge")
+                    for labels, gauge in sorted(self._gauges[name].items()):
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(gauge)}")
+                    continue
+                lines.append(f"# TYPE {name} summary")
+                for labels, summary in sorted(self._metrics[name].items()):
+                    for q in QUANTILES:
+                        quantile_labels = _format_labels(labels + (("quantile", str(q)),))
+                        value = _format_value(summary.quantile(q))
+                        lines.append(f"{name}{quantile_labels} {value}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(summary.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {summary.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+registry = MetricsRegistry()
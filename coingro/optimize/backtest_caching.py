@@ -1,9 +1,10 @@
 import hashlib
 from copy import deepcopy
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Optional, Union
 
 import rapidjson
+from pandas import DataFrame
 
 
 def get_strategy_run_id(strategy) -> str:
@@ -42,3 +43,61 @@ def get_backtest_metadata_filename(filename: Union[Path, str]) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
     return filename.parent / Path(f"{filename.stem}.meta{filename.suffix}")
+
+
+def get_signal_params_hash(strategy) -> str:
+    """
+    Generate a hash of the strategy parameters which influence entry / exit signals
+    (all buy and sell parameters).
+    :param strategy: strategy object.
+    :return: hex string id.
+    """
+    params = {
+        category: {name: par.value for name, par in strategy.enumerate_parameters(category)}
+        for category in ("buy", "sell")
+    }
+    digest = hashlib.sha1()
+    digest.update(
+        rapidjson.dumps(params, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+    )
+    return digest.hexdigest().lower()
+
+
+class SignalCache:
+    """
+    Converted backtest data, reused between backtests on the same preprocessed data
+    (hyperopt epochs).
+    OHLC data is converted once per dataset, while entry / exit signals are only regenerated
+    when the signal parameters (buy / sell spaces) change.
+    Only the most recent set of signals is kept.
+    """
+
+    def __init__(self, data_id: str) -> None:
+        """
+        :param data_id: Identifier of the preprocessed dataset
+        """
+        self.data_id = data_id
+        # Converted backtest data layout ("lists" or "arrays")
+        self.layout: Optional[str] = None
+        # pair -> converted OHLC part of the backtest data
+        self.ohlc: Dict[str, Any] = {}
+        self.signal_key: Optional[str] = None
+        # pair -> analyzed (trimmed, unshifted) dataframe
+        self.analyzed: Dict[str, DataFrame] = {}
+        # pair -> converted backtest data
+        self.data: Dict[str, Any] = {}
+
+    def has_signals(self, signal_key: str, layout: str) -> bool:
+        return self.signal_key == signal_key and self.layout == layout
+
+    def start(self, layout: str) -> None:
+        """
+        Drop cached signals before caching signals for a new set of parameters.
+        `signal_key` must only be set once all pairs have been cached.
+        """
+        if self.layout != layout:
+            self.ohlc = {}
+        self.layout = layout
+        self.signal_key = None
+        self.analyzed = {}
+        self.data = {}
@@ -0,0 +1,237 @@
+"""
+Columnar data layouts used by backtesting.
+
+OHLCV and shifted signal columns are held as contiguous NumPy arrays per pair, aligned to the
+global backtest time index ("steps"), so the columnar engine can jump straight to candles where
+a pair has an entry signal or an open trade.
+Detail data (timeframe_detail) is indexed by main-timeframe candle, so the detail candles
+belonging to one candle are an array slice.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from coingro.exchange import timeframe_to_prev_date, timeframe_to_seconds
+
+# OHLC columns, in the order of backtesting.HEADERS[1:5]
+OHLC_COLUMNS = ["open", "high", "low", "close"]
+# Float columns, in the order of backtesting.HEADERS[1:9]
+FLOAT_COLUMNS = OHLC_COLUMNS + [
+    "enter_long",
+    "exit_long",
+    "enter_short",
+    "exit_short",
+]
+
+
+def rows_to_steps(
+    dates: np.ndarray, first_step_date: datetime, step: timedelta, n_steps: int
+) -> np.ndarray:
+    """
+    Map every row of a pair to the backtest step consuming it.
+    Mirrors the row handling of the loop engine: a row is consumed on the first step whose
+    time is not before the row date, and each step consumes at most one row per pair.
+    :param dates: Row dates as int64 nanosecond timestamps
+    :param first_step_date: Time of the first backtest step
+    :param step: Duration of one step (the strategy timeframe)
+    :param n_steps: Number of steps in the backtest
+    :return: Step index per row. Rows which are never consumed are set to n_steps.
+    """
+    step_ns = int(step.total_seconds() * 1e9)
+    first_ns = int(first_step_date.timestamp() * 1e9)
+    earliest = np.maximum(-(-(dates - first_ns) // step_ns), 0)
+    row_idx = np.arange(len(dates))
+    steps = row_idx + np.maximum.accumulate(earliest - row_idx) if len(dates) else earliest
+    return np.minimum(steps, n_steps)
+
+
+class ColumnarPairData:
+    """
+    Columnar backtest data for one pair.
+    """
+
+    def __init__(
+        self, df: DataFrame, can_short: bool, ohlc: Optional["ColumnarPairData"] = None
+    ) -> None:
+        """
+        :param df: Analyzed dataframe, with entry / exit signals already shifted.
+        :param can_short: Are short entries allowed
+        :param ohlc: Data of the same candles to take dates and OHLC columns from.
+            `df` then only needs to contain the signal columns.
+        """
+        if ohlc is not None:
+            self.dates = ohlc.dates
+            self.values = np.empty((len(ohlc), len(FLOAT_COLUMNS)), dtype=np.float64)
+            self.values[:, :4] = ohlc.values[:, :4]
+            self.values[:, 4:] = df[FLOAT_COLUMNS[4:]].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            self.dates = df["date"]
+            self.values = np.ascontiguousarray(
+                df[FLOAT_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+        self.enter_tags = df["enter_tag"].to_numpy(dtype=object)
+        self.exit_tags = df["exit_tag"].to_numpy(dtype=object)
+
+        enter_long = self.values[:, 4] == 1
+        exit_long = self.values[:, 5] == 1
+        enter_short = can_short & (self.values[:, 6] == 1)
+        exit_short = can_short & (self.values[:, 7] == 1)
+        # Same conditions as Backtesting.check_for_trade_entry()
+        self.entry_signal: np.ndarray = (enter_long & ~(exit_long | enter_short)) | (
+            enter_short & ~(exit_short | enter_long)
+        )
+        self.steps: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def row(self, index: int) -> List:
+        """
+        Build the row (in backtesting.HEADERS layout) used by the shared backtest logic.
+        """
+        return (
+            [self.dates.iat[index]]
+            + self.values[index].tolist()
+            + [self.enter_tags[index], self.exit_tags[index]]
+        )
+
+    def row_index(self, step: int) -> Optional[int]:
+        """
+        Index of the row consumed at the given step - or None if this pair has no row there.
+        """
+        index = int(np.searchsorted(self.steps, step))
+        if index < len(self.steps) and self.steps[index] == step:
+            return index
+        return None
+
+
+class ColumnarBacktestData:
+    """
+    Columnar backtest data for all pairs, aligned to the global backtest time index.
+    Step ``n`` corresponds to the backtest time ``first_step_date + n * step``.
+    """
+
+    def __init__(
+        self,
+        data: Dict[str, ColumnarPairData],
+        first_step_date: datetime,
+        step: timedelta,
+        n_steps: int,
+        track_rows: bool = False,
+    ) -> None:
+        """
+        :param data: Dict of pair -> ColumnarPairData, in processing order
+        :param first_step_date: Time of the first backtest step
+        :param step: Duration of one step (the strategy timeframe)
+        :param n_steps: Number of steps in the backtest
+        :param track_rows: Keep a (steps x pairs) matrix of available rows,
+            required by `rows_between()`.
+        """
+        self.pairs: List[str] = list(data.keys())
+        self.pair_data: List[ColumnarPairData] = list(data.values())
+        self.n_steps = n_steps
+        self.has_row: Optional[np.ndarray] = (
+            np.zeros((n_steps, len(self.pairs)), dtype=bool) if track_rows else None
+        )
+
+        signal_steps = []
+        signal_pairs = []
+        for pair_idx, pair_data in enumerate(self.pair_data):
+            dates = pair_data.dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            steps = rows_to_steps(dates, first_step_date, step, n_steps)
+            pair_data.steps = steps
+            valid = steps < n_steps
+            if self.has_row is not None:
+                self.has_row[steps[valid], pair_idx] = True
+            sig_steps = steps[valid & pair_data.entry_signal]
+            signal_steps.append(sig_steps)
+            signal_pairs.append(np.full(len(sig_steps), pair_idx, dtype=np.int64))
+
+        all_steps = np.concatenate(signal_steps) if signal_steps else np.empty(0, dtype=np.int64)
+        all_pairs = np.concatenate(signal_pairs) if signal_pairs else np.empty(0, dtype=np.int64)
+        order = np.lexsort((all_pairs, all_steps))
+        all_steps = all_steps[order]
+        self._signal_pairs = all_pairs[order]
+        self._signal_steps, self._signal_offsets = np.unique(all_steps, return_index=True)
+        self._signal_offsets = np.append(self._signal_offsets, len(all_steps))
+
+    def next_signal_step(self, step: int) -> Optional[int]:
+        """
+        First step (>= step) where any pair has an entry signal.
+        """
+        index = int(np.searchsorted(self._signal_steps, step))
+        if index < len(self._signal_steps):
+            return int(self._signal_steps[index])
+        return None
+
+    def signal_pairs(self, step: int) -> List[int]:
+        """
+        Indexes of the pairs with an entry signal at this step, in processing order.
+        """
+        index = int(np.searchsorted(self._signal_steps, step))
+        if index < len(self._signal_steps) and self._signal_steps[index] == step:
+            start, end = self._signal_offsets[index], self._signal_offsets[index + 1]
+            return self._signal_pairs[start:end].tolist()
+        return []
+
+    def rows_between(self, step: int, start: int, end: int) -> int:
+        """
+        Number of pairs with index in [start, end) which have a row at this step.
+        """
+        if self.has_row is None or start >= end:
+            return 0
+        return int(self.has_row[step, start:end].sum())
+
+
+class DetailCandles:
+    """
+    Detail (timeframe_detail) candles of one pair, indexed by main-timeframe candle.
+    Slice offsets are precomputed for every main candle, so looking up the detail candles of
+    a candle is O(1) and does not allocate a DataFrame.
+    """
+
+    def __init__(self, df: DataFrame, timeframe_main: str) -> None:
+        """
+        :param df: Detail OHLCV dataframe
+        :param timeframe_main: Strategy timeframe
+        """
+        # Keep the source frame to detect replaced detail data
+        self.source = df
+        if not df["date"].is_monotonic_increasing:
+            df = df.sort_values("date")
+        self.dates = df["date"]
+        self.dates_ns: np.ndarray = self.dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        self.values = np.ascontiguousarray(
+            df[OHLC_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+        self.step_ns = timeframe_to_seconds(timeframe_main) * 10**9
+
+        if len(self.dates_ns):
+            first_candle = timeframe_to_prev_date(timeframe_main, self.dates.iat[0])
+            self.first_ns = int(first_candle.timestamp()) * 10**9
+            n_candles = (int(self.dates_ns[-1]) - self.first_ns) // self.step_ns + 1
+        else:
+            self.first_ns = 0
+            n_candles = 0
+        candle_starts = self.first_ns + np.arange(n_candles + 1, dtype=np.int64) * self.step_ns
+        self.offsets: np.ndarray = np.searchsorted(self.dates_ns, candle_starts)
+
+    def candle_slice(self, candle_date: datetime) -> Tuple[int, int]:
+        """
+        Get the [start, end) offsets of the detail candles for the main candle at candle_date.
+        """
+        candle_ns = int(candle_date.timestamp()) * 10**9
+        candle_idx, remainder = divmod(candle_ns - self.first_ns, self.step_ns)
+        if remainder == 0 and 0 <= candle_idx < len(self.offsets) - 1:
+            return int(self.offsets[candle_idx]), int(self.offsets[candle_idx + 1])
+        # Candle not aligned to the precomputed grid (e.g. weekly / monthly candles)
+        start, end = np.searchsorted(self.dates_ns, [candle_ns, candle_ns + self.step_ns])
+        return int(start), int(end)
+
+    def row(self, index: int, signals: List) -> List:
+        """
+        Build a detail row (in backtesting.HEADERS layout), using signals from the main candle.
+        """
+        return [self.dates.iat[index]] + self.values[index].tolist() + signals
@@ -7,7 +7,7 @@ import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 from numpy import nan
@@ -24,7 +24,16 @@ from coingro.enums import BacktestState, CandleType, ExitCheckTuple, ExitType, R
 from coingro.exceptions import DependencyException, OperationalException
 from coingro.exchange import timeframe_to_minutes, timeframe_to_seconds
 from coingro.mixins import LoggingMixin
-from coingro.optimize.backtest_caching import get_strategy_run_id
+from coingro.optimize.backtest_caching import (
+    SignalCache,
+    get_signal_params_hash,
+    get_strategy_run_id,
+)
+from coingro.optimize.backtest_columnar import (
+    ColumnarBacktestData,
+    ColumnarPairData,
+    DetailCandles,
+)
 from coingro.optimize.bt_progress import BTProgress
 from coingro.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -32,7 +41,7 @@ from coingro.optimize.optimize_reports import (
     store_backtest_signal_candles,
     store_backtest_stats,
 )
-from coingro.persistence import LocalTrade, Order, PairLocks, Trade
+from coingro.persistence import LocalOrder, LocalTrade, Order, PairLocks, Trade
 from coingro.plugins.pairlistmanager import PairListManager
 from coingro.plugins.protectionmanager import ProtectionManager
 from coingro.resolvers import ExchangeResolver, StrategyResolver
@@ -94,6 +103,11 @@ class Backtesting:
         self.strategylist: List[IStrategy] = []
         self.all_results: Dict[str, Dict] = {}
         self.processed_dfs: Dict[str, Dict] = {}
+        # Identifier of the preprocessed dataset - enables the signal cache (used by hyperopt)
+        self.signal_cache_id: Optional[str] = None
+        # Converted signals of the current hyperopt run. Each hyperopt worker holds its own copy
+        # of this instance, reusing the cache for all epochs it runs.
+        self._signal_cache: Optional[SignalCache] = None
 
         self._exchange_name = self.config["exchange"]["name"]
         self.exchange = ExchangeResolver.load_exchange(self._exchange_name, self.config)
@@ -181,6 +195,7 @@ class Backtesting:
         else:
             self.timeframe_detail_min = 0
         self.detail_data: Dict[str, DataFrame] = {}
+        self.detail_candles: Dict[str, DetailCandles] = {}
         self.futures_data: Dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -264,8 +279,12 @@ class Backtesting:
                 data_format=self.config.get("dataformat_ohlcv", "json"),
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
             )
+            self.detail_candles = {
+                pair: DetailCandles(df, self.timeframe) for pair, df in self.detail_data.items()
+            }
         else:
             self.detail_data = {}
+            self.detail_candles = {}
         if self.trading_mode == TradingMode.FUTURES:
             # Load additional futures data.
             funding_rates_dict = history.load_data(
@@ -339,6 +358,61 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
+    def _analyze_pair(self, processed: Dict[str, DataFrame], pair: str) -> DataFrame:
+        """
+        Populate entry / exit signals for one pair and trim the startup period.
+        Updates `processed` and the dataprovider cache with the analyzed dataframe.
+        :return: analyzed dataframe, signals not shifted.
+        """
+        pair_data = processed[pair]
+        if not pair_data.empty:
+            # Cleanup from prior runs
+            pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
+
+        df_analyzed = self.strategy.advise_exit(
+            self.strategy.advise_entry(pair_data, {"pair": pair}), {"pair": pair}
+        ).copy()
+        # Trim startup period from analyzed dataframe
+        df_analyzed = processed[pair] = trim_dataframe(
+            df_analyzed, self.timerange, startup_candles=self.required_startup
+        )
+        # Update dataprovider cache
+        self.dataprovider._set_cached_df(
+            pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+        )
+        return df_analyzed
+
+    @staticmethod
+    def _shift_signals(df_analyzed: DataFrame) -> DataFrame:
+        """
+        Shift entry / exit signal columns (HEADERS[5:]) by one candle, in place.
+        Missing signal columns are added.
+        :return: dataframe with shifted signals, first row removed.
+        """
+        # To avoid using data from future, we use entry/exit signals shifted
+        # from the previous candle
+        for col in HEADERS[5:]:
+            tag_col = col in ("enter_tag", "exit_tag")
+            if col in df_analyzed.columns:
+                df_analyzed.loc[:, col] = (
+                    df_analyzed.loc[:, col].replace([nan], [0 if not tag_col else None]).shift(1)
+                )
+            elif not df_analyzed.empty:
+                df_analyzed.loc[:, col] = 0 if not tag_col else None
+
+        return df_analyzed.drop(df_analyzed.head(1).index)
+
+    def _get_analyzed_signals(self, processed: Dict[str, DataFrame], pair: str) -> DataFrame:
+        """
+        Populate entry / exit signals for one pair and shift them by one candle.
+        Updates `processed` with the trimmed, analyzed dataframe.
+        :return: analyzed dataframe with shifted signals, first row removed.
+        """
+        df_analyzed = self._analyze_pair(processed, pair)
+        # Create a copy of the dataframe before shifting, that way the entry signal/tag
+        # remains on the correct candle for callbacks.
+        return self._shift_signals(df_analyzed.copy())
+
     def _get_ohlcv_as_lists(self, processed: Dict[str, DataFrame]) -> Dict[str, Tuple]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
@@ -348,56 +422,137 @@ class Backtesting:
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
         """
+        if self.signal_cache_id:
+            return self._get_cached_signals(processed, "lists")
 
         data: Dict = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
         for pair in processed.keys():
-            pair_data = processed[pair]
             self.check_abort()
             self.progress.increment()
-
-            if not pair_data.empty:
-                # Cleanup from prior runs
-                pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
-
-            df_analyzed = self.strategy.advise_exit(
-                self.strategy.advise_entry(pair_data, {"pair": pair}), {"pair": pair}
-            ).copy()
-            # Trim startup period from analyzed dataframe
-            df_analyzed = processed[pair] = pair_data = trim_dataframe(
-                df_analyzed, self.timerange, startup_candles=self.required_startup
-            )
-            # Update dataprovider cache
-            self.dataprovider._set_cached_df(
-                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
-            )
-
-            # Create a copy of the dataframe before shifting, that way the entry signal/tag
-            # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
-
-            # To avoid using data from future, we use entry/exit signals shifted
-            # from the previous candle
-            for col in HEADERS[5:]:
-                tag_col = col in ("enter_tag", "exit_tag")
-                if col in df_analyzed.columns:
-                    df_analyzed.loc[:, col] = (
-                        df_analyzed.loc[:, col]
-                        .replace([nan], [0 if not tag_col else None])
-                        .shift(1)
-                    )
-                elif not df_analyzed.empty:
-                    df_analyzed.loc[:, col] = 0 if not tag_col else None
-
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            df_analyzed = self._get_analyzed_signals(processed, pair)
 
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_ohlcv_as_arrays(self, processed: Dict[str, DataFrame]) -> Dict[str, ColumnarPairData]:
+        """
+        Columnar counterpart of _get_ohlcv_as_lists(), used by the columnar backtest engine.
+        Pairs without data are skipped.
+        """
+        if self.signal_cache_id:
+            return self._get_cached_signals(processed, "arrays")
+
+        data: Dict[str, ColumnarPairData] = {}
+        self.progress.init_step(BacktestState.CONVERT, len(processed))
+
+        for pair in processed.keys():
+            self.check_abort()
+            self.progress.increment()
+            df_analyzed = self._get_analyzed_signals(processed, pair)
+            if not df_analyzed.empty:
+                data[pair] = ColumnarPairData(df_analyzed, self._can_short)
+        return data
+
+    def _get_signal_cache(self) -> SignalCache:
+        cache = self._signal_cache
+        if cache is None or cache.data_id != self.signal_cache_id:
+            cache = self._signal_cache = SignalCache(str(self.signal_cache_id))
+        return cache
+
+    def clear_signal_cache(self) -> None:
+        """
+        Release the converted signals, once the hyperopt run is finished.
+        """
+        self.signal_cache_id = None
+        self._signal_cache = None
+
+    def _signal_cache_layout(self) -> str:
+        engine = self.config.get("backtest_engine", constants.BACKTEST_ENGINE_DEFAULT)
+        return "arrays" if engine == "columnar" else "lists"
+
+    def get_cached_processed(self) -> Optional[Dict[str, DataFrame]]:
+        """
+        Get the analyzed dataframes from the signal cache, if signals for the current
+        strategy parameters are cached. Allows hyperopt to skip loading preprocessed data.
+        """
+        if not self.signal_cache_id:
+            return None
+        cache = self._get_signal_cache()
+        if cache.has_signals(get_signal_params_hash(self.strategy), self._signal_cache_layout()):
+            return dict(cache.analyzed)
+        return None
+
+    def _get_cached_signals(self, processed: Dict[str, DataFrame], layout: str) -> Dict:
+        """
+        Cached variant of _get_ohlcv_as_lists() / _get_ohlcv_as_arrays(), used by hyperopt.
+        Signals are only regenerated when buy / sell parameters changed since the last call.
+        In that case only the shifted signal columns are converted - OHLC data is reused.
+        :param layout: "lists" or "arrays"
+        """
+        cache = self._get_signal_cache()
+        signal_key = get_signal_params_hash(self.strategy)
+        self.progress.init_step(BacktestState.CONVERT, len(processed))
+
+        if cache.has_signals(signal_key, layout):
+            for pair, df_analyzed in cache.analyzed.items():
+                processed[pair] = df_analyzed
+                self.dataprovider._set_cached_df(
+                    pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+                )
+            self.progress.set_new_value(len(processed))
+            return {pair: data for pair, data in cache.data.items() if data is not None}
+
+        cache.start(layout)
+        for pair in processed.keys():
+            self.check_abort()
+            self.progress.increment()
+            df_analyzed = cache.analyzed[pair] = self._analyze_pair(processed, pair)
+            signal_columns = ["date"] + [col for col in HEADERS[5:] if col in df_analyzed]
+            signals = self._shift_signals(df_analyzed[signal_columns].copy())
+            cache.data[pair] = self._convert_cached_signals(cache, pair, df_analyzed, signals)
+        cache.signal_key = signal_key
+        return {pair: data for pair, data in cache.data.items() if data is not None}
+
+    def _convert_cached_signals(
+        self, cache: SignalCache, pair: str, df_analyzed: DataFrame, signals: DataFrame
+    ) -> Any:
+        """
+        Combine cached OHLC data of one pair with freshly shifted signals.
+        OHLC data is (re)converted if it's missing or doesn't cover the same candles.
+        :return: List of rows, ColumnarPairData - or None for pairs without data
+            in "arrays" layout.
+        """
+        dates = signals["date"]
+        ohlc = cache.ohlc.get(pair)
+        if cache.layout == "arrays":
+            if signals.empty:
+                return None
+            if ohlc is None or not dates.equals(ohlc.dates):
+                ohlc = cache.ohlc[pair] = ColumnarPairData(
+                    self._shift_signals(df_analyzed.copy()), self._can_short
+                )
+                return ohlc
+            return ColumnarPairData(signals, self._can_short, ohlc=ohlc)
+
+        if signals.empty:
+            return []
+        if (
+            ohlc is None
+            or len(ohlc) != len(dates)
+            or ohlc[0][0] != dates.iat[0]
+            or ohlc[-1][0] != dates.iat[-1]
+        ):
+            ohlc = cache.ohlc[pair] = df_analyzed[HEADERS[:5]].iloc[1:].values.tolist()
+        return [
+            ohlc_row + signal_row
+            for ohlc_row, signal_row in zip(ohlc, signals[HEADERS[5:]].values.tolist())
+        ]
+
     def _get_close_rate(
         self, row: Tuple, trade: LocalTrade, exit: ExitCheckTuple, trade_dur: int
     ) -> float:
@@ -652,7 +807,7 @@ class Backtesting:
             trade.exit_reason = exit_reason
 
             self.order_id_counter += 1
-            order = Order(
+            order = LocalOrder(
                 id=self.order_id_counter,
                 cg_trade_id=trade.id,
                 order_date=exit_candle_time,
@@ -672,7 +827,7 @@ class Backtesting:
                 remaining=trade.amount,
                 cost=trade.amount * close_rate,
             )
-            trade.orders.append(order)
+            trade.orders.append(order)  # type: ignore[arg-type]
             return trade
 
         return None
@@ -690,23 +845,15 @@ class Backtesting:
             )
 
         if self.timeframe_detail and trade.pair in self.detail_data:
-            exit_candle_end = exit_candle_time + timedelta(minutes=self.timeframe_min)
-
-            detail_data = self.detail_data[trade.pair]
-            detail_data = detail_data.loc[
-                (detail_data["date"] >= exit_candle_time) & (detail_data["date"] < exit_candle_end)
-            ].copy()
-            if len(detail_data) == 0:
+            detail = self._get_detail_candles(trade.pair)
+            start, end = detail.candle_slice(exit_candle_time)
+            if start == end:
                 # Fall back to "regular" data if no detail data was found for this candle
                 return self._get_exit_trade_entry_for_candle(trade, row)
-            detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-            detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-            detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-            detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-            detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-            detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-            for det_row in detail_data[HEADERS].values.tolist():
-                res = self._get_exit_trade_entry_for_candle(trade, det_row)
+            # Detail candles use the signals of the main candle
+            signals = list(row[LONG_IDX : EXIT_TAG_IDX + 1])
+            for det_idx in range(start, end):
+                res = self._get_exit_trade_entry_for_candle(trade, detail.row(det_idx, signals))
                 if res:
                     return res
 
@@ -715,6 +862,18 @@ class Backtesting:
         else:
             return self._get_exit_trade_entry_for_candle(trade, row)
 
+    def _get_detail_candles(self, pair: str) -> DetailCandles:
+        """
+        Get the indexed detail candles for this pair - (re)building the index if detail_data
+        was replaced since it was built.
+        """
+        detail = self.detail_candles.get(pair)
+        if detail is None or detail.source is not self.detail_data[pair]:
+            detail = self.detail_candles[pair] = DetailCandles(
+                self.detail_data[pair], self.timeframe
+            )
+        return detail
+
     def get_valid_price_and_stake(
         self,
         pair: str,
@@ -889,6 +1048,7 @@ class Backtesting:
                     leverage=leverage,
                     # interest_rate=interest_rate,
                     orders=[],
+                    use_float_math=True,
                 )
 
             trade.adjust_stop_loss(trade.open_rate, self.strategy.stoploss, initial=True)
@@ -903,7 +1063,7 @@ class Backtesting:
                 )
             )
 
-            order = Order(
+            order = LocalOrder(
                 id=self.order_id_counter,
                 cg_trade_id=trade.id,
                 cg_is_open=True,
@@ -924,7 +1084,7 @@ class Backtesting:
                 remaining=amount,
                 cost=stake_amount + trade.fee_open,
             )
-            trade.orders.append(order)
+            trade.orders.append(order)  # type: ignore[arg-type]
             if pos_adjust and self._get_order_filled(order.price, row):
                 order.close_bt_order(current_time, trade)
             else:
@@ -1101,6 +1261,87 @@ class Backtesting:
             return None
         return row
 
+    def backtest_loop(
+        self,
+        row: Tuple,
+        pair: str,
+        current_time: datetime,
+        end_date: datetime,
+        open_trades: Dict[str, List[LocalTrade]],
+        trades: List[LocalTrade],
+        open_trade_count: int,
+        open_trade_count_start: int,
+        max_open_trades: int,
+        position_stacking: bool,
+        enable_protections: bool,
+    ) -> Tuple[int, int]:
+        """
+        Process one candle of one pair - shared by all backtest engines.
+        Closed trades are appended to `trades`.
+        :return: Tuple of the updated (open_trade_count, open_trade_count_start)
+        """
+        for t in list(open_trades[pair]):
+            # 1. Manage currently open orders of active trades
+            if self.manage_open_orders(t, current_time, row):
+                # Close trade
+                open_trade_count -= 1
+                open_trades[pair].remove(t)
+                LocalTrade.trades_open.remove(t)
+                self.wallets.update()
+
+        # 2. Process entries.
+        # without positionstacking, we can only have one open trade per pair.
+        # max_open_trades must be respected
+        # don't open on the last row
+        trade_dir = self.check_for_trade_entry(row)
+        if (
+            (position_stacking or len(open_trades[pair]) == 0)
+            and self.trade_slot_available(max_open_trades, open_trade_count_start)
+            and current_time != end_date
+            and trade_dir is not None
+            and not PairLocks.is_pair_locked(pair, row[DATE_IDX], trade_dir)
+        ):
+            trade = self._enter_trade(pair, row, trade_dir)
+            if trade:
+                # TODO: hacky workaround to avoid opening > max_open_trades
+                # This emulates previous behavior - not sure if this is correct
+                # Prevents entering if the trade-slot was freed in this candle
+                open_trade_count_start += 1
+                open_trade_count += 1
+                # logger.debug(f"{pair} - Emulate creation of new trade: {trade}.")
+                open_trades[pair].append(trade)
+                LocalTrade.add_bt_trade(trade)
+                self.wallets.update()
+
+        for trade in list(open_trades[pair]):
+            # 3. Process entry orders.
+            order = trade.select_order(trade.entry_side, is_open=True)
+            if order and self._get_order_filled(order.price, row):
+                order.close_bt_order(current_time, trade)
+                trade.open_order_id = None
+                self.wallets.update()
+
+            # 4. Create exit orders (if any)
+            if not trade.open_order_id:
+                self._get_exit_trade_entry(trade, row)  # Place exit order if necessary
+
+            # 5. Process exit orders.
+            order = trade.select_order(trade.exit_side, is_open=True)
+            if order and self._get_order_filled(order.price, row):
+                order.close_bt_order(current_time, trade)
+                trade.open_order_id = None
+                trade.close_date = current_time
+                trade.close(order.price, show_msg=False)
+
+                # logger.debug(f"{pair} - Backtesting exit {trade}")
+                open_trade_count -= 1
+                open_trades[pair].remove(trade)
+                LocalTrade.close_bt_trade(trade)
+                trades.append(trade)
+                self.wallets.update()
+                self.run_protections(enable_protections, pair, current_time, trade.trade_direction)
+        return open_trade_count, open_trade_count_start
+
     def backtest(
         self,
         processed: Dict,
@@ -1126,10 +1367,58 @@ class Backtesting:
         :param enable_protections: Should protections be enabled?
         :return: DataFrame with trades (results of backtesting)
         """
-        trades: List[LocalTrade] = []
         self.prepare_backtest(enable_protections)
         # Ensure wallets are uptodate (important for --strategy-list)
         self.wallets.update()
+
+        if self.config.get("backtest_engine", constants.BACKTEST_ENGINE_DEFAULT) == "columnar":
+            trades = self._backtest_columnar(
+                processed,
+                start_date,
+                end_date,
+                max_open_trades,
+                position_stacking,
+                enable_protections,
+            )
+        else:
+            trades = self._backtest_rows(
+                processed,
+                start_date,
+                end_date,
+                max_open_trades,
+                position_stacking,
+                enable_protections,
+            )
+        self.wallets.update()
+
+        results = trade_list_to_dataframe(trades)
+        return {
+            "results": results,
+            "config": self.strategy.config,
+            "locks": PairLocks.get_all_locks(),
+            "rejected_signals": self.rejected_trades,
+            "timedout_entry_orders": self.timedout_entry_orders,
+            "timedout_exit_orders": self.timedout_exit_orders,
+            "canceled_trade_entries": self.canceled_trade_entries,
+            "canceled_entry_orders": self.canceled_entry_orders,
+            "replaced_entry_orders": self.replaced_entry_orders,
+            "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
+        }
+
+    def _backtest_rows(
+        self,
+        processed: Dict,
+        start_date: datetime,
+        end_date: datetime,
+        max_open_trades: int,
+        position_stacking: bool,
+        enable_protections: bool,
+    ) -> List[LocalTrade]:
+        """
+        Default backtest engine - walks every candle of every pair.
+        :return: List of trades, including trades left open at the end
+        """
+        trades: List[LocalTrade] = []
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
         data: Dict = self._get_ohlcv_as_lists(processed)
@@ -1160,89 +1449,112 @@ class Backtesting:
                 indexes[pair] = row_index
                 self.dataprovider._set_dataframe_max_index(row_index)
 
-                for t in list(open_trades[pair]):
-                    # 1. Manage currently open orders of active trades
-                    if self.manage_open_orders(t, current_time, row):
-                        # Close trade
-                        open_trade_count -= 1
-                        open_trades[pair].remove(t)
-                        LocalTrade.trades_open.remove(t)
-                        self.wallets.update()
-
-                # 2. Process entries.
-                # without positionstacking, we can only have one open trade per pair.
-                # max_open_trades must be respected
-                # don't open on the last row
-                trade_dir = self.check_for_trade_entry(row)
-                if (
-                    (position_stacking or len(open_trades[pair]) == 0)
-                    and self.trade_slot_available(max_open_trades, open_trade_count_start)
-                    and current_time != end_date
-                    and trade_dir is not None
-                    and not PairLocks.is_pair_locked(pair, row[DATE_IDX], trade_dir)
-                ):
-                    trade = self._enter_trade(pair, row, trade_dir)
-                    if trade:
-                        # TODO: hacky workaround to avoid opening > max_open_trades
-                        # This emulates previous behavior - not sure if this is correct
-                        # Prevents entering if the trade-slot was freed in this candle
-                        open_trade_count_start += 1
-                        open_trade_count += 1
-                        # logger.debug(f"{pair} - Emulate creation of new trade: {trade}.")
-                        open_trades[pair].append(trade)
-                        LocalTrade.add_bt_trade(trade)
-                        self.wallets.update()
-
-                for trade in list(open_trades[pair]):
-                    # 3. Process entry orders.
-                    order = trade.select_order(trade.entry_side, is_open=True)
-                    if order and self._get_order_filled(order.price, row):
-                        order.close_bt_order(current_time, trade)
-                        trade.open_order_id = None
-                        self.wallets.update()
-
-                    # 4. Create exit orders (if any)
-                    if not trade.open_order_id:
-                        self._get_exit_trade_entry(trade, row)  # Place exit order if necessary
-
-                    # 5. Process exit orders.
-                    order = trade.select_order(trade.exit_side, is_open=True)
-                    if order and self._get_order_filled(order.price, row):
-                        order.close_bt_order(current_time, trade)
-                        trade.open_order_id = None
-                        trade.close_date = current_time
-                        trade.close(order.price, show_msg=False)
-
-                        # logger.debug(f"{pair} - Backtesting exit {trade}")
-                        open_trade_count -= 1
-                        open_trades[pair].remove(trade)
-                        LocalTrade.close_bt_trade(trade)
-                        trades.append(trade)
-                        self.wallets.update()
-                        self.run_protections(
-                            enable_protections, pair, current_time, trade.trade_direction
-                        )
+                open_trade_count, open_trade_count_start = self.backtest_loop(
+                    row,
+                    pair,
+                    current_time,
+                    end_date,
+                    open_trades,
+                    trades,
+                    open_trade_count,
+                    open_trade_count_start,
+                    max_open_trades,
+                    position_stacking,
+                    enable_protections,
+                )
 
             # Move time one configured time_interval ahead.
             self.progress.increment()
             current_time += timedelta(minutes=self.timeframe_min)
 
         trades += self.handle_left_open(open_trades, data=data)
-        self.wallets.update()
+        return trades
 
-        results = trade_list_to_dataframe(trades)
-        return {
-            "results": results,
-            "config": self.strategy.config,
-            "locks": PairLocks.get_all_locks(),
-            "rejected_signals": self.rejected_trades,
-            "timedout_entry_orders": self.timedout_entry_orders,
-            "timedout_exit_orders": self.timedout_exit_orders,
-            "canceled_trade_entries": self.canceled_trade_entries,
-            "canceled_entry_orders": self.canceled_entry_orders,
-            "replaced_entry_orders": self.replaced_entry_orders,
-            "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
+    def _backtest_columnar(
+        self,
+        processed: Dict,
+        start_date: datetime,
+        end_date: datetime,
+        max_open_trades: int,
+        position_stacking: bool,
+        enable_protections: bool,
+    ) -> List[LocalTrade]:
+        """
+        Columnar backtest engine - produces the same results as _backtest_rows().
+        Data is kept in NumPy arrays aligned to a global time index, and only candles where
+        a pair has an entry signal or an open trade are visited.
+        :return: List of trades, including trades left open at the end
+        """
+        trades: List[LocalTrade] = []
+        timeframe_td = timedelta(minutes=self.timeframe_min)
+        n_steps = int((end_date - start_date) / timeframe_td)
+        data = ColumnarBacktestData(
+            self._get_ohlcv_as_arrays(processed),
+            start_date + timeframe_td,
+            timeframe_td,
+            n_steps,
+            # Idle pairs count as rejected signals while all trade slots are taken
+            track_rows=max_open_trades > 0,
+        )
+
+        open_trades: Dict[str, List[LocalTrade]] = defaultdict(list)
+        open_trade_count = 0
+        # Indexes of pairs with open trades - these are visited on every candle
+        open_pairs: Set[int] = set()
+
+        self.progress.init_step(BacktestState.BACKTEST, n_steps)
+
+        step = data.next_signal_step(0)
+        while step is not None and step < n_steps:
+            self.check_abort()
+            self.progress.set_new_value(step)
+            current_time = start_date + timeframe_td * (step + 1)
+            open_trade_count_start = open_trade_count
+
+            next_idle = 0
+            for pair_idx in sorted(open_pairs.union(data.signal_pairs(step))):
+                if 0 < max_open_trades <= open_trade_count_start:
+                    self.rejected_trades += data.rows_between(step, next_idle, pair_idx)
+                next_idle = pair_idx + 1
+
+                pair_data = data.pair_data[pair_idx]
+                row_index = pair_data.row_index(step)
+                if row_index is None:
+                    continue
+                self.dataprovider._set_dataframe_max_index(row_index + 1)
+
+                pair = data.pairs[pair_idx]
+                open_trade_count, open_trade_count_start = self.backtest_loop(
+                    pair_data.row(row_index),
+                    pair,
+                    current_time,
+                    end_date,
+                    open_trades,
+                    trades,
+                    open_trade_count,
+                    open_trade_count_start,
+                    max_open_trades,
+                    position_stacking,
+                    enable_protections,
+                )
+                if open_trades[pair]:
+                    open_pairs.add(pair_idx)
+                else:
+                    open_pairs.discard(pair_idx)
+            if 0 < max_open_trades <= open_trade_count_start:
+                self.rejected_trades += data.rows_between(step, next_idle, len(data.pairs))
+
+            # Without open trades, skip ahead to the next entry signal.
+            step = step + 1 if open_pairs else data.next_signal_step(step + 1)
+
+        self.progress.set_new_value(n_steps)
+        last_rows = {
+            pair: [pair_data.row(len(pair_data) - 1)]
+            for pair, pair_data in zip(data.pairs, data.pair_data)
+            if open_trades.get(pair)
         }
+        trades += self.handle_left_open(open_trades, data=last_rows)
+        return trades
 
     def backtest_one_strategy(
         self, strat: IStrategy, data: Dict[str, DataFrame], timerange: TimeRange
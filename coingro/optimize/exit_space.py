@@ -0,0 +1,506 @@
+"""
+Vectorized evaluation of exit parameters (ROI table, stoploss, trailing stop).
+
+While only exit parameters change, entry signals stay fixed - so the candles every possible trade
+can exit on are known upfront. For every entry candle, forward windows of the price path are
+scored against many exit parameter sets at once, instead of replaying the backtest event loop
+for each of them.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from coingro.constants import UNLIMITED_STAKE_AMOUNT
+from coingro.data.btanalysis import BT_DATA_COLUMNS
+from coingro.enums import ExitType, TradingMode
+from coingro.exceptions import OperationalException
+from coingro.optimize.backtest_columnar import ColumnarPairData, rows_to_steps
+from coingro.strategy.interface import IStrategy
+
+logger = logging.getLogger(__name__)
+
+# Candles scanned per entry and round. Trades still open afterwards are continued in a new round.
+DEFAULT_HORIZON = 256
+# Upper bound of (candidates x entries x horizon) cells evaluated at once
+MAX_BATCH_CELLS = 2**22
+
+# Callbacks which change entries or exits - strategies overriding them are not supported
+UNSUPPORTED_CALLBACKS = (
+    "custom_entry_price",
+    "custom_exit_price",
+    "custom_exit",
+    "custom_stake_amount",
+    "confirm_trade_entry",
+    "confirm_trade_exit",
+)
+
+_EXIT_SIGNAL, _STOP_LOSS, _ROI, _TRAILING_STOP_LOSS, _FORCE_EXIT = range(5)
+_EXIT_REASONS = {
+    _EXIT_SIGNAL: ExitType.EXIT_SIGNAL.value,
+    _STOP_LOSS: ExitType.STOP_LOSS.value,
+    _ROI: ExitType.ROI.value,
+    _TRAILING_STOP_LOSS: ExitType.TRAILING_STOP_LOSS.value,
+    _FORCE_EXIT: ExitType.FORCE_EXIT.value,
+}
+
+
+class ExitParams(NamedTuple):
+    """
+    One set of exit parameters to evaluate.
+    """
+
+    minimal_roi: Dict[int, float]
+    stoploss: float
+    trailing_stop: bool = False
+    trailing_stop_positive: Optional[float] = None
+    trailing_stop_positive_offset: float = 0.0
+    trailing_only_offset_is_reached: bool = False
+
+    @classmethod
+    def from_strategy(cls, strategy: IStrategy) -> "ExitParams":
+        return cls(
+            minimal_roi=dict(strategy.minimal_roi),
+            stoploss=strategy.stoploss,
+            trailing_stop=strategy.trailing_stop,
+            trailing_stop_positive=strategy.trailing_stop_positive,
+            trailing_stop_positive_offset=strategy.trailing_stop_positive_offset,
+            trailing_only_offset_is_reached=strategy.trailing_only_offset_is_reached,
+        )
+
+
+class _PairPaths:
+    """
+    Price path and entry candles of one pair, limited to the candles visited by the backtest.
+    """
+
+    def __init__(self, pair_data: ColumnarPairData, n_steps: int) -> None:
+        n_rows = int(np.count_nonzero(pair_data.steps < n_steps))
+        values = pair_data.values[:n_rows]
+        self.n_rows = n_rows
+        self.open = values[:, 0]
+        self.high = values[:, 1]
+        self.low = values[:, 2]
+        self.close = values[:, 3]
+        self.enter = values[:, 4] == 1
+        self.exit = values[:, 5] == 1
+        self.enter_tags = pair_data.enter_tags[:n_rows]
+        self.exit_tags = pair_data.exit_tags[:n_rows]
+        self.dates = pair_data.dates.iloc[:n_rows]
+        self.minutes = (
+            pair_data.dates.to_numpy(dtype="datetime64[ns]")[:n_rows].view(np.int64)
+            // 60_000_000_000
+        )
+        # No entries on the last candle of the backtest
+        self.entries = np.flatnonzero(
+            pair_data.entry_signal[:n_rows] & (pair_data.steps[:n_rows] != n_steps - 1)
+        )
+        # Trades left open are closed at the open of the last candle
+        self.last_date = pair_data.dates.iat[-1]
+        self.last_open = pair_data.values[-1, 0]
+
+
+class ExitSpaceEvaluator:
+    """
+    Evaluates many exit parameter sets against fixed entry signals in vectorized passes.
+
+    Results match Backtesting (long trades in spot markets) as long as trades are not limited
+    by max_open_trades, protections or the available wallet balance.
+    With max_open_trades or protections enabled, trades which Backtesting would reject are still
+    counted - results are marked as `approximate`.
+    """
+
+    def __init__(
+        self,
+        backtesting,
+        processed: Dict[str, DataFrame],
+        start_date: datetime,
+        end_date: datetime,
+        max_open_trades: int = 0,
+        enable_protections: bool = False,
+        horizon: int = DEFAULT_HORIZON,
+    ) -> None:
+        """
+        :param backtesting: Backtesting instance, with the strategy set
+        :param processed: Dict of pair -> analyzed dataframe (indicators populated)
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :param max_open_trades: maximum number of concurrent trades, <= 0 means unlimited
+        :param enable_protections: Are protections enabled
+        :param horizon: Number of candles scanned per entry and round
+        """
+        unsupported = self.get_unsupported_features(backtesting)
+        if unsupported:
+            raise OperationalException(
+                f"Exit space evaluation does not support {', '.join(unsupported)}."
+            )
+        self.strategy: IStrategy = backtesting.strategy
+        self.config = backtesting.config
+        self.fee: float = backtesting.fee
+        self.timeframe_min: int = backtesting.timeframe_min
+        self.horizon = horizon
+        self.approximate = max_open_trades > 0 or enable_protections
+
+        timeframe_td = timedelta(minutes=self.timeframe_min)
+        n_steps = int((end_date - start_date) / timeframe_td)
+        self.pairs: Dict[str, _PairPaths] = {}
+        for pair, pair_data in backtesting._get_ohlcv_as_arrays(processed).items():
+            pair_data.steps = rows_to_steps(
+                pair_data.dates.to_numpy(dtype="datetime64[ns]").view(np.int64),
+                start_date + timeframe_td,
+                timeframe_td,
+                n_steps,
+            )
+            self.pairs[pair] = _PairPaths(pair_data, n_steps)
+
+    @staticmethod
+    def get_unsupported_features(backtesting) -> List[str]:
+        """
+        Get the configured features the vectorized evaluation can't reproduce.
+        """
+        strategy = backtesting.strategy
+        unsupported = []
+        if backtesting.trading_mode != TradingMode.SPOT:
+            unsupported.append(f"trading_mode {backtesting.trading_mode.value}")
+        if backtesting.timeframe_detail:
+            unsupported.append("timeframe_detail")
+        if backtesting.config.get("position_stacking", False):
+            unsupported.append("position stacking")
+        if backtesting.config["stake_amount"] == UNLIMITED_STAKE_AMOUNT:
+            unsupported.append("unlimited stake amount")
+        if strategy.position_adjustment_enable:
+            unsupported.append("position adjustment")
+        if strategy.use_custom_stoploss:
+            unsupported.append("custom stoploss")
+        for callback in UNSUPPORTED_CALLBACKS:
+            if getattr(type(strategy), callback) is not getattr(IStrategy, callback):
+                unsupported.append(callback)
+        return unsupported
+
+    def evaluate(self, candidates: List[ExitParams]) -> List[DataFrame]:
+        """
+        Evaluate exit parameter sets.
+        :param candidates: List of exit parameter sets
+        :return: One dataframe of trades per candidate, sorted by pair and open_date
+        """
+        trades: List[List[Dict]] = [[] for _ in candidates]
+        for pair, paths in self.pairs.items():
+            n_entries = len(paths.entries)
+            if not n_entries:
+                continue
+            batch = max(1, MAX_BATCH_CELLS // (n_entries * self.horizon))
+            for start in range(0, len(candidates), batch):
+                chunk = candidates[start : start + batch]
+                exit_rows, reasons, close_rates = self._find_exits(paths, chunk)
+                for offset in range(len(chunk)):
+                    trades[start + offset].extend(
+                        self._chain_trades(
+                            pair, paths, exit_rows[offset], reasons[offset], close_rates[offset]
+                        )
+                    )
+        return [DataFrame(t, columns=list(self._trade_columns())) for t in trades]
+
+    def to_backtest_results(self, trades: DataFrame) -> Dict[str, Any]:
+        """
+        Complete the trades of one candidate to the result format of Backtesting.backtest(),
+        so they can be used for backtest statistics and hyperopt loss functions.
+        Every trade uses the configured stake amount. Columns the evaluation doesn't track
+        (trailed stoploss, min / max rates) are derived from the open and close rates.
+        :param trades: Trades of one candidate, as returned by evaluate()
+        """
+        results = trades.copy()
+        stake_amount = float(self.config["stake_amount"])
+        results["stake_amount"] = stake_amount
+        results["amount"] = (stake_amount / results["open_rate"]).round(8)
+        results["fee_open"] = self.fee
+        results["fee_close"] = self.fee
+        results["profit_abs"] = (
+            results["amount"] * results["close_rate"] * (1 - self.fee)
+            - results["amount"] * results["open_rate"] * (1 + self.fee)
+        ).round(8)
+        results["initial_stop_loss_ratio"] = self.strategy.stoploss
+        results["initial_stop_loss_abs"] = results["open_rate"] * (
+            1 - abs(self.strategy.stoploss)
+        )
+        results["stop_loss_ratio"] = results["initial_stop_loss_ratio"]
+        results["stop_loss_abs"] = results["initial_stop_loss_abs"]
+        results["min_rate"] = results[["open_rate", "close_rate"]].min(axis=1)
+        results["max_rate"] = results[["open_rate", "close_rate"]].max(axis=1)
+        results["is_short"] = False
+        results["open_timestamp"] = (results["open_date"].astype("int64") // 10**6).astype(int)
+        results["close_timestamp"] = (results["close_date"].astype("int64") // 10**6).astype(
+            int
+        )
+        results["orders"] = [[] for _ in range(len(results))]
+        return {
+            "results": results[BT_DATA_COLUMNS],
+            "config": self.strategy.config,
+            "locks": [],
+            "rejected_signals": 0,
+            "timedout_entry_orders": 0,
+            "timedout_exit_orders": 0,
+            "canceled_trade_entries": 0,
+            "canceled_entry_orders": 0,
+            "replaced_entry_orders": 0,
+            "final_balance": self.config["dry_run_wallet"] + results["profit_abs"].sum(),
+        }
+
+    @staticmethod
+    def _trade_columns() -> Tuple[str, ...]:
+        return (
+            "pair",
+            "open_date",
+            "close_date",
+            "open_rate",
+            "close_rate",
+            "profit_ratio",
+            "exit_reason",
+            "trade_duration",
+            "is_open",
+            "enter_tag",
+        )
+
+    def _profit_ratio(self, rate: np.ndarray, open_rate: np.ndarray) -> np.ndarray:
+        """
+        Profit ratio of long trades incl. fees, rounded like LocalTrade.calc_profit_ratio().
+        """
+        return np.round(rate * (1 - self.fee) / (open_rate * (1 + self.fee)) - 1, 8)
+
+    def _find_exits(
+        self, paths: _PairPaths, candidates: List[ExitParams]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the exit of a trade opened on every entry candle, for every candidate.
+        :return: Tuple of (exit row, exit reason, close rate) arrays, each candidates x entries.
+            Trades left open at the end have exit row -1.
+        """
+        n_cand, n_entries = len(candidates), len(paths.entries)
+        rows = np.tile(paths.entries, n_cand)
+        params = self._params_arrays(candidates, n_entries)
+
+        exit_rows = np.full(len(rows), -1, dtype=np.int64)
+        reasons = np.full(len(rows), _FORCE_EXIT, dtype=np.int64)
+        close_rates = np.full(len(rows), paths.last_open, dtype=np.float64)
+        # Current stoploss of each trade - initial stoploss at trade open
+        stops = paths.open[rows] * (1 - np.abs(params["stoploss"]))
+
+        active = np.arange(len(rows))
+        offset = 0
+        while len(active):
+            active_params = {k: v[active] for k, v in params.items()}
+            found, exit_j, reason, rate, last_stop = self._scan(
+                paths, rows[active], active_params, offset, stops[active]
+            )
+            done = active[found]
+            exit_rows[done] = rows[done] + offset + exit_j[found]
+            reasons[done] = reason[found]
+            close_rates[done] = rate[found]
+            stops[active] = last_stop
+
+            offset += self.horizon
+            # Continue trades which are still open, while there are candles left
+            active = active[~found & (rows[active] + offset < paths.n_rows)]
+
+        shape = (n_cand, n_entries)
+        return exit_rows.reshape(shape), reasons.reshape(shape), close_rates.reshape(shape)
+
+    def _params_arrays(self, candidates: List[ExitParams], n_entries: int) -> Dict[str, np.ndarray]:
+        """
+        Exit parameters as arrays, repeated for every entry.
+        ROI tables are padded to the same length with never reached entries.
+        """
+        n_roi = max(len(c.minimal_roi) for c in candidates) or 1
+        roi_keys = np.full((len(candidates), n_roi), np.inf)
+        roi_values = np.full((len(candidates), n_roi), np.inf)
+        for i, candidate in enumerate(candidates):
+            table = sorted(candidate.minimal_roi.items())
+            roi_keys[i, : len(table)] = [float(k) for k, _ in table]
+            roi_values[i, : len(table)] = [v for _, v in table]
+        params = {
+            "stoploss": np.array([c.stoploss for c in candidates], dtype=np.float64),
+            "trailing_stop": np.array([bool(c.trailing_stop) for c in candidates]),
+            "trailing_stop_positive": np.array(
+                [
+                    c.trailing_stop_positive if c.trailing_stop_positive is not None else np.nan
+                    for c in candidates
+                ],
+                dtype=np.float64,
+            ),
+            "trailing_stop_positive_offset": np.array(
+                [c.trailing_stop_positive_offset or 0.0 for c in candidates], dtype=np.float64
+            ),
+            "trailing_only_offset_is_reached": np.array(
+                [bool(c.trailing_only_offset_is_reached) for c in candidates]
+            ),
+            "roi_keys": roi_keys,
+            "roi_values": roi_values,
+        }
+        return {k: np.repeat(v, n_entries, axis=0) for k, v in params.items()}
+
+    def _scan(
+        self,
+        paths: _PairPaths,
+        rows: np.ndarray,
+        params: Dict[str, np.ndarray],
+        offset: int,
+        stops: np.ndarray,
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Scan `horizon` candles, starting `offset` candles after the entry candle, for exits.
+        Mirrors IStrategy.should_exit() and Backtesting._get_close_rate().
+        :param rows: Entry candle of every trade
+        :param stops: Stoploss of every trade before the first scanned candle
+        :return: Tuple of (found, candle of exit, exit reason, close rate, stoploss after scan)
+        """
+        n = len(rows)
+        cols = np.arange(n)
+        idx = rows[:, None] + offset + np.arange(self.horizon)
+        valid = idx < paths.n_rows
+        idx = np.minimum(idx, paths.n_rows - 1)
+        rate_open, high, low = paths.open[idx], paths.high[idx], paths.low[idx]
+        enter, exit_ = paths.enter[idx], paths.exit[idx]
+        open_rate = paths.open[rows][:, None]
+        trade_dur = paths.minutes[idx] - paths.minutes[rows][:, None]
+
+        # Stoploss / trailing stop
+        stoploss = params["stoploss"][:, None]
+        initial_stop = open_rate[:, 0] * (1 - np.abs(params["stoploss"]))
+        sl_offset = params["trailing_stop_positive_offset"][:, None]
+        positive = params["trailing_stop_positive"][:, None]
+        high_profit = self._profit_ratio(high, open_rate)
+        stop_value = np.where(
+            ~np.isnan(positive) & (high_profit > sl_offset), positive, stoploss
+        )
+        trailing = (
+            valid
+            & params["trailing_stop"][:, None]
+            & ~(params["trailing_only_offset_is_reached"][:, None] & (high_profit < sl_offset))
+        )
+        new_stop = np.where(trailing, high * (1 - np.abs(stop_value)), -np.inf)
+        stop = np.maximum(np.maximum.accumulate(new_stop, axis=1), stops[:, None])
+        prev_stop = np.concatenate([stops[:, None], stop[:, :-1]], axis=1)
+        # The stoploss is only trailed while it's below the candle low
+        stop_hit_at = np.where(prev_stop >= low, prev_stop, stop)
+        stop_hit = valid & (stop >= low)
+        is_trailing = stop_hit_at != initial_stop[:, None]
+
+        stop_rate = stop_hit_at
+        # Trailing stop triggered on the entry candle: assume the worst price movement
+        if offset == 0:
+            stop_rate = stop_rate.copy()
+            only_offset = (
+                params["trailing_only_offset_is_reached"]
+                & ~np.isnan(params["trailing_stop_positive"])
+                & (np.nan_to_num(params["trailing_stop_positive"]) != 0)
+            )
+            worst = np.where(
+                only_offset,
+                rate_open[:, 0]
+                * (
+                    1
+                    + np.abs(params["trailing_stop_positive_offset"])
+                    - np.abs(np.nan_to_num(params["trailing_stop_positive"]))
+                ),
+                rate_open[:, 0] * (1 - np.abs(stop_value[:, 0])),
+            )
+            entry_candle = is_trailing[:, 0] & (trade_dur[:, 0] == 0)
+            stop_rate[entry_candle, 0] = np.maximum(low[entry_candle, 0], worst[entry_candle])
+        stop_rate = np.where(stop_hit_at > high, rate_open, stop_rate)
+
+        # ROI
+        roi_keys, roi_values = params["roi_keys"], params["roi_values"]
+        roi_pos = (roi_keys[:, None, :] <= trade_dur[:, :, None]).sum(axis=2)
+        has_roi = roi_pos > 0
+        roi_pos = np.maximum(roi_pos - 1, 0)
+        roi_entry = np.take_along_axis(roi_keys, roi_pos, axis=1)
+        roi = np.take_along_axis(roi_values, roi_pos, axis=1)
+        roi_hit = valid & has_roi & (high_profit > roi)
+        if self.strategy.ignore_roi_if_entry_signal:
+            roi_hit &= ~enter
+        with np.errstate(invalid="ignore"):
+            roi_close = -(open_rate * roi + open_rate * (1 + self.fee)) / (self.fee - 1)
+            on_candle_open = roi_entry % self.timeframe_min == 0
+        roi_rate = np.minimum(np.maximum(roi_close, low), high)
+        roi_rate = np.where(
+            (trade_dur > 0) & (trade_dur == roi_entry) & on_candle_open & (rate_open > roi_close),
+            rate_open,
+            roi_rate,
+        )
+        roi_rate = np.where((roi == -1) & on_candle_open, rate_open, roi_rate)
+
+        # Exit signal
+        if self.strategy.use_exit_signal:
+            signal = valid & exit_ & ~enter
+            if self.strategy.exit_profit_only:
+                signal &= (
+                    self._profit_ratio(rate_open, open_rate) > self.strategy.exit_profit_offset
+                )
+        else:
+            signal = np.zeros_like(valid)
+
+        # First candle with an exit - exits are prioritized like in should_exit()
+        any_exit = signal | stop_hit | roi_hit
+        exit_j = np.argmax(any_exit, axis=1)
+        found = any_exit[cols, exit_j]
+        sig_j, stop_j, roi_j = signal[cols, exit_j], stop_hit[cols, exit_j], roi_hit[cols, exit_j]
+        trailing_j = is_trailing[cols, exit_j]
+        reason = np.select(
+            [sig_j, stop_j & ~trailing_j, roi_j],
+            [_EXIT_SIGNAL, _STOP_LOSS, _ROI],
+            default=_TRAILING_STOP_LOSS,
+        )
+        rate = np.select(
+            [sig_j, stop_j & ~trailing_j, roi_j],
+            [rate_open[cols, exit_j], stop_rate[cols, exit_j], roi_rate[cols, exit_j]],
+            default=stop_rate[cols, exit_j],
+        )
+        return found, exit_j, reason, rate, stop[:, -1]
+
+    def _chain_trades(
+        self,
+        pair: str,
+        paths: _PairPaths,
+        exit_rows: np.ndarray,
+        reasons: np.ndarray,
+        close_rates: np.ndarray,
+    ) -> List[Dict]:
+        """
+        Build the trades of one pair: after a trade closed, the next one opens on the first
+        entry candle after the exit candle.
+        """
+        trades = []
+        entries = paths.entries
+        i = 0
+        while i < len(entries):
+            entry, exit_row = entries[i], exit_rows[i]
+            open_rate = paths.open[entry]
+            open_date = paths.dates.iat[entry]
+            is_open = exit_row < 0
+            close_date = paths.last_date if is_open else paths.dates.iat[exit_row]
+            reason = _EXIT_REASONS[reasons[i]]
+            if reasons[i] == _EXIT_SIGNAL:
+                exit_tag = paths.exit_tags[exit_row]
+                if exit_tag is not None and len(exit_tag) > 0:
+                    reason = exit_tag
+            trades.append(
+                {
+                    "pair": pair,
+                    "open_date": open_date,
+                    "close_date": close_date,
+                    "open_rate": open_rate,
+                    "close_rate": close_rates[i],
+                    "profit_ratio": float(
+                        self._profit_ratio(np.float64(close_rates[i]), np.float64(open_rate))
+                    ),
+                    "exit_reason": reason,
+                    "trade_duration": int((close_date - open_date).total_seconds() // 60),
+                    "is_open": is_open,
+                    "enter_tag": paths.enter_tags[entry],
+                }
+            )
+            if is_open:
+                break
+            i = int(np.searchsorted(entries, exit_row, side="right"))
+        return trades
@@ -7,16 +7,18 @@ This module contains the hyperopt logic
 import logging
 import random
 import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timezone
-from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
 
 import progressbar
 import rapidjson
 from colorama import Fore, Style
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import cpu_count, effective_n_jobs, wrap_non_picklable_objects
+from joblib.externals.loky import ProcessPoolExecutor
 from pandas import DataFrame
 
 from coingro.constants import CGHYPT_FILEVERSION, DATETIME_PRINT_FORMAT, LAST_BT_RESULT_FN
@@ -25,9 +27,11 @@ from coingro.data.history import get_timerange
 from coingro.exceptions import OperationalException
 from coingro.misc import deep_merge_dicts, file_dump_json, plural
 from coingro.optimize.backtesting import Backtesting
+from coingro.optimize.exit_space import ExitParams, ExitSpaceEvaluator
 
 # Import IHyperOpt and IHyperOptLoss to allow unpickling classes from these modules
 from coingro.optimize.hyperopt_auto import HyperOptAuto
+from coingro.optimize.hyperopt_data import dump_dataframes, get_data_files, load_dataframes
 from coingro.optimize.hyperopt_loss_interface import IHyperOptLoss
 from coingro.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from coingro.optimize.optimize_reports import generate_strategy_stats
@@ -52,6 +56,19 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Hyperopt instance of a worker process - received once, when the worker starts
+_worker_hyperopt: Optional["Hyperopt"] = None
+
+
+def _init_hyperopt_worker(hyperopt: "Hyperopt") -> None:
+    global _worker_hyperopt
+    _worker_hyperopt = hyperopt
+
+
+def _run_hyperopt_epoch(raw_params: List[Any]) -> Dict:
+    assert _worker_hyperopt is not None
+    return _worker_hyperopt.generate_optimizer(raw_params)
+
 
 class Hyperopt:
     """
@@ -99,8 +116,8 @@ class Hyperopt:
             / "hyperopt_results"
             / f"strategy_{strategy}_{time_now}.cghypt"
         )
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+        self.data_file = (
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.bin"
         )
         self.total_epochs = config.get("epochs", 0)
 
@@ -110,6 +127,12 @@ class Hyperopt:
 
         self.num_epochs_saved = 0
         self.current_best_epoch: Optional[Dict[str, Any]] = None
+        # Preprocessed data, loaded once per process
+        self._preprocessed: Optional[Dict[str, DataFrame]] = None
+        # Epochs optimizing exit spaces only are scored by the vectorized exit space evaluator.
+        # The evaluator is created once per process, on first use.
+        self.use_exit_space = False
+        self._exit_space: Optional[ExitSpaceEvaluator] = None
 
         # Use max_open_trades for hyperopt as well, except --disable-max-market-positions is set
         if self.config.get("use_max_market_positions", True):
@@ -137,7 +160,7 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in get_data_files(self.data_file) + [self.results_file]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -282,6 +305,30 @@ class Hyperopt:
             + self.trailing_space
         )
 
+    def init_exit_space(self) -> None:
+        """
+        Use the vectorized exit space evaluation if only exit spaces (roi, stoploss, trailing)
+        are optimized - entry signals are then the same for every epoch.
+        """
+        entry_spaces = ("buy", "sell", "protection")
+        if any(HyperoptTools.has_space(self.config, space) for space in entry_spaces):
+            return
+        unsupported = ExitSpaceEvaluator.get_unsupported_features(self.backtesting)
+        if unsupported:
+            logger.info(
+                f"Not using the exit space evaluation, as {', '.join(unsupported)} "
+                "is not supported."
+            )
+            return
+        self.use_exit_space = True
+        logger.info("Only exit spaces are optimized - using the exit space evaluation.")
+        if self.max_open_trades > 0 or self.config.get("enable_protections", False):
+            logger.warning(
+                "Results are approximate, as trades exceeding max_open_trades or blocked "
+                "by protections are still counted. "
+                "Use --disable-max-market-positions for exact results."
+            )
+
     def assign_params(self, params_dict: Dict, category: str) -> None:
         """
         Assign hyperoptable parameters
@@ -329,16 +376,21 @@ class Hyperopt:
                 "trailing_only_offset_is_reached"
             ]
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-        bt_results = self.backtesting.backtest(
-            processed=processed,
-            start_date=self.min_date,
-            end_date=self.max_date,
-            max_open_trades=self.max_open_trades,
-            position_stacking=self.position_stacking,
-            enable_protections=self.config.get("enable_protections", False),
-        )
+        # Signals are cached across epochs - data is only needed if buy / sell params changed
+        processed = self.backtesting.get_cached_processed()
+        if processed is None:
+            processed = self._get_preprocessed()
+        if self.use_exit_space:
+            bt_results = self._evaluate_exit_space(processed)
+        else:
+            bt_results = self.backtesting.backtest(
+                processed=processed,
+                start_date=self.min_date,
+                end_date=self.max_date,
+                max_open_trades=self.max_open_trades,
+                position_stacking=self.position_stacking,
+                enable_protections=self.config.get("enable_protections", False),
+            )
         backtest_end_time = datetime.now(timezone.utc)
         bt_results.update(
             {
@@ -347,9 +399,30 @@ class Hyperopt:
             }
         )
 
-        return self._get_results_dict(
+        results = self._get_results_dict(
             bt_results, self.min_date, self.max_date, params_dict, processed=processed
         )
+        if self._exit_space is not None and self._exit_space.approximate:
+            results["is_approximate"] = True
+            results["results_explanation"] += " (approximate)"
+        return results
+
+    def _evaluate_exit_space(self, processed: Dict[str, DataFrame]) -> Dict[str, Any]:
+        """
+        Score the exit parameters currently set on the strategy with the exit space evaluator.
+        :return: Backtest results, in the format of Backtesting.backtest()
+        """
+        if self._exit_space is None:
+            self._exit_space = ExitSpaceEvaluator(
+                self.backtesting,
+                processed,
+                self.min_date,
+                self.max_date,
+                max_open_trades=self.max_open_trades,
+                enable_protections=self.config.get("enable_protections", False),
+            )
+        trades = self._exit_space.evaluate([ExitParams.from_strategy(self.backtesting.strategy)])
+        return self._exit_space.to_backtest_results(trades[0])
 
     def _get_results_dict(
         self, backtesting_results, min_date, max_date, params_dict, processed: Dict[str, DataFrame]
@@ -420,10 +493,63 @@ class Hyperopt:
             model_queue_size=SKOPT_MODEL_QUEUE_SIZE,
         )
 
-    def run_optimizer_parallel(self, parallel, asked, i) -> List:
-        return parallel(
-            delayed(wrap_non_picklable_objects(self.generate_optimizer))(v, i) for v in asked
+    def _get_preprocessed(self) -> Dict[str, DataFrame]:
+        """
+        Get the preprocessed data, mapping the data store on first use in this process.
+        Dataframes are shallow copies, so signal columns added during an epoch don't leak
+        into the next epoch.
+        """
+        if self._preprocessed is None:
+            self._preprocessed = load_dataframes(self.data_file)
+        return {pair: df.copy(deep=False) for pair, df in self._preprocessed.items()}
+
+    def run_optimizer_async(self, jobs: int) -> Iterator[Tuple[Dict, bool]]:
+        """
+        Evaluate `total_epochs` points, keeping up to `jobs` evaluations running.
+        A new point is asked as soon as any evaluation finishes, and each result is told to the
+        optimizer right away - so one slow epoch does not stall the other workers.
+        Worker processes are started once and keep their copy of this instance (and the
+        preprocessed data) for all epochs.
+        :param jobs: Number of parallel evaluations
+        :return: Iterator of (result, is_random) tuples, in order of completion
+        """
+        if jobs == 1:
+            for _ in range(self.total_epochs):
+                asked, is_random = self.get_asked_points(n_points=1)
+                val = self.generate_optimizer(asked[0])
+                self.opt.tell(asked[0], val["loss"])
+                yield val, is_random[0]
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_hyperopt_worker,
+            # Strategy classes are not importable by workers - pickle them by value
+            initargs=(wrap_non_picklable_objects(self, keep_wrapper=False),),
         )
+        running: Dict[Future, Tuple[List[Any], bool]] = {}
+        submitted = 0
+        try:
+            while submitted < self.total_epochs or running:
+                n_points = min(jobs - len(running), self.total_epochs - submitted)
+                if n_points > 0:
+                    asked, is_random = self.get_asked_points(
+                        n_points=n_points, pending=[point for point, _ in running.values()]
+                    )
+                    for point, rand in zip(asked, is_random):
+                        running[executor.submit(_run_hyperopt_epoch, point)] = (point, rand)
+                    submitted += len(asked)
+                    if not running:
+                        break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    point, rand = running.pop(future)
+                    val = future.result()
+                    self.opt.tell(point, val["loss"])
+                    yield val, rand
+        finally:
+            executor.shutdown(wait=False, kill_workers=True)
 
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
@@ -445,15 +571,20 @@ class Hyperopt:
             f"({(self.max_date - self.min_date).days} days).."
         )
         # Store non-trimmed data - will be trimmed after signal generation.
-        dump(preprocessed, self.data_pickle_file)
-
-    def get_asked_points(self, n_points: int) -> Tuple[List[List[Any]], List[bool]]:
+        # Workers map this data instead of unpickling their own copy.
+        dump_dataframes(preprocessed, self.data_file)
+        # Identify this dataset, so converted signals can be reused across epochs
+        self.backtesting.signal_cache_id = uuid4().hex
+
+    def get_asked_points(
+        self, n_points: int, pending: Optional[List[List[Any]]] = None
+    ) -> Tuple[List[List[Any]], List[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
 
         Steps:
         1. Try to get points using `self.opt.ask` first
-        2. Discard the points that have already been evaluated
+        2. Discard the points that have already been evaluated, or are being evaluated (`pending`)
         3. Retry using `self.opt.ask` up to 3 times
         4. If still some points are missing in respect to `n_points`, random sample some points
         5. Repeat until at least `n_points` points in the `asked_non_tried` list
@@ -467,6 +598,7 @@ class Hyperopt:
                     new_list.append(item)
             return new_list
 
+        tried = self.opt.Xi + (pending or [])
         i = 0
         asked_non_tried: List[List[Any]] = []
         is_random_non_tried: List[bool] = []
@@ -481,11 +613,9 @@ class Hyperopt:
             is_random_non_tried += [
                 rand
                 for x, rand in zip(asked, is_random)
-                if x not in self.opt.Xi and x not in asked_non_tried
-            ]
-            asked_non_tried += [
-                x for x in asked if x not in self.opt.Xi and x not in asked_non_tried
+                if x not in tried and x not in asked_non_tried
             ]
+            asked_non_tried += [x for x in asked if x not in tried and x not in asked_non_tried]
             i += 1
 
         if asked_non_tried:
@@ -502,6 +632,7 @@ class Hyperopt:
         self.hyperopt_table_header = -1
         # Initialize spaces ...
         self.init_spaces()
+        self.init_exit_space()
 
         self.prepare_hyperopt_data()
 
@@ -524,99 +655,88 @@ class Hyperopt:
         if self.print_colorized:
             colorama_init(autoreset=True)
 
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f"Effective number of parallel workers used: {jobs}")
+
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-
-                # Define progressbar
-                if self.print_colorized:
-                    widgets = [
-                        " [Epoch ",
-                        progressbar.Counter(),
-                        " of ",
-                        str(self.total_epochs),
-                        " (",
-                        progressbar.Percentage(),
-                        ")] ",
-                        progressbar.Bar(
-                            marker=progressbar.AnimatedMarker(
-                                fill="\N{FULL BLOCK}",
-                                fill_wrap=Fore.GREEN + "{}" + Fore.RESET,
-                                marker_wrap=Style.BRIGHT + "{}" + Style.RESET_ALL,
-                            )
-                        ),
-                        " [",
-                        progressbar.ETA(),
-                        ", ",
-                        progressbar.Timer(),
-                        "]",
-                    ]
-                else:
-                    widgets = [
-                        " [Epoch ",
-                        progressbar.Counter(),
-                        " of ",
-                        str(self.total_epochs),
-                        " (",
-                        progressbar.Percentage(),
-                        ")] ",
-                        progressbar.Bar(
-                            marker=progressbar.AnimatedMarker(
-                                fill="\N{FULL BLOCK}",
-                            )
-                        ),
-                        " [",
-                        progressbar.ETA(),
-                        ", ",
-                        progressbar.Timer(),
-                        "]",
-                    ]
-                with progressbar.ProgressBar(
-                    max_value=self.total_epochs,
-                    redirect_stdout=False,
-                    redirect_stderr=False,
-                    widgets=widgets,
-                ) as pbar:
-                    EVALS = ceil(self.total_epochs / jobs)
-                    for i in range(EVALS):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - self.total_epochs
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked, i)
-                        self.opt.tell(asked, [v["loss"] for v in f_val])
-
-                        # Calculate progressbar outputs
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1
-                            val["current_epoch"] = current
-                            val["is_initial_point"] = current <= INITIAL_POINTS
-
-                            logger.debug(f"Optimizer epoch evaluated: {val}")
-
-                            is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
-                            # This value is assigned here and not in the optimization method
-                            # to keep proper order in the list of results. That's because
-                            # evaluations can take different time. Here they are aligned in the
-                            # order they will be shown to the user.
-                            val["is_best"] = is_best
-                            val["is_random"] = is_random[j]
-                            self.print_results(val)
-
-                            if is_best:
-                                self.current_best_loss = val["loss"]
-                                self.current_best_epoch = val
-
-                            self._save_result(val)
-
-                            pbar.update(current)
+            # Define progressbar
+            if self.print_colorized:
+                widgets = [
+                    " [Epoch ",
+                    progressbar.Counter(),
+                    " of ",
+                    str(self.total_epochs),
+                    " (",
+                    progressbar.Percentage(),
+                    ")] ",
+                    progressbar.Bar(
+                        marker=progressbar.AnimatedMarker(
+                            fill="\N{FULL BLOCK}",
+                            fill_wrap=Fore.GREEN + "{}" + Fore.RESET,
+                            marker_wrap=Style.BRIGHT + "{}" + Style.RESET_ALL,
+                        )
+                    ),
+                    " [",
+                    progressbar.ETA(),
+                    ", ",
+                    progressbar.Timer(),
+                    "]",
+                ]
+            else:
+                widgets = [
+                    " [Epoch ",
+                    progressbar.Counter(),
+                    " of ",
+                    str(self.total_epochs),
+                    " (",
+                    progressbar.Percentage(),
+                    ")] ",
+                    progressbar.Bar(
+                        marker=progressbar.AnimatedMarker(
+                            fill="\N{FULL BLOCK}",
+                        )
+                    ),
+                    " [",
+                    progressbar.ETA(),
+                    ", ",
+                    progressbar.Timer(),
+                    "]",
+                ]
+            with progressbar.ProgressBar(
+                max_value=self.total_epochs,
+                redirect_stdout=False,
+                redirect_stderr=False,
+                widgets=widgets,
+            ) as pbar:
+                # Results arrive in order of completion - epochs are numbered accordingly.
+                # Use human-friendly indexes here (starting from 1)
+                for current, (val, is_random) in enumerate(self.run_optimizer_async(jobs), 1):
+                    val["current_epoch"] = current
+                    val["is_initial_point"] = current <= INITIAL_POINTS
+
+                    logger.debug(f"Optimizer epoch evaluated: {val}")
+
+                    is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
+                    # This value is assigned here and not in the optimization method
+                    # to keep proper order in the list of results. That's because
+                    # evaluations can take different time. Here they are aligned in the
+                    # order they will be shown to the user.
+                    val["is_best"] = is_best
+                    val["is_random"] = is_random
+                    self.print_results(val)
+
+                    if is_best:
+                        self.current_best_loss = val["loss"]
+                        self.current_best_epoch = val
+
+                    self._save_result(val)
+
+                    pbar.update(current)
 
         except KeyboardInterrupt:
             print("User interrupted..")
+        finally:
+            self.backtesting.clear_signal_cache()
 
         logger.info(
             f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
@@ -0,0 +1,118 @@
+"""
+Memory-mapped storage of preprocessed hyperopt data.
+
+All numeric (and datetime) columns of all pairs are written into a single arena file, described
+by a json manifest. Loading maps the arena read-only and wraps the columns without copying them,
+so hyperopt workers share one copy of the data through the page cache.
+Columns without a fixed-width NumPy representation (e.g. strings) are pickled into a side file.
+"""
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import rapidjson
+from joblib import dump, load
+from pandas import DataFrame, DatetimeTZDtype, RangeIndex
+from pandas.arrays import DatetimeArray
+
+DATA_FILE_VERSION = 1
+# Column offsets are aligned to cache lines
+ARENA_ALIGNMENT = 64
+
+
+def get_data_files(filename: Path) -> List[Path]:
+    """
+    All files making up the data store: arena, manifest and pickled object columns.
+    """
+    return [filename, filename.with_suffix(".json"), filename.with_suffix(".pkl")]
+
+
+def dump_dataframes(data: Dict[str, DataFrame], filename: Path) -> None:
+    """
+    Store a dict of dataframes in the data store at filename.
+    :param data: Dict of pair -> dataframe
+    :param filename: Arena file - manifest and object files are stored next to it.
+    """
+    arena_file, manifest_file, objects_file = get_data_files(filename)
+    manifest: Dict[str, Any] = {"version": DATA_FILE_VERSION, "pairs": {}}
+    objects: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+
+    with arena_file.open("wb") as f:
+        for pair, df in data.items():
+            columns = []
+            for position, name in enumerate(df.columns):
+                col = df.iloc[:, position]
+                tz = None
+                if isinstance(col.dtype, DatetimeTZDtype):
+                    tz = str(col.dtype.tz)
+                    values = col.to_numpy(dtype="datetime64[ns]")
+                elif isinstance(col.dtype, np.dtype) and col.dtype.kind in "biufcmM":
+                    values = col.to_numpy()
+                else:
+                    objects.setdefault(pair, {})[position] = col.array
+                    columns.append({"name": name, "offset": None})
+                    continue
+
+                padding = -offset % ARENA_ALIGNMENT
+                f.write(b"\0" * padding)
+                offset += padding
+                np.ascontiguousarray(values).tofile(f)
+                columns.append(
+                    {"name": name, "dtype": values.dtype.str, "tz": tz, "offset": offset}
+                )
+                offset += values.nbytes
+
+            if isinstance(df.index, RangeIndex):
+                index = [df.index.start, df.index.stop, df.index.step]
+            else:
+                objects.setdefault(pair, {})["index"] = df.index
+                index = None
+            manifest["pairs"][pair] = {"rows": len(df), "index": index, "columns": columns}
+
+    with manifest_file.open("w") as f:
+        rapidjson.dump(manifest, f)
+    if objects:
+        dump(objects, objects_file)
+    elif objects_file.is_file():
+        objects_file.unlink()
+
+
+def load_dataframes(filename: Path) -> Dict[str, DataFrame]:
+    """
+    Load dataframes stored with dump_dataframes().
+    Numeric columns are read-only views into the memory-mapped arena file.
+    :param filename: Arena file
+    :return: Dict of pair -> dataframe
+    """
+    arena_file, manifest_file, objects_file = get_data_files(filename)
+    with manifest_file.open("r") as f:
+        manifest = rapidjson.load(f)
+    arena = np.memmap(arena_file, mode="r") if arena_file.stat().st_size else None
+    objects = load(objects_file) if objects_file.is_file() else {}
+
+    data: Dict[str, DataFrame] = {}
+    for pair, pair_meta in manifest["pairs"].items():
+        rows = pair_meta["rows"]
+        arrays = []
+        for position, col in enumerate(pair_meta["columns"]):
+            if col["offset"] is None:
+                arrays.append(objects[pair][position])
+                continue
+            dtype = np.dtype(col["dtype"])
+            if rows:
+                values: Any = np.ndarray((rows,), dtype=dtype, buffer=arena, offset=col["offset"])
+            else:
+                values = np.empty(0, dtype=dtype)
+            if col["tz"]:
+                values = DatetimeArray(values, dtype=DatetimeTZDtype(tz=col["tz"]), copy=False)
+            arrays.append(values)
+
+        if pair_meta["index"] is not None:
+            index = RangeIndex(*pair_meta["index"])
+        else:
+            index = objects[pair]["index"]
+        df = DataFrame(dict(enumerate(arrays)), index=index, copy=False)
+        df.columns = [col["name"] for col in pair_meta["columns"]]
+        data[pair] = df
+    return data
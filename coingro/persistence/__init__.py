@@ -2,4 +2,4 @@
 
 from coingro.persistence.models import cleanup_db, init_db
 from coingro.persistence.pairlock_middleware import PairLocks
-from coingro.persistence.trade_model import LocalTrade, Order, Trade
+from coingro.persistence.trade_model import LocalOrder, LocalTrade, Order, Trade
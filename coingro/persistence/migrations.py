@@ -2,6 +2,7 @@ import logging
 from typing import List
 
 from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from coingro.exceptions import OperationalException
 
@@ -298,6 +299,45 @@ def fix_old_dry_orders(engine):
         )
 
 
+def create_index(engine, index) -> None:
+    """
+    Create an index on an existing table.
+    On PostgreSQL, the index is built concurrently, so writes of other bots sharing the
+    database are not blocked while it is built.
+    """
+    if engine.dialect.name != "postgresql":
+        index.create(bind=engine, checkfirst=True)
+        return
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    index.dialect_options["postgresql"]["concurrently"] = True
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            index.create(bind=connection, checkfirst=True)
+    finally:
+        index.dialect_options["postgresql"]["concurrently"] = False
+
+
+def create_missing_indexes(engine, decl_base) -> None:
+    """
+    Create indexes which were added to existing tables.
+    create_all() only creates indexes together with their table.
+    Failures (e.g. as another bot sharing the database created the index at the same time)
+    are logged only - the indexes are not required for the bot to work.
+    """
+    inspector = inspect(engine)
+    for table in decl_base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                logger.info(f"Creating index {index.name} on {table.name}.")
+                try:
+                    create_index(engine, index)
+                except (OperationalError, ProgrammingError) as e:
+                    logger.warning(f"Could not create index {index.name} on {table.name}: {e}")
+
+
 def check_migrate(engine, decl_base, previous_tables) -> None:
     """
     Checks if migration is necessary and migrates if necessary
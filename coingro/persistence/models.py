@@ -12,9 +12,13 @@ from sqlalchemy.pool import StaticPool
 from sqlalchemy_utils import create_database, database_exists
 
 from coingro.exceptions import OperationalException, TemporaryError
+from coingro.metrics import DB_QUERY_DURATION, registry
 from coingro.misc import retrier
 from coingro.persistence.base import _DECL_BASE
-from coingro.persistence.migrations import set_sqlite_to_wal  # check_migrate
+from coingro.persistence.migrations import (  # check_migrate
+    create_missing_indexes,
+    set_sqlite_to_wal,
+)
 from coingro.persistence.pairlock import PairLock
 from coingro.persistence.pairlock import set_dry_run as set_pairlock_dry_run
 from coingro.persistence.trade_model import Order, Trade
@@ -88,6 +92,20 @@ def ping_connection(connection, branch):
             connection.should_close_with_result = save_should_close_with_result
 
 
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start_time"] = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    Record the query duration, by statement type (SELECT, INSERT, ...)
+    """
+    start = conn.info.pop("query_start_time", None)
+    if start is not None:
+        statement_type = statement.split(None, 1)[0].upper() if statement else ""
+        registry.observe(DB_QUERY_DURATION, time.perf_counter() - start, statement=statement_type)
+
+
 def init_db(db_url: str, dry_run: bool) -> None:
     """
     Initializes this module with the given config,
@@ -125,22 +143,32 @@ def init_db(db_url: str, dry_run: bool) -> None:
         )
 
     event.listen(engine, "engine_connect", ping_connection)
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
 
     set_trade_dry_run(dry_run)
     set_pairlock_dry_run(dry_run)
 
     create_db(db_url)
 
+    session_factory = sessionmaker(bind=engine, autoflush=True)
+    # Keep the cached trade statistics in sync with the database
+    Trade.reset_trade_statistics()
+    event.listen(session_factory, "after_flush", Trade.update_trade_statistics)
+    event.listen(session_factory, "after_rollback", Trade.rollback_trade_statistics)
+    event.listen(session_factory, "after_commit", Trade.commit_trade_statistics)
+
     # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
     # Scoped sessions proxy requests to the appropriate thread-local session.
     # We should use the scoped_session object - not a seperately initialized version
-    Trade._session = scoped_session(sessionmaker(bind=engine, autoflush=True))
+    Trade._session = scoped_session(session_factory)
     Trade.query = Trade._session.query_property()
     Order.query = Trade._session.query_property()
     PairLock.query = Trade._session.query_property()
 
     # previous_tables = inspect(engine).get_table_names()
     _DECL_BASE.metadata.create_all(engine)
+    create_missing_indexes(engine, _DECL_BASE)
     # check_migrate(engine, decl_base=_DECL_BASE, previous_tables=previous_tables)
     set_sqlite_to_wal(engine)
 
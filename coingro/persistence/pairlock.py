@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, or_
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, or_
 from sqlalchemy.orm import Query
 
 from coingro import __id__
@@ -26,6 +26,16 @@ class PairLock(_DECL_BASE):
     """
 
     __tablename__ = "pairlocks"
+    # Active locks of one bot - see query_pair_locks()
+    __table_args__ = (
+        Index(
+            "ix_pairlocks_bot_id_dry_run_active_lock_end_time",
+            "bot_id",
+            "dry_run",
+            "active",
+            "lock_end_time",
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     bot_id = Column(String(255), nullable=False, default=__id__, index=True)
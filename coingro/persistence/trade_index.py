@@ -0,0 +1,89 @@
+"""
+In-memory index of closed trades, used in backtesting and hyperopt.
+"""
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class _SortedTrades:
+    """
+    Trades sorted by close_date. Trades with equal close_date keep their insertion order.
+    """
+
+    def __init__(self) -> None:
+        self.close_dates: List[datetime] = []
+        self.trades: List[Any] = []
+        # Closed trades without close_date - never match a close_date filter
+        self.undated: List[Any] = []
+
+    def add(self, trade: Any) -> None:
+        if trade.close_date is None:
+            self.undated.append(trade)
+            return
+        if not self.close_dates or self.close_dates[-1] <= trade.close_date:
+            # Trades are usually closed in chronological order
+            self.close_dates.append(trade.close_date)
+            self.trades.append(trade)
+        else:
+            idx = bisect_right(self.close_dates, trade.close_date)
+            self.close_dates.insert(idx, trade.close_date)
+            self.trades.insert(idx, trade)
+
+    def get(self, close_date: Optional[datetime] = None) -> List[Any]:
+        """
+        :param close_date: Only return trades closed after this date
+        """
+        if close_date is None:
+            return self.trades + self.undated
+        return self.trades[bisect_right(self.close_dates, close_date) :]
+
+
+class LocalTradeIndex:
+    """
+    Index of closed LocalTrades, keyed by pair and sorted by close_date.
+    Lookback queries (e.g. from protections) cost O(log n + k) instead of scanning all trades.
+    """
+
+    def __init__(self, trades: Optional[List[Any]] = None) -> None:
+        """
+        :param trades: List of closed trades this index mirrors (LocalTrade.trades)
+        """
+        self.source: List[Any] = trades if trades is not None else []
+        self.count = 0
+        self.total_profit: float = 0
+        self._all = _SortedTrades()
+        self._pairs: Dict[str, _SortedTrades] = {}
+        for trade in self.source:
+            self.add(trade)
+
+    def is_current(self, trades: List[Any]) -> bool:
+        """
+        Check if this index still mirrors the given list of closed trades.
+        """
+        return self.source is trades and self.count == len(trades)
+
+    def add(self, trade: Any) -> None:
+        """
+        Add a closed trade to the index.
+        """
+        self.count += 1
+        self.total_profit += trade.close_profit_abs
+        self._all.add(trade)
+        if trade.pair not in self._pairs:
+            self._pairs[trade.pair] = _SortedTrades()
+        self._pairs[trade.pair].add(trade)
+
+    def get_trades(
+        self, pair: Optional[str] = None, close_date: Optional[datetime] = None
+    ) -> List[Any]:
+        """
+        Get closed trades, filtered by pair and / or close_date.
+        :param pair: Only return trades for this pair
+        :param close_date: Only return trades closed after this date
+        """
+        if pair:
+            if pair not in self._pairs:
+                return []
+            return self._pairs[pair].get(close_date)
+        return self._all.get(close_date)
@@ -2,20 +2,25 @@
 This module contains the class to persist trades into SQLite
 """
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from itertools import chain
+from threading import Lock
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import (
     Boolean,
     Column,
+    Date,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
+    case,
     desc,
     func,
 )
@@ -27,6 +32,8 @@ from coingro.enums import ExitType, TradingMode
 from coingro.exceptions import DependencyException, OperationalException
 from coingro.leverage import interest
 from coingro.persistence.base import _DECL_BASE
+from coingro.persistence.trade_index import LocalTradeIndex
+from coingro.persistence.trade_stats import TradeStatistics
 
 logger = logging.getLogger(__name__)
 __dry_run = True
@@ -41,55 +48,41 @@ def set_dry_run(dry_run: bool):
     __dry_run = dry_run
 
 
-class Order(_DECL_BASE):
+class LocalOrder:
     """
-    Order database model
-    Keeps a record of all orders placed on the exchange
-
-    One to many relationship with Trades:
-      - One trade can have many orders
-      - One Order can only be associated with one Trade
-
-    Mirrors CCXT Order structure
+    Order model without database backing.
+    Used in backtesting - must be aligned to Order model!
     """
 
-    __tablename__ = "orders"
-
-    # Uniqueness should be ensured over pair, order_id
-    # its likely that order_id is unique per Pair on some exchanges.
-    __table_args__ = (
-        UniqueConstraint("bot_id", "cg_pair", "order_id", name="_bot_order_pair_order_id"),
+    __slots__ = (
+        "id",
+        "cg_trade_id",
+        "cg_order_side",
+        "cg_pair",
+        "cg_is_open",
+        "order_id",
+        "status",
+        "symbol",
+        "order_type",
+        "side",
+        "price",
+        "average",
+        "amount",
+        "filled",
+        "remaining",
+        "cost",
+        "stop_price",
+        "order_date",
+        "order_filled_date",
+        "order_update_date",
+        "cg_fee_base",
     )
 
-    id = Column(Integer, primary_key=True)
-    bot_id = Column(String(255), nullable=False, default=__id__, index=True)
-    dry_run = Column(Boolean, nullable=False, default=_dry_run, index=True)
-    cg_trade_id = Column(Integer, ForeignKey("trades.id"), index=True)
-
-    trade = relationship("Trade", back_populates="orders")
-
-    # order_side can only be 'buy', 'sell' or 'stoploss'
-    cg_order_side: str = Column(String(25), nullable=False)
-    cg_pair: str = Column(String(25), nullable=False)
-    cg_is_open = Column(Boolean, nullable=False, default=True, index=True)
-
-    order_id: str = Column(String(255), nullable=False, index=True)
-    status = Column(String(255), nullable=True)
-    symbol = Column(String(25), nullable=True)
-    order_type: str = Column(String(50), nullable=True)
-    side = Column(String(25), nullable=True)
-    price = Column(Float, nullable=True)
-    average = Column(Float, nullable=True)
-    amount = Column(Float, nullable=True)
-    filled = Column(Float, nullable=True)
-    remaining = Column(Float, nullable=True)
-    cost = Column(Float, nullable=True)
-    stop_price = Column(Float, nullable=True)
-    order_date = Column(DateTime, nullable=True, default=datetime.utcnow)
-    order_filled_date = Column(DateTime, nullable=True)
-    order_update_date = Column(DateTime, nullable=True)
-
-    cg_fee_base = Column(Float, nullable=True)
+    def __init__(self, **kwargs):
+        for key in LocalOrder.__slots__:
+            setattr(self, key, None)
+        for key in kwargs:
+            setattr(self, key, kwargs[key])
 
     @property
     def order_date_utc(self) -> datetime:
@@ -149,6 +142,20 @@ class Order(_DECL_BASE):
                 self.order_filled_date = datetime.now(timezone.utc)
         self.order_update_date = datetime.now(timezone.utc)
 
+    def is_unchanged(self, order: Dict[str, Any]) -> bool:
+        """
+        Check if an open order from ccxt still matches the stored state.
+        Orders which are not (or no longer) open are always considered changed.
+        """
+        if self.status != "open" or order.get("status") != "open":
+            return False
+        return (
+            order.get("filled", self.filled) == self.filled
+            and order.get("remaining", self.remaining) == self.remaining
+            and order.get("price", self.price) == self.price
+            and order.get("amount", self.amount) == self.amount
+        )
+
     def to_ccxt_object(self) -> Dict[str, Any]:
         return {
             "id": self.order_id,
@@ -223,6 +230,59 @@ class Order(_DECL_BASE):
             trade.recalc_open_trade_value()
             trade.adjust_stop_loss(trade.open_rate, trade.stop_loss_pct, refresh=True)
 
+
+class Order(_DECL_BASE, LocalOrder):
+    """
+    Order database model
+    Keeps a record of all orders placed on the exchange
+
+    One to many relationship with Trades:
+      - One trade can have many orders
+      - One Order can only be associated with one Trade
+
+    Mirrors CCXT Order structure
+    """
+
+    __tablename__ = "orders"
+
+    # Uniqueness should be ensured over pair, order_id
+    # its likely that order_id is unique per Pair on some exchanges.
+    __table_args__ = (
+        UniqueConstraint("bot_id", "cg_pair", "order_id", name="_bot_order_pair_order_id"),
+        # Open orders of one bot - e.g. for Order.get_open_orders()
+        Index("ix_orders_bot_id_dry_run_cg_is_open", "bot_id", "dry_run", "cg_is_open"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    bot_id = Column(String(255), nullable=False, default=__id__, index=True)
+    dry_run = Column(Boolean, nullable=False, default=_dry_run, index=True)
+    cg_trade_id = Column(Integer, ForeignKey("trades.id"), index=True)
+
+    trade = relationship("Trade", back_populates="orders")
+
+    # order_side can only be 'buy', 'sell' or 'stoploss'
+    cg_order_side: str = Column(String(25), nullable=False)
+    cg_pair: str = Column(String(25), nullable=False)
+    cg_is_open = Column(Boolean, nullable=False, default=True, index=True)
+
+    order_id: str = Column(String(255), nullable=False, index=True)
+    status = Column(String(255), nullable=True)
+    symbol = Column(String(25), nullable=True)
+    order_type: str = Column(String(50), nullable=True)
+    side = Column(String(25), nullable=True)
+    price = Column(Float, nullable=True)
+    average = Column(Float, nullable=True)
+    amount = Column(Float, nullable=True)
+    filled = Column(Float, nullable=True)
+    remaining = Column(Float, nullable=True)
+    cost = Column(Float, nullable=True)
+    stop_price = Column(Float, nullable=True)
+    order_date = Column(DateTime, nullable=True, default=datetime.utcnow)
+    order_filled_date = Column(DateTime, nullable=True)
+    order_update_date = Column(DateTime, nullable=True)
+
+    cg_fee_base = Column(Float, nullable=True)
+
     @staticmethod
     def update_orders(orders: List["Order"], order: Dict[str, Any]):
         """
@@ -279,10 +339,14 @@ class LocalTrade:
     """
 
     use_db: bool = False
+    # Calculate trade values with floats instead of Decimal - set on trades created by backtesting
+    use_float_math: bool = False
     # Trades container for backtesting
     trades: List["LocalTrade"] = []
     trades_open: List["LocalTrade"] = []
     total_profit: float = 0
+    # Index of closed trades by pair and close_date
+    trade_index: LocalTradeIndex = LocalTradeIndex()
 
     id: int = 0
 
@@ -545,6 +609,7 @@ class LocalTrade:
         LocalTrade.trades = []
         LocalTrade.trades_open = []
         LocalTrade.total_profit = 0
+        LocalTrade.trade_index = LocalTradeIndex(LocalTrade.trades)
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
         """
@@ -741,6 +806,14 @@ class LocalTrade:
         Calculate the open_rate including open_fee.
         :return: Price in of the open trade incl. Fees
         """
+        if self.use_float_math:
+            float_open_trade = self.amount * self.open_rate
+            float_fees = float_open_trade * self.fee_open
+            if self.is_short:
+                return float_open_trade - float_fees
+            else:
+                return float_open_trade + float_fees
+
         open_trade = Decimal(self.amount) * Decimal(self.open_rate)
         fees = open_trade * Decimal(self.fee_open)
         if self.is_short:
@@ -785,6 +858,26 @@ class LocalTrade:
         else:
             return close_trade - fees
 
+    def _calc_close_trade_value_float(self, rate: float, trading_mode: TradingMode) -> float:
+        """
+        Float variant of calc_close_trade_value for spot and futures trades.
+        Only differs from the Decimal calculation by float rounding errors (a few ULP).
+        """
+        close_trade = self.amount * rate
+        fees = close_trade * self.fee_close
+        if self.is_short:
+            close_value = close_trade + fees
+        else:
+            close_value = close_trade - fees
+
+        if trading_mode == TradingMode.FUTURES:
+            funding_fees = self.funding_fees or 0.0
+            if self.is_short:
+                return close_value - funding_fees
+            else:
+                return close_value + funding_fees
+        return close_value
+
     def calc_close_trade_value(self, rate: float) -> float:
         """
         Calculate the Trade's close value including fees
@@ -794,8 +887,11 @@ class LocalTrade:
         if rate is None and not self.close_rate:
             return 0.0
 
-        amount = Decimal(self.amount)
         trading_mode = self.trading_mode or TradingMode.SPOT
+        if self.use_float_math and trading_mode in (TradingMode.SPOT, TradingMode.FUTURES):
+            return self._calc_close_trade_value_float(rate, trading_mode)
+
+        amount = Decimal(self.amount)
 
         if trading_mode == TradingMode.SPOT:
             return float(self._calc_base_close(amount, rate, self.fee_close))
@@ -907,15 +1003,12 @@ class LocalTrade:
         :param is_open: Only search for open orders?
         :return: latest Order object if it exists, else None
         """
-        orders = self.orders
-        if order_side:
-            orders = [o for o in self.orders if o.cg_order_side == order_side]
-        if is_open is not None:
-            orders = [o for o in orders if o.cg_is_open == is_open]
-        if len(orders) > 0:
-            return orders[-1]
-        else:
-            return None
+        for o in reversed(self.orders):
+            if (not order_side or o.cg_order_side == order_side) and (
+                is_open is None or o.cg_is_open == is_open
+            ):
+                return o
+        return None
 
     def select_filled_orders(self, order_side: Optional[str] = None) -> List["Order"]:
         """
@@ -1008,6 +1101,13 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and (pair or close_date):
+            # Closed trades are served from the index (sorted by close_date)
+            sel_trades = LocalTrade.get_trade_index().get_trades(pair=pair, close_date=close_date)
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.trades_open
@@ -1029,10 +1129,25 @@ class LocalTrade:
 
         return sel_trades
 
+    @staticmethod
+    def get_trade_index() -> LocalTradeIndex:
+        """
+        Get the index of closed trades - rebuilding it if LocalTrade.trades was modified directly.
+        """
+        if not LocalTrade.trade_index.is_current(LocalTrade.trades):
+            LocalTrade.trade_index = LocalTradeIndex(LocalTrade.trades)
+        return LocalTrade.trade_index
+
+    @staticmethod
+    def _add_closed_bt_trade(trade):
+        index = LocalTrade.get_trade_index()
+        LocalTrade.trades.append(trade)
+        index.add(trade)
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.trades_open.remove(trade)
-        LocalTrade.trades.append(trade)
+        LocalTrade._add_closed_bt_trade(trade)
         LocalTrade.total_profit += trade.close_profit_abs
 
     @staticmethod
@@ -1040,7 +1155,7 @@ class LocalTrade:
         if trade.is_open:
             LocalTrade.trades_open.append(trade)
         else:
-            LocalTrade.trades.append(trade)
+            LocalTrade._add_closed_bt_trade(trade)
 
     @staticmethod
     def get_open_trades() -> List[Any]:
@@ -1081,8 +1196,20 @@ class Trade(_DECL_BASE, LocalTrade):
     """
 
     __tablename__ = "trades"
+    # Composite indexes for the filters used by all trade queries of one bot
+    __table_args__ = (
+        Index("ix_trades_bot_id_dry_run_is_open", "bot_id", "dry_run", "is_open"),
+        Index("ix_trades_bot_id_dry_run_close_date", "bot_id", "dry_run", "close_date"),
+        Index("ix_trades_bot_id_dry_run_pair", "bot_id", "dry_run", "pair"),
+    )
 
     use_db: bool = True
+    use_float_math: bool = False
+
+    # Statistics of closed trades - maintained from session flushes, see update_trade_statistics
+    _trade_stats: Optional[TradeStatistics] = None
+    _trade_stats_generation = 0
+    _trade_stats_lock = Lock()
 
     id = Column(Integer, primary_key=True)
     bot_id = Column(String(255), nullable=False, default=__id__, index=True)
@@ -1273,9 +1400,7 @@ class Trade(_DECL_BASE, LocalTrade):
                 .scalar()
             )
         else:
-            total_profit = sum(
-                t.close_profit_abs for t in LocalTrade.get_trades_proxy(is_open=False)
-            )
+            total_profit = LocalTrade.get_trade_index().total_profit
         return total_profit or 0
 
     @staticmethod
@@ -1290,33 +1415,188 @@ class Trade(_DECL_BASE, LocalTrade):
                 Trade.query.with_entities(func.sum(Trade.stake_amount)).filter(*filters).scalar()
             )
         else:
-            total_open_stake_amount = sum(
-                t.stake_amount for t in LocalTrade.get_trades_proxy(is_open=True)
-            )
+            # Stake amounts of open trades change with position adjustments,
+            # so these are summed directly - there are at most max_open_trades of them.
+            total_open_stake_amount = sum(t.stake_amount for t in LocalTrade.trades_open)
         return total_open_stake_amount or 0
 
     @staticmethod
-    def get_overall_performance(minutes=None) -> List[Dict[str, Any]]:
+    def load_trade_statistics(start_date: Optional[datetime] = None) -> TradeStatistics:
         """
-        Returns List of dicts containing all Trades, including profit and trade count
+        Calculate statistics from the closed trades in the database.
         NOTE: Not supported in Backtesting.
+        :param start_date: Only include trades closed at or after this date
         """
-        filters = [Trade.bot_id == __id__, Trade.dry_run.is_(_dry_run()), Trade.is_open.is_(False)]
-        if minutes:
-            start_date = datetime.now(timezone.utc) - timedelta(minutes=minutes)
-            filters.append(Trade.close_date >= start_date)
-        pair_rates = (
+        trade_filter = [Trade.is_open.is_(False)]
+        if start_date is not None:
+            trade_filter.append(Trade.close_date >= start_date)
+        trades = Trade.get_trades(trade_filter, include_orders=False)
+        return TradeStatistics(trades.order_by(Trade.close_date, Trade.id))
+
+    @staticmethod
+    def get_trade_statistics() -> TradeStatistics:
+        """
+        Statistics of all closed trades.
+        Loaded from the database on first use, and updated as trades are closed.
+        NOTE: Not supported in Backtesting.
+        """
+        with Trade._trade_stats_lock:
+            if Trade._trade_stats is not None:
+                return Trade._trade_stats
+            generation = Trade._trade_stats_generation
+        trade_stats = Trade.load_trade_statistics()
+        with Trade._trade_stats_lock:
+            # Trades closed while loading may be missing - don't keep these statistics
+            if generation == Trade._trade_stats_generation:
+                Trade._trade_stats = trade_stats
+        return trade_stats
+
+    @staticmethod
+    def reset_trade_statistics() -> None:
+        """
+        Invalidate the statistics of closed trades - they'll be reloaded on next use.
+        """
+        with Trade._trade_stats_lock:
+            Trade._trade_stats = None
+            Trade._trade_stats_generation += 1
+
+    @staticmethod
+    def rebuild_trade_statistics() -> bool:
+        """
+        Reload the statistics of closed trades from the database.
+        NOTE: Not supported in Backtesting.
+        :return: False if the previous statistics didn't match the database
+        """
+        with Trade._trade_stats_lock:
+            previous = Trade._trade_stats
+        Trade.reset_trade_statistics()
+        trade_stats = Trade.get_trade_statistics()
+        return previous is None or previous.summary() == trade_stats.summary()
+
+    @staticmethod
+    def update_trade_statistics(session, flush_context) -> None:
+        """
+        Session after_flush listener.
+        Adds newly closed trades to the statistics, and invalidates them if included trades
+        were modified or deleted.
+        """
+        closed = []
+        open_ids = []
+        deleted = any(isinstance(obj, Trade) for obj in session.deleted)
+        for obj in chain(session.new, session.dirty):
+            if not isinstance(obj, Trade) or obj.bot_id != __id__ or obj.dry_run != _dry_run():
+                continue
+            if not obj.is_open:
+                closed.append(obj)
+            else:
+                open_ids.append(obj.id)
+        if not closed and not deleted and not open_ids:
+            return
+
+        with Trade._trade_stats_lock:
+            stats = Trade._trade_stats
+            # Modified open trades only matter if they were included as closed trades
+            invalidate = deleted or (
+                stats is not None and any(trade_id in stats.trade_ids for trade_id in open_ids)
+            )
+            if not closed and not invalidate:
+                return
+            # Changes are only final on commit
+            session.info["trade_stats_pending"] = True
+            Trade._trade_stats_generation += 1
+            if stats is None:
+                return
+            if invalidate or not all(
+                stats.add(trade)
+                for trade in sorted(closed, key=lambda t: (t.close_date or datetime.min, t.id))
+            ):
+                Trade._trade_stats = None
+
+    @staticmethod
+    def commit_trade_statistics(session) -> None:
+        """
+        Session after_commit listener.
+        """
+        session.info.pop("trade_stats_pending", None)
+
+    @staticmethod
+    def rollback_trade_statistics(session) -> None:
+        """
+        Session after_rollback listener.
+        Invalidates the statistics if they include changes which were rolled back.
+        """
+        if session.info.pop("trade_stats_pending", False):
+            Trade.reset_trade_statistics()
+
+    @staticmethod
+    def get_daily_profit(start_date: datetime) -> Dict[date, Dict[str, Any]]:
+        """
+        Returns closed trade profit aggregated per (UTC) close date, using one grouped query.
+        NOTE: Not supported in Backtesting.
+        :param start_date: Only trades closed at or after this date are included
+        :return: Dict of date -> dict with profit_abs, stake_amount and count.
+            stake_amount only includes trades with a close profit.
+        """
+        close_day = func.date(Trade.close_date, type_=Date)
+        filters = [
+            Trade.bot_id == __id__,
+            Trade.dry_run.is_(_dry_run()),
+            Trade.is_open.is_(False),
+            Trade.close_date >= start_date,
+        ]
+        daily_profit = (
             Trade.query.with_entities(
-                Trade.pair,
-                func.sum(Trade.close_profit).label("profit_sum"),
-                func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
-                func.count(Trade.pair).label("count"),
+                close_day,
+                func.sum(Trade.close_profit_abs),
+                func.sum(case((Trade.close_profit_abs.isnot(None), Trade.stake_amount), else_=0)),
+                func.count(Trade.id),
             )
             .filter(*filters)
-            .group_by(Trade.pair)
-            .order_by(desc("profit_sum_abs"))
+            .group_by(close_day)
             .all()
         )
+        return {
+            # Some backends return the date as string
+            (day if isinstance(day, date) else date.fromisoformat(str(day))): {
+                "profit_abs": profit_abs or 0.0,
+                "stake_amount": stake_amount or 0.0,
+                "count": count,
+            }
+            for day, profit_abs, stake_amount, count in daily_profit
+        }
+
+    @staticmethod
+    def get_overall_performance(minutes=None) -> List[Dict[str, Any]]:
+        """
+        Returns List of dicts containing all Trades, including profit and trade count
+        Without minutes, this is served from the cached trade statistics.
+        NOTE: Not supported in Backtesting.
+        """
+        if minutes:
+            start_date = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+            filters = [
+                Trade.bot_id == __id__,
+                Trade.dry_run.is_(_dry_run()),
+                Trade.is_open.is_(False),
+                Trade.close_date >= start_date,
+            ]
+            pair_rates = (
+                Trade.query.with_entities(
+                    Trade.pair,
+                    func.sum(Trade.close_profit).label("profit_sum"),
+                    func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
+                    func.count(Trade.pair).label("count"),
+                )
+                .filter(*filters)
+                .group_by(Trade.pair)
+                .order_by(desc("profit_sum_abs"))
+                .all()
+            )
+        else:
+            pair_rates = [
+                (pair, perf.profit_ratio, perf.profit_abs, perf.count)
+                for pair, perf in Trade.get_trade_statistics().pair_performance()
+            ]
         return [
             {
                 "pair": pair,
@@ -1336,33 +1616,16 @@ class Trade(_DECL_BASE, LocalTrade):
         Can either be average for all pairs or a specific pair provided
         NOTE: Not supported in Backtesting.
         """
-
-        filters = [Trade.bot_id == __id__, Trade.dry_run.is_(_dry_run()), Trade.is_open.is_(False)]
-        if pair is not None:
-            filters.append(Trade.pair == pair)
-
-        enter_tag_perf = (
-            Trade.query.with_entities(
-                Trade.enter_tag,
-                func.sum(Trade.close_profit).label("profit_sum"),
-                func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
-                func.count(Trade.pair).label("count"),
-            )
-            .filter(*filters)
-            .group_by(Trade.enter_tag)
-            .order_by(desc("profit_sum_abs"))
-            .all()
-        )
-
+        enter_tag_perf = Trade.get_trade_statistics().tag_performance(False, pair)
         return [
             {
                 "enter_tag": enter_tag if enter_tag is not None else "Other",
-                "profit_ratio": profit,
-                "profit_pct": round(profit * 100, 2),
-                "profit_abs": profit_abs,
-                "count": count,
+                "profit_ratio": perf.profit_ratio,
+                "profit_pct": round(perf.profit_ratio * 100, 2),
+                "profit_abs": perf.profit_abs,
+                "count": perf.count,
             }
-            for enter_tag, profit, profit_abs, count in enter_tag_perf
+            for enter_tag, perf in enter_tag_perf
         ]
 
     @staticmethod
@@ -1372,33 +1635,16 @@ class Trade(_DECL_BASE, LocalTrade):
         Can either be average for all pairs or a specific pair provided
         NOTE: Not supported in Backtesting.
         """
-
-        filters = [Trade.bot_id == __id__, Trade.dry_run.is_(_dry_run()), Trade.is_open.is_(False)]
-        if pair is not None:
-            filters.append(Trade.pair == pair)
-
-        sell_tag_perf = (
-            Trade.query.with_entities(
-                Trade.exit_reason,
-                func.sum(Trade.close_profit).label("profit_sum"),
-                func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
-                func.count(Trade.pair).label("count"),
-            )
-            .filter(*filters)
-            .group_by(Trade.exit_reason)
-            .order_by(desc("profit_sum_abs"))
-            .all()
-        )
-
+        sell_tag_perf = Trade.get_trade_statistics().tag_performance(True, pair)
         return [
             {
                 "exit_reason": exit_reason if exit_reason is not None else "Other",
-                "profit_ratio": profit,
-                "profit_pct": round(profit * 100, 2),
-                "profit_abs": profit_abs,
-                "count": count,
+                "profit_ratio": perf.profit_ratio,
+                "profit_pct": round(perf.profit_ratio * 100, 2),
+                "profit_abs": perf.profit_abs,
+                "count": perf.count,
             }
-            for exit_reason, profit, profit_abs, count in sell_tag_perf
+            for exit_reason, perf in sell_tag_perf
         ]
 
     @staticmethod
@@ -0,0 +1,211 @@
+"""
+Incrementally maintained statistics of closed trades, used by the rpc handlers.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class PerformanceStats:
+    """
+    Profit aggregate of a group of closed trades (e.g. all trades of one pair).
+    """
+
+    __slots__ = ("profit_ratio", "profit_abs", "count")
+
+    def __init__(self) -> None:
+        self.profit_ratio = 0.0
+        self.profit_abs = 0.0
+        self.count = 0
+
+    def add(self, trade: Any) -> None:
+        self.profit_ratio += trade.close_profit or 0.0
+        self.profit_abs += trade.close_profit_abs or 0.0
+        self.count += 1
+
+
+def _win_loss(trade: Any) -> str:
+    if trade.close_profit > 0:
+        return "wins"
+    elif trade.close_profit < 0:
+        return "losses"
+    else:
+        return "draws"
+
+
+class TradeStatistics:
+    """
+    Aggregates of closed trades, updated one trade at a time.
+    Trades must be added in close_date order, as the drawdown is calculated from the
+    cumulative profit.
+    """
+
+    def __init__(self, trades: Iterable[Any] = ()) -> None:
+        """
+        :param trades: Closed trades, sorted by close_date
+        """
+        self.trade_ids: set = set()
+        self.closed_trade_count = 0
+        # (id, open_date) of the first and latest closed trade by id
+        self.first_trade: Optional[Tuple[int, datetime]] = None
+        self.latest_trade: Optional[Tuple[int, datetime]] = None
+        self.last_close_date: Optional[datetime] = None
+
+        # Only trades with an open_rate
+        self.profit_closed_coin = 0.0
+        self.profit_closed_ratio_sum = 0.0
+        self.profit_all_coin = 0.0
+        self.rated_trade_count = 0
+        self.duration_sum = 0.0
+        self.duration_count = 0
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.winning_profit = 0.0
+        self.losing_profit = 0.0
+
+        self.exit_reasons: Dict[str, Dict[str, int]] = {}
+        # outcome -> [sum of durations, count]
+        self.durations: Dict[str, List[float]] = {"wins": [0, 0], "draws": [0, 0], "losses": [0, 0]}
+
+        self.pairs: Dict[str, PerformanceStats] = {}
+        self.enter_tags: Dict[Tuple[str, Optional[str]], PerformanceStats] = {}
+        self.exit_reason_performance: Dict[Tuple[str, Optional[str]], PerformanceStats] = {}
+
+        # Drawdown state of the cumulative closed profit
+        self.cumulative_profit = 0.0
+        self.high_value: Optional[float] = None
+        self.max_drawdown_abs = 0.0
+        self.max_drawdown_high_value = 0.0
+
+        for trade in trades:
+            self.add(trade)
+
+    def add(self, trade: Any) -> bool:
+        """
+        Add a closed trade.
+        :return: False if the trade can't be added incrementally - as it's already included,
+            or closed before the latest included trade.
+        """
+        if trade.id in self.trade_ids:
+            return False
+        if trade.close_date is not None:
+            if self.last_close_date is not None and trade.close_date < self.last_close_date:
+                return False
+            self.last_close_date = trade.close_date
+
+        self.trade_ids.add(trade.id)
+        self.closed_trade_count += 1
+        if self.first_trade is None or trade.id < self.first_trade[0]:
+            self.first_trade = (trade.id, trade.open_date)
+        if self.latest_trade is None or trade.id > self.latest_trade[0]:
+            self.latest_trade = (trade.id, trade.open_date)
+
+        if trade.open_rate:
+            self._add_profit(trade)
+
+        outcome = _win_loss(trade)
+        if trade.exit_reason not in self.exit_reasons:
+            self.exit_reasons[trade.exit_reason] = {"wins": 0, "losses": 0, "draws": 0}
+        self.exit_reasons[trade.exit_reason][outcome] += 1
+        if trade.close_date is not None and trade.open_date is not None:
+            self.durations[outcome][0] += (trade.close_date - trade.open_date).total_seconds()
+            self.durations[outcome][1] += 1
+
+        self.pairs.setdefault(trade.pair, PerformanceStats()).add(trade)
+        key = (trade.pair, trade.enter_tag)
+        self.enter_tags.setdefault(key, PerformanceStats()).add(trade)
+        key = (trade.pair, trade.exit_reason)
+        self.exit_reason_performance.setdefault(key, PerformanceStats()).add(trade)
+
+        self.cumulative_profit += trade.close_profit_abs or 0.0
+        if self.high_value is None or self.cumulative_profit > self.high_value:
+            self.high_value = self.cumulative_profit
+        drawdown = self.high_value - self.cumulative_profit
+        if drawdown > self.max_drawdown_abs:
+            self.max_drawdown_abs = drawdown
+            self.max_drawdown_high_value = self.high_value
+        return True
+
+    def _add_profit(self, trade: Any) -> None:
+        self.profit_closed_coin += trade.close_profit_abs
+        self.profit_closed_ratio_sum += trade.close_profit
+        self.profit_all_coin += trade.calc_profit(rate=trade.close_rate or 0.0)
+        self.rated_trade_count += 1
+        if trade.close_date:
+            self.duration_sum += (trade.close_date - trade.open_date).total_seconds()
+            self.duration_count += 1
+        if trade.close_profit >= 0:
+            self.winning_trades += 1
+            self.winning_profit += trade.close_profit_abs
+        else:
+            self.losing_trades += 1
+            self.losing_profit += trade.close_profit_abs
+
+    def max_drawdown(self, starting_balance: float = 0) -> float:
+        """
+        Relative drawdown at the largest absolute drawdown.
+        Matches calculate_max_drawdown() for the closed trades.
+        """
+        if not self.max_drawdown_abs:
+            return 0.0
+        high_value = starting_balance + self.max_drawdown_high_value
+        if not high_value:
+            return float("inf")
+        return self.max_drawdown_abs / high_value
+
+    def average_durations(self) -> Dict[str, Optional[float]]:
+        """
+        Average trade duration in seconds, per outcome (wins, draws, losses)
+        """
+        return {
+            outcome: total / count if count > 0 else None
+            for outcome, (total, count) in self.durations.items()
+        }
+
+    def best_pair(self) -> Optional[Tuple[str, float]]:
+        """
+        :return: Tuple containing (pair, profit_sum) of the pair with the highest profit ratio sum
+        """
+        if not self.pairs:
+            return None
+        pair, perf = max(self.pairs.items(), key=lambda item: item[1].profit_ratio)
+        return pair, perf.profit_ratio
+
+    def pair_performance(self) -> List[Tuple[str, PerformanceStats]]:
+        """
+        :return: Performance per pair, sorted by absolute profit
+        """
+        return sorted(self.pairs.items(), key=lambda item: item[1].profit_abs, reverse=True)
+
+    def tag_performance(
+        self, by_exit_reason: bool, pair: Optional[str] = None
+    ) -> List[Tuple[Optional[str], PerformanceStats]]:
+        """
+        :param by_exit_reason: Group by exit_reason instead of enter_tag
+        :param pair: Only include trades of this pair
+        :return: Performance per tag, sorted by absolute profit
+        """
+        source = self.exit_reason_performance if by_exit_reason else self.enter_tags
+        tags: Dict[Optional[str], PerformanceStats] = {}
+        for (tag_pair, tag), perf in source.items():
+            if pair is not None and tag_pair != pair:
+                continue
+            total = tags.setdefault(tag, PerformanceStats())
+            total.profit_ratio += perf.profit_ratio
+            total.profit_abs += perf.profit_abs
+            total.count += perf.count
+        return sorted(tags.items(), key=lambda item: item[1].profit_abs, reverse=True)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Main aggregates, rounded - used to compare statistics for consistency.
+        """
+        return {
+            "closed_trade_count": self.closed_trade_count,
+            "profit_closed_coin": round(self.profit_closed_coin, 8),
+            "winning_trades": self.winning_trades,
+            "losing_trades": self.losing_trades,
+            "max_drawdown_abs": round(self.max_drawdown_abs, 8),
+            "pairs": {
+                pair: (perf.count, round(perf.profit_abs, 8)) for pair, perf in self.pairs.items()
+            },
+        }
@@ -5,6 +5,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.exceptions import HTTPException
+from fastapi.responses import PlainTextResponse
 
 from coingro import __version__
 from coingro.constants import SUPPORTED_FIAT, SUPPORTED_STAKE_CURRENCIES, USERPATH_STRATEGIES
@@ -69,7 +70,9 @@ logger = logging.getLogger(__name__)
 # 2.15: Add backtest history endpoints
 # 2.16: Additional daily metrics
 # 3.1: Add config update endpoints
-API_VERSION = 3.1
+# 3.2: Add stats rebuild endpoint
+# 3.3: Add metrics endpoint
+API_VERSION = 3.3
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -118,6 +121,11 @@ def stats(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_stats()
 
 
+@router.post("/stats/rebuild", response_model=StatusMsg, tags=["info"])
+def stats_rebuild(rpc: RPC = Depends(get_rpc)):
+    return rpc._rpc_rebuild_stats()
+
+
 @router.get("/daily", response_model=Daily, tags=["info"])
 def daily(timescale: int = 7, rpc: RPC = Depends(get_rpc), config=Depends(get_config)):
     return rpc._rpc_timeunit_profit(
@@ -379,6 +387,11 @@ def sysinfo():
     return RPC._rpc_sysinfo()
 
 
+@router.get("/metrics", response_class=PlainTextResponse, tags=["info"])
+def metrics():
+    return PlainTextResponse(RPC._rpc_metrics(), media_type="text/plain; version=0.0.4")
+
+
 @router.get("/health", response_model=Health, tags=["info"])
 def health(rpc: RPC = Depends(get_rpc)):
     return rpc._health()
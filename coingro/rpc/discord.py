@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict
 
+from requests import Session
+
 from coingro.enums.rpcmessagetype import RPCMessageType
 from coingro.rpc import RPC
 from coingro.rpc.webhook import Webhook
@@ -20,13 +22,7 @@ class Discord(Webhook):
         self._format = "json"
         self._retries = 1
         self._retry_delay = 0.1
-
-    def cleanup(self) -> None:
-        """
-        Cleanup pending module resources.
-        This will do nothing for webhooks, they will simply not be called anymore
-        """
-        pass
+        self._session = Session()
 
     def send_msg(self, msg) -> None:
         logger.info(f"Sending discord message: {msg}")
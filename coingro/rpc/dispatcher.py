@@ -0,0 +1,181 @@
+"""
+Non-blocking delivery of rpc messages to the rpc modules
+"""
+import logging
+from queue import Empty, Full, Queue
+from threading import Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+from coingro.enums import RPCMessageType
+from coingro.metrics import RPC_MESSAGES, registry
+from coingro.rpc.rpc import RPCHandler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RPC_QUEUE_SIZE = 1000
+
+# Bursts of these messages for the same trade are merged into one message
+COALESCED_MESSAGE_TYPES = (RPCMessageType.ENTRY_FILL, RPCMessageType.EXIT_FILL)
+
+_STOP = object()
+
+
+def _merge_fills(fills: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize fill messages of one trade in one message, based on the latest fill.
+    Entry fills describe a single order - amounts are summed up, and the open rate is averaged
+    over all fills. Exit fills describe the whole trade already.
+    """
+    merged = dict(fills[-1], fill_count=len(fills))
+    if merged["type"] == RPCMessageType.ENTRY_FILL:
+        amount = sum(fill.get("amount") or 0 for fill in fills)
+        if amount:
+            open_rate = (
+                sum((fill.get("amount") or 0) * (fill.get("open_rate") or 0) for fill in fills)
+                / amount
+            )
+            merged.update({"amount": amount, "open_rate": open_rate, "limit": open_rate})
+    return merged
+
+
+def coalesce_messages(msgs: List[Any]) -> List[Any]:
+    """
+    Merge fill messages of the same type and trade within a batch into one summary message,
+    delivered in place of the last of these fills. No fill is lost: `fill_count` holds the
+    number of merged fills, and their amounts are part of the summary.
+    """
+    fills: Dict[Tuple[RPCMessageType, Any], List[Dict[str, Any]]] = {}
+    for msg in msgs:
+        if isinstance(msg, dict) and msg.get("type") in COALESCED_MESSAGE_TYPES:
+            fills.setdefault((msg["type"], msg.get("trade_id")), []).append(msg)
+
+    result: List[Any] = []
+    for msg in msgs:
+        if isinstance(msg, dict) and msg.get("type") in COALESCED_MESSAGE_TYPES:
+            trade_fills = fills[(msg["type"], msg.get("trade_id"))]
+            if msg is not trade_fills[-1]:
+                continue
+            if len(trade_fills) > 1:
+                msg = _merge_fills(trade_fills)
+        result.append(msg)
+    return result
+
+
+class RPCDispatchQueue:
+    """
+    Delivers messages to one rpc module from a dedicated worker thread,
+    so slow or failing notification endpoints don't block the caller.
+    Messages are delivered in order. If the (bounded) queue is full, new messages are dropped.
+    A maxsize of 0 disables the worker thread - messages are then delivered synchronously.
+    Delivery statistics are exported as RPC_MESSAGES gauges, labeled by module and state.
+    """
+
+    def __init__(self, handler: RPCHandler, maxsize: int = DEFAULT_RPC_QUEUE_SIZE) -> None:
+        self.handler = handler
+        self._queue: Queue = Queue(maxsize=maxsize)
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._thread: Optional[Thread] = None
+        self._export_stats()
+        if maxsize > 0:
+            self._thread = Thread(target=self._run, name=f"rpc-{handler.name}", daemon=True)
+            self._thread.start()
+
+    def put(self, msg: Dict[str, Any]) -> bool:
+        """
+        Queue a message for delivery without blocking.
+        :return: False if the message was dropped as the queue is full
+        """
+        if not self._thread:
+            self._deliver(msg)
+            self._export_stats()
+            return True
+        try:
+            self._queue.put_nowait(msg)
+            return True
+        except Full:
+            self.dropped += 1
+            logger.warning(
+                f"rpc.{self.handler.name} queue is full, dropping message of type "
+                f"'{msg.get('type')}'."
+            )
+            return False
+        finally:
+            self._export_stats()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
+
+    def _export_stats(self) -> None:
+        for state, value in self.stats().items():
+            registry.set_gauge(RPC_MESSAGES, value, module=self.handler.name, state=state)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued messages have been delivered.
+        :return: False if the timeout expired before
+        """
+        if not self._thread:
+            return True
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Deliver queued messages and stop the worker thread.
+        """
+        if not self._thread:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except Full:
+            logger.warning(f"Could not deliver all messages to rpc.{self.handler.name}.")
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # Drain all waiting messages, so bursts of fills can be coalesced
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            msgs = coalesce_messages(batch)
+            self.coalesced += len(batch) - len(msgs)
+            stop = False
+            for msg in msgs:
+                if msg is _STOP:
+                    stop = True
+                    continue
+                self._deliver(msg)
+            self._export_stats()
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _deliver(self, msg: Dict[str, Any]) -> None:
+        logger.debug("Forwarding message to rpc.%s", self.handler.name)
+        try:
+            self.handler.send_msg(msg)
+            self.sent += 1
+        except NotImplementedError:
+            self.failed += 1
+            logger.error(
+                f"Message type '{msg['type']}' not implemented by handler {self.handler.name}."
+            )
+        except Exception:
+            self.failed += 1
+            logger.exception(f"Exception while sending message to rpc.{self.handler.name}.")
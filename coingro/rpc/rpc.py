@@ -13,7 +13,7 @@ import arrow
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import NAN, inf, int64, mean
+from numpy import NAN, inf, int64
 from pandas import DataFrame, NaT
 
 from coingro import __version__
@@ -28,12 +28,12 @@ from coingro.constants import (
     USERPATH_CONFIG,
 )
 from coingro.data.history import load_data
-from coingro.data.metrics import calculate_max_drawdown
 from coingro.enums import CandleType, ExitCheckTuple, ExitType, SignalDirection, State, TradingMode
 from coingro.exceptions import ExchangeError, PricingError
 from coingro.exchange import timeframe_to_minutes, timeframe_to_msecs
 from coingro.exchange.common import SUPPORTED_EXCHANGES
 from coingro.loggers import bufferHandler
+from coingro.metrics import registry
 from coingro.misc import decimals_per_coin, shorten_date
 from coingro.persistence import PairLocks, Trade
 from coingro.persistence.models import PairLock
@@ -300,15 +300,19 @@ class RPC:
                 columns.append("# Entries")
             return trades_list, columns, fiat_profit_sum
 
-    def _rpc_timeunit_profit(
+    def _timeunit_profit(
         self,
         timescale: int,
         stake_currency: str,
         fiat_display_currency: str,
-        timeunit: str = "days",
+        timeunit: str,
+        relative_to_volume: bool,
     ) -> Dict[str, Any]:
         """
+        Profit per timeunit, aggregated from a single query for all periods.
         :param timeunit: Valid entries are 'days', 'weeks', 'months'
+        :param relative_to_volume: Calculate the relative profit based on the traded stake
+            instead of the starting balance of the period
         """
         start_date = datetime.now(timezone.utc).date()
         if timeunit == "weeks":
@@ -322,37 +326,38 @@ class RPC:
                 return relativedelta(months=step)
             return timedelta(**{timeunit: step})
 
+        def period_start(day: date) -> date:
+            if timeunit == "weeks":
+                return day - timedelta(days=day.weekday())
+            if timeunit == "months":
+                return day.replace(day=1)
+            return day
+
         if not (isinstance(timescale, int) and timescale > 0):
             raise RPCException("timescale must be an integer greater than 0")
 
-        profit_units: Dict[date, Dict] = {}
-        daily_stake = self._coingro.wallets.get_total_stake_amount()
-
-        for day in range(0, timescale):
-            profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = (
-                Trade.query.session.query(Trade.close_profit_abs)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
-                .all()
-            )
+        profit_units: Dict[date, Dict] = {
+            start_date - time_offset(step): {"amount": 0.0, "volume": 0.0, "trades": 0}
+            for step in range(0, timescale)
+        }
+        first_day = min(profit_units)
+        daily_profit = Trade.get_daily_profit(
+            datetime(first_day.year, first_day.month, first_day.day)
+        )
+        for day, day_profit in daily_profit.items():
+            unit = profit_units.get(period_start(day))
+            if unit is not None:
+                unit["amount"] += day_profit["profit_abs"]
+                unit["volume"] += day_profit["stake_amount"]
+                unit["trades"] += day_profit["count"]
 
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
+        daily_stake = self._coingro.wallets.get_total_stake_amount()
+        for value in profit_units.values():
             # Calculate this periods starting balance
-            daily_stake = daily_stake - curdayprofit
-            profit_units[profitday] = {
-                "amount": curdayprofit,
-                "daily_stake": daily_stake,
-                "rel_profit": round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                "trades": len(trades),
-            }
+            daily_stake = daily_stake - value["amount"]
+            value["daily_stake"] = daily_stake
+            base = value["volume"] if relative_to_volume else daily_stake
+            value["rel_profit"] = round(value["amount"] / base, 8) if base > 0 else 0
 
         data = [
             {
@@ -375,7 +380,7 @@ class RPC:
             "data": data,
         }
 
-    def _rpc_timeunit_trade_profit(
+    def _rpc_timeunit_profit(
         self,
         timescale: int,
         stake_currency: str,
@@ -385,73 +390,24 @@ class RPC:
         """
         :param timeunit: Valid entries are 'days', 'weeks', 'months'
         """
-        start_date = datetime.now(timezone.utc).date()
-        if timeunit == "weeks":
-            # weekly
-            start_date = start_date - timedelta(days=start_date.weekday())  # Monday
-        if timeunit == "months":
-            start_date = start_date.replace(day=1)
-
-        def time_offset(step: int):
-            if timeunit == "months":
-                return relativedelta(months=step)
-            return timedelta(**{timeunit: step})
-
-        if not (isinstance(timescale, int) and timescale > 0):
-            raise RPCException("timescale must be an integer greater than 0")
-
-        profit_units: Dict[date, Dict] = {}
-        daily_stake = self._coingro.wallets.get_total_stake_amount()
-
-        for day in range(0, timescale):
-            profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = (
-                Trade.query.session.query(Trade.close_profit_abs, Trade.stake_amount)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
-                .all()
-            )
-
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
-            tradevolume = sum(
-                trade.stake_amount for trade in trades if trade.close_profit_abs is not None
-            )
-            # Calculate this periods starting balance
-            daily_stake = daily_stake - curdayprofit
-            profit_units[profitday] = {
-                "amount": curdayprofit,
-                "daily_stake": daily_stake,
-                "rel_profit": round(curdayprofit / tradevolume, 8) if tradevolume > 0 else 0,
-                "trades": len(trades),
-            }
+        return self._timeunit_profit(
+            timescale, stake_currency, fiat_display_currency, timeunit, relative_to_volume=False
+        )
 
-        data = [
-            {
-                "date": f"{key.year}-{key.month:02d}" if timeunit == "months" else key,
-                "abs_profit": value["amount"],
-                "starting_balance": value["daily_stake"],
-                "rel_profit": value["rel_profit"],
-                "fiat_value": self._fiat_converter.convert_amount(
-                    value["amount"], stake_currency, fiat_display_currency
-                )
-                if self._fiat_converter
-                else 0,
-                "trade_count": value["trades"],
-            }
-            for key, value in profit_units.items()
-        ]
-        return {
-            "stake_currency": stake_currency,
-            "fiat_display_currency": fiat_display_currency,
-            "data": data,
-        }
+    def _rpc_timeunit_trade_profit(
+        self,
+        timescale: int,
+        stake_currency: str,
+        fiat_display_currency: str,
+        timeunit: str = "days",
+    ) -> Dict[str, Any]:
+        """
+        Like _rpc_timeunit_profit, but with profit relative to the traded stake amount.
+        :param timeunit: Valid entries are 'days', 'weeks', 'months'
+        """
+        return self._timeunit_profit(
+            timescale, stake_currency, fiat_display_currency, timeunit, relative_to_volume=True
+        )
 
     def _rpc_trade_history(self, limit: int, offset: int = 0, order_by_id: bool = False) -> Dict:
         """Returns the X last trades"""
@@ -481,36 +437,11 @@ class RPC:
         """
         Generate generic stats for trades in database
         """
-
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
-                return "wins"
-            elif trade.close_profit < 0:
-                return "losses"
-            else:
-                return "draws"
-
-        trades: List[Trade] = Trade.get_trades([Trade.is_open.is_(False)], include_orders=False)
-        # Sell reason
-        exit_reasons = {}
-        for trade in trades:
-            if trade.exit_reason not in exit_reasons:
-                exit_reasons[trade.exit_reason] = {"wins": 0, "losses": 0, "draws": 0}
-            exit_reasons[trade.exit_reason][trade_win_loss(trade)] += 1
-
-        # Duration
-        dur: Dict[str, List[int]] = {"wins": [], "draws": [], "losses": []}
-        for trade in trades:
-            if trade.close_date is not None and trade.open_date is not None:
-                trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                dur[trade_win_loss(trade)].append(trade_dur)
-
-        wins_dur = sum(dur["wins"]) / len(dur["wins"]) if len(dur["wins"]) > 0 else None
-        draws_dur = sum(dur["draws"]) / len(dur["draws"]) if len(dur["draws"]) > 0 else None
-        losses_dur = sum(dur["losses"]) / len(dur["losses"]) if len(dur["losses"]) > 0 else None
-
-        durations = {"wins": wins_dur, "draws": draws_dur, "losses": losses_dur}
-        return {"exit_reasons": exit_reasons, "durations": durations}
+        trade_stats = Trade.get_trade_statistics()
+        exit_reasons = {
+            exit_reason: dict(counts) for exit_reason, counts in trade_stats.exit_reasons.items()
+        }
+        return {"exit_reasons": exit_reasons, "durations": trade_stats.average_durations()}
 
     def _rpc_trade_statistics(
         self,
@@ -519,61 +450,40 @@ class RPC:
         start_date: datetime = datetime.fromtimestamp(0),
     ) -> Dict[str, Any]:
         """Returns cumulative profit statistics"""
-        trade_filter = (
-            Trade.is_open.is_(False) & (Trade.close_date >= start_date)
-        ) | Trade.is_open.is_(True)
-        trades: List[Trade] = (
-            Trade.get_trades(trade_filter, include_orders=False).order_by(Trade.id).all()
+        if start_date > datetime.fromtimestamp(0):
+            trade_stats = Trade.load_trade_statistics(start_date)
+        else:
+            trade_stats = Trade.get_trade_statistics()
+        open_trades: List[Trade] = (
+            Trade.get_trades(Trade.is_open.is_(True), include_orders=False)
+            .order_by(Trade.id)
+            .all()
         )
 
-        profit_all_coin = []
-        profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
-        winning_profit = 0.0
-        losing_profit = 0.0
-
-        for trade in trades:
-            current_rate: float = 0.0
-
+        # Closed trades are aggregated in trade_stats
+        profit_open_coin = []
+        profit_open_ratio = []
+        for trade in open_trades:
             if not trade.open_rate:
                 continue
-            if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_ratio = trade.close_profit
-                profit_closed_coin.append(trade.close_profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if trade.close_profit >= 0:
-                    winning_trades += 1
-                    winning_profit += trade.close_profit_abs
-                else:
-                    losing_trades += 1
-                    losing_profit += trade.close_profit_abs
-            else:
-                # Get current rate
-                try:
-                    current_rate = self._coingro.exchange.get_rate(
-                        trade.pair, side="exit", is_short=trade.is_short, refresh=False
-                    )
-                except (PricingError, ExchangeError):
-                    current_rate = NAN
-                profit_ratio = trade.calc_profit_ratio(rate=current_rate)
-
-            profit_all_coin.append(trade.calc_profit(rate=trade.close_rate or current_rate))
-            profit_all_ratio.append(profit_ratio)
+            # Get current rate
+            try:
+                current_rate = self._coingro.exchange.get_rate(
+                    trade.pair, side="exit", is_short=trade.is_short, refresh=False
+                )
+            except (PricingError, ExchangeError):
+                current_rate = NAN
+            profit_open_ratio.append(trade.calc_profit_ratio(rate=current_rate))
+            profit_open_coin.append(trade.calc_profit(rate=trade.close_rate or current_rate))
 
-        best_pair = Trade.get_best_pair(start_date)
+        best_pair = trade_stats.best_pair()
         trading_volume = Trade.get_trading_volume(start_date)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        closed_count = trade_stats.rated_trade_count
+        profit_closed_coin_sum = round(trade_stats.profit_closed_coin, 8)
+        profit_closed_ratio_sum = trade_stats.profit_closed_ratio_sum
+        profit_closed_ratio_mean = profit_closed_ratio_sum / closed_count if closed_count else 0.0
 
         profit_closed_fiat = (
             self._fiat_converter.convert_amount(
@@ -583,10 +493,11 @@ class RPC:
             else 0
         )
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        all_count = closed_count + len(profit_open_ratio)
+        profit_all_coin_sum = round(trade_stats.profit_all_coin + sum(profit_open_coin), 8)
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
+        profit_all_ratio_sum = profit_closed_ratio_sum + sum(profit_open_ratio)
+        profit_all_ratio_mean = profit_all_ratio_sum / all_count if all_count else 0.0
         starting_balance = self._coingro.wallets.get_starting_balance()
         profit_closed_ratio_fromstart = 0
         profit_all_ratio_fromstart = 0
@@ -594,28 +505,12 @@ class RPC:
             profit_closed_ratio_fromstart = profit_closed_coin_sum / starting_balance
             profit_all_ratio_fromstart = profit_all_coin_sum / starting_balance
 
+        winning_profit = trade_stats.winning_profit
+        losing_profit = trade_stats.losing_profit
         profit_factor = winning_profit / abs(losing_profit) if losing_profit else float("inf")
 
-        trades_df = DataFrame(
-            [
-                {
-                    "close_date": trade.close_date.strftime(DATETIME_PRINT_FORMAT),
-                    "profit_abs": trade.close_profit_abs,
-                }
-                for trade in trades
-                if not trade.is_open
-            ]
-        )
-        max_drawdown_abs = 0.0
-        max_drawdown = 0.0
-        if len(trades_df) > 0:
-            try:
-                (max_drawdown_abs, _, _, _, _, max_drawdown) = calculate_max_drawdown(
-                    trades_df, value_col="profit_abs", starting_balance=starting_balance
-                )
-            except ValueError:
-                # ValueError if no losing trade.
-                pass
+        max_drawdown_abs = trade_stats.max_drawdown_abs
+        max_drawdown = trade_stats.max_drawdown(starting_balance)
 
         profit_all_fiat = (
             self._fiat_converter.convert_amount(
@@ -625,9 +520,17 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date if trades else None
-        last_date = trades[-1].open_date if trades else None
-        num = float(len(durations) or 1)
+        # (id, open_date) of the first and the latest trade
+        trades_by_id = [trade_stats.first_trade, trade_stats.latest_trade]
+        if open_trades:
+            trades_by_id += [
+                (open_trades[0].id, open_trades[0].open_date),
+                (open_trades[-1].id, open_trades[-1].open_date),
+            ]
+        trades_by_id = [t for t in trades_by_id if t is not None]
+        first_date = min(trades_by_id)[1] if trades_by_id else None
+        last_date = max(trades_by_id)[1] if trades_by_id else None
+        num = float(trade_stats.duration_count or 1)
         return {
             "profit_closed_coin": profit_closed_coin_sum,
             "profit_closed_percent_mean": round(profit_closed_ratio_mean * 100, 2),
@@ -645,24 +548,33 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
-            "closed_trade_count": len([t for t in trades if not t.is_open]),
+            "trade_count": trade_stats.closed_trade_count + len(open_trades),
+            "closed_trade_count": trade_stats.closed_trade_count,
             "first_trade_date": arrow.get(first_date).humanize() if first_date else "",
             "first_trade_timestamp": int(first_date.timestamp() * 1000) if first_date else 0,
             "latest_trade_date": arrow.get(last_date).humanize() if last_date else "",
             "latest_trade_timestamp": int(last_date.timestamp() * 1000) if last_date else 0,
-            "avg_duration": str(timedelta(seconds=sum(durations) / num)).split(".")[0],
+            "avg_duration": str(timedelta(seconds=trade_stats.duration_sum / num)).split(".")[0],
             "best_pair": best_pair[0] if best_pair else "",
             "best_rate": round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             "best_pair_profit_ratio": best_pair[1] if best_pair else 0,
-            "winning_trades": winning_trades,
-            "losing_trades": losing_trades,
+            "winning_trades": trade_stats.winning_trades,
+            "losing_trades": trade_stats.losing_trades,
             "profit_factor": profit_factor,
             "max_drawdown": max_drawdown,
             "max_drawdown_abs": max_drawdown_abs,
             "trading_volume": trading_volume,
         }
 
+    def _rpc_rebuild_stats(self) -> Dict[str, str]:
+        """
+        Handler to rebuild the cached trade statistics from the database.
+        """
+        if not Trade.rebuild_trade_statistics():
+            logger.warning("Cached trade statistics did not match the database.")
+            return {"status": "Rebuilt trade statistics. Cached statistics were inconsistent."}
+        return {"status": "Rebuilt trade statistics."}
+
     def _rpc_balance(self, stake_currency: str, fiat_display_currency: str) -> Dict:
         """Returns current account balance per crypto"""
         currencies: List[Dict] = []
@@ -1239,6 +1151,10 @@ class RPC:
             "ram_pct": psutil.virtual_memory().percent,
         }
 
+    @staticmethod
+    def _rpc_metrics() -> str:
+        return registry.render()
+
     def _health(self) -> Dict[str, Union[str, int]]:
         last_p = self._coingro.last_process
         return {
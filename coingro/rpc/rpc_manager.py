@@ -6,9 +6,13 @@ from typing import Any, Dict, List
 
 from coingro.enums import RPCMessageType
 from coingro.rpc import RPC, RPCHandler
+from coingro.rpc.dispatcher import DEFAULT_RPC_QUEUE_SIZE, RPCDispatchQueue
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for pending messages to be delivered on shutdown
+RPC_SHUTDOWN_TIMEOUT = 10
+
 
 class RPCManager:
     """
@@ -50,18 +54,28 @@ class RPCManager:
             apiserver.add_rpc_handler(self._rpc)
             self.registered_modules.append(apiserver)
 
+        # Messages are delivered to each module from its own worker thread
+        queue_size = config.get("internals", {}).get("rpc_queue_size", DEFAULT_RPC_QUEUE_SIZE)
+        self._dispatch_queues: Dict[str, RPCDispatchQueue] = {
+            mod.name: RPCDispatchQueue(mod, queue_size) for mod in self.registered_modules
+        }
+
     def cleanup(self) -> None:
         """Stops all enabled rpc modules"""
         logger.info("Cleaning up rpc modules ...")
         while self.registered_modules:
             mod = self.registered_modules.pop()
             logger.info("Cleaning up rpc.%s ...", mod.name)
+            dispatch_queue = self._dispatch_queues.pop(mod.name, None)
+            if dispatch_queue:
+                dispatch_queue.stop(timeout=RPC_SHUTDOWN_TIMEOUT)
             mod.cleanup()
             del mod
 
     def send_msg(self, msg: Dict[str, Any]) -> None:
         """
         Send given message to all registered rpc modules.
+        Messages are queued for delivery, this method does not wait for the modules.
         A message consists of one or more key value pairs of strings.
         e.g.:
         {
@@ -73,12 +87,9 @@ class RPCManager:
             msg.update(
                 {"base_currency": self._rpc._coingro.exchange.get_pair_base_currency(msg["pair"])}
             )
-        for mod in self.registered_modules:
-            logger.debug("Forwarding message to rpc.%s", mod.name)
-            try:
-                mod.send_msg(msg)
-            except NotImplementedError:
-                logger.error(f"Message type '{msg['type']}' not implemented by handler {mod.name}.")
+        for dispatch_queue in self._dispatch_queues.values():
+            # Modules may modify the message - so each gets its own copy
+            dispatch_queue.put(msg.copy())
 
     def startup_messages(self, config: Dict[str, Any], pairlist, protections) -> None:
         if config["dry_run"]:
@@ -306,6 +306,7 @@ class Telegram(RPCHandler):
 
         if msg["type"] in [RPCMessageType.ENTRY_FILL]:
             message += f"*Open Rate:* `{msg['open_rate']:.8f}`\n"
+            message += f"*Fills:* `{msg['fill_count']}`\n" if msg.get("fill_count") else ""
         elif msg["type"] in [RPCMessageType.ENTRY]:
             message += (
                 f"*Open Rate:* `{msg['limit']:.8f}`\n"
@@ -5,7 +5,7 @@ import logging
 import time
 from typing import Any, Dict
 
-from requests import RequestException, post
+from requests import RequestException, Session
 
 from coingro.enums import RPCMessageType
 from coingro.rpc import RPC, RPCHandler
@@ -31,13 +31,15 @@ class Webhook(RPCHandler):
         self._format = self._config["webhook"].get("format", "form")
         self._retries = self._config["webhook"].get("retries", 0)
         self._retry_delay = self._config["webhook"].get("retry_delay", 0.1)
+        # Reuse connections to the webhook endpoint
+        self._session = Session()
 
     def cleanup(self) -> None:
         """
         Cleanup pending module resources.
-        This will do nothing for webhooks, they will simply not be called anymore
+        Closes pooled connections, webhooks will simply not be called anymore
         """
-        pass
+        self._session.close()
 
     def send_msg(self, msg: Dict[str, Any]) -> None:
         """Send a message to telegram channel"""
@@ -91,11 +93,11 @@ class Webhook(RPCHandler):
 
             try:
                 if self._format == "form":
-                    response = post(self._url, data=payload)
+                    response = self._session.post(self._url, data=payload)
                 elif self._format == "json":
-                    response = post(self._url, json=payload)
+                    response = self._session.post(self._url, json=payload)
                 elif self._format == "raw":
-                    response = post(
+                    response = self._session.post(
                         self._url, data=payload["data"], headers={"Content-Type": "text/plain"}
                     )
                 else:
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Union
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple, Union
 
 from pandas import DataFrame
 
@@ -8,6 +9,8 @@ from coingro.exceptions import OperationalException
 from coingro.strategy.strategy_helper import merge_informative_pair
 
 PopulateIndicators = Callable[[Any, DataFrame, dict], DataFrame]
+# asset, timeframe, candle_type, date of the last candle, populate_indicators function
+InformativeCacheKey = Tuple[str, str, Optional[str], Optional[datetime], PopulateIndicators]
 
 
 @dataclass
@@ -115,8 +118,22 @@ def _create_and_merge_informative_pair(
             fmt = "{base}_{quote}_" + fmt  # Informatives of other pairs
 
     inf_metadata = {"pair": asset, "timeframe": timeframe}
-    inf_dataframe = strategy.dp.get_pair_dataframe(asset, timeframe, candle_type)
-    inf_dataframe = populate_indicators(strategy, inf_dataframe, inf_metadata)
+    # Informatives of the same asset are identical for all pairs analyzed together -
+    # populate them once, and only read from the cached dataframe afterwards.
+    # Candles are only copied for populating, not to look up the cache.
+    candles = strategy.dp.get_pair_dataframe(asset, timeframe, candle_type, copy=False)
+    cache_key: InformativeCacheKey = (
+        asset,
+        timeframe,
+        candle_type,
+        candles["date"].iloc[-1] if not candles.empty else None,
+        populate_indicators,
+    )
+    if cache_key in strategy._cg_informative_cache:
+        inf_dataframe = strategy._cg_informative_cache[cache_key]
+    else:
+        inf_dataframe = populate_indicators(strategy, candles.copy(), inf_metadata)
+        strategy._cg_informative_cache[cache_key] = inf_dataframe
 
     formatter: Any = None
     if callable(fmt):
@@ -132,7 +149,9 @@ def _create_and_merge_informative_pair(
         "asset": asset,
         "timeframe": timeframe,
     }
-    inf_dataframe.rename(columns=lambda column: formatter(column=column, **fmt_args), inplace=True)
+    inf_dataframe = inf_dataframe.rename(
+        columns=lambda column: formatter(column=column, **fmt_args), copy=False
+    )
 
     date_column = formatter(column="date", **fmt_args)
     if date_column in dataframe.columns:
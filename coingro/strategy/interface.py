@@ -3,12 +3,14 @@ IStrategy interface
 This module defines the interface to apply for strategies
 """
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
 import arrow
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from coingro.constants import ListPairsWithTimeframes
 from coingro.data.dataprovider import DataProvider
@@ -27,6 +29,7 @@ from coingro.exchange import timeframe_to_minutes, timeframe_to_next_date, timef
 from coingro.persistence import Order, PairLocks, Trade
 from coingro.strategy.hyper import HyperStrategyMixin
 from coingro.strategy.informative_decorator import (
+    InformativeCacheKey,
     InformativeData,
     PopulateIndicators,
     _create_and_merge_informative_pair,
@@ -94,6 +97,8 @@ class IStrategy(ABC, HyperStrategyMixin):
 
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
+    # analyze only new candles (plus startup_candle_count candles) - see analyze_ticker_incremental
+    incremental_analysis: bool = False
 
     use_exit_signal: bool = True
     exit_profit_only: bool = False
@@ -156,6 +161,12 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         # Gather informative pairs from @informative-decorated methods.
         self._cg_informative: List[Tuple[InformativeData, PopulateIndicators]] = []
+        # Populated informative dataframes, shared by all pairs analyzed together
+        self._cg_informative_cache: Dict[InformativeCacheKey, DataFrame] = {}
+        # Duration of the last analysis of each pair, in seconds
+        self.analysis_timings: Dict[str, float] = {}
+        self._analysis_executor: Optional[ThreadPoolExecutor] = None
+        self._analyzed_pending: Optional[Dict[str, DataFrame]] = None
         for attr_name in dir(self.__class__):
             cls_method = getattr(self.__class__, attr_name)
             if not callable(cls_method):
@@ -184,6 +195,14 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         self.cg_load_hyper_params(self.config.get("runmode") == RunMode.HYPEROPT)
 
+    def cg_bot_cleanup(self) -> None:
+        """
+        Release resources of the strategy - runs when the bot is stopped or reloaded.
+        """
+        if self._analysis_executor:
+            self._analysis_executor.shutdown(wait=False)
+            self._analysis_executor = None
+
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -786,6 +805,50 @@ class IStrategy(ABC, HyperStrategyMixin):
         dataframe = self.advise_exit(dataframe, metadata)
         return dataframe
 
+    def analyze_ticker_incremental(
+        self, dataframe: DataFrame, previous: DataFrame, metadata: dict
+    ) -> DataFrame:
+        """
+        Analyze only the candles of `dataframe` which are newer than the previous analysis.
+        Used instead of analyze_ticker() if `incremental_analysis` is enabled.
+        New candles are analyzed together with the `startup_candle_count` candles before them,
+        and appended to the previous analysis.
+        Can be overridden to update indicators based on the previous analysis.
+        :param dataframe: Dataframe containing data from exchange
+        :param previous: Previously analyzed dataframe - containing all candles of `dataframe`
+            except for the new ones.
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added,
+            covering the same candles as `dataframe`
+        """
+        logger.debug("Incremental TA Analysis Launched")
+        new_candles = int((dataframe["date"] > previous["date"].iloc[-1]).sum())
+        tail = dataframe.iloc[-(new_candles + self.startup_candle_count) :].reset_index(drop=True)
+        tail = self.analyze_ticker(tail, metadata)
+        kept = previous.loc[previous["date"] >= dataframe["date"].iloc[0]]
+        return concat([kept, tail.iloc[-new_candles:]], ignore_index=True)
+
+    def _get_incremental_base(self, dataframe: DataFrame, pair: str) -> Optional[DataFrame]:
+        """
+        Get the previous analysis of this pair if incremental analysis can build on it.
+        It must cover all candles of `dataframe` before the new ones, without gaps.
+        """
+        if not self.incremental_analysis or not self.dp:
+            return None
+        previous, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if previous.empty or self._last_candle_seen_per_pair.get(pair) != previous.iloc[-1]["date"]:
+            return None
+        dates = dataframe["date"]
+        new_candles = int((dates > previous.iloc[-1]["date"]).sum())
+        if not 0 < new_candles <= len(dataframe) - self.startup_candle_count:
+            return None
+        kept_dates = previous.loc[previous["date"] >= dates.iloc[0], "date"]
+        if len(kept_dates) != len(dataframe) - new_candles or not (
+            kept_dates.to_numpy() == dates.iloc[: len(kept_dates)].to_numpy()
+        ).all():
+            return None
+        return previous
+
     def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -804,15 +867,23 @@ class IStrategy(ABC, HyperStrategyMixin):
             or self._last_candle_seen_per_pair.get(pair, None) != dataframe.iloc[-1]["date"]
         ):
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            previous = self._get_incremental_base(dataframe, pair)
+            if previous is not None:
+                dataframe = self.analyze_ticker_incremental(dataframe, previous, metadata)
+            else:
+                dataframe = self.analyze_ticker(dataframe, metadata)
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
             if self.dp:
-                self.dp._set_cached_df(
-                    pair,
-                    self.timeframe,
-                    dataframe,
-                    candle_type=self.config.get("candle_type_def", CandleType.SPOT),
-                )
+                if self._analyzed_pending is not None:
+                    # Parallel analysis - stored by analyze() once all pairs are analyzed
+                    self._analyzed_pending[pair] = dataframe
+                else:
+                    self.dp._set_cached_df(
+                        pair,
+                        self.timeframe,
+                        dataframe,
+                        candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                    )
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
             dataframe[SignalType.ENTER_LONG.value] = 0
@@ -861,10 +932,46 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: List[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `internals.analysis_workers` > 1, pairs are analyzed concurrently on a thread pool.
+        Analyzed dataframes are then stored in the dataprovider in pair order, after all pairs
+        have been analyzed - until then, dp.get_analyzed_dataframe() returns the dataframes of
+        the previous iteration, also for pairs already analyzed in this one.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
+        self._cg_informative_cache.clear()
+        self.analysis_timings = {}
+        workers = self.config.get("internals", {}).get("analysis_workers", 1)
+        if workers > 1 and len(pairs) > 1:
+            if not self._analysis_executor:
+                self._analysis_executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="analyze"
+                )
+            self._analyzed_pending = {}
+            try:
+                # Consume results to propagate exceptions
+                list(self._analysis_executor.map(self._timed_analyze_pair, pairs))
+                candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+                for pair in pairs:
+                    if pair in self._analyzed_pending and self.dp:
+                        self.dp._set_cached_df(
+                            pair, self.timeframe, self._analyzed_pending[pair], candle_type
+                        )
+            finally:
+                self._analyzed_pending = None
+        else:
+            for pair in pairs:
+                self._timed_analyze_pair(pair)
+        self._cg_informative_cache.clear()
+
+    def _timed_analyze_pair(self, pair: str) -> None:
+        """
+        Run analyze_pair(), recording its duration in `analysis_timings`.
+        """
+        start = time.perf_counter()
+        try:
             self.analyze_pair(pair)
+        finally:
+            self.analysis_timings[pair] = time.perf_counter() - start
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
@@ -1293,10 +1400,13 @@ class IStrategy(ABC, HyperStrategyMixin):
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
         """
-        return {
+        self._cg_informative_cache.clear()
+        result = {
             pair: self.advise_indicators(pair_data.copy(), {"pair": pair}).copy()
             for pair, pair_data in data.items()
         }
+        self._cg_informative_cache.clear()
+        return result
 
     def advise_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -6,7 +6,7 @@ import time
 import traceback
 from os import getpid
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import sdnotify
 
@@ -14,6 +14,7 @@ from coingro import __env__, __version__
 from coingro.coingrobot import CoingroBot
 from coingro.configuration import Configuration
 from coingro.constants import (
+    CANDLE_CLOSE_OFFSET_SECS,
     DEFAULT_CONFIG_SAVE,
     PROCESS_THROTTLE_SECS,
     RETRY_TIMEOUT,
@@ -21,6 +22,8 @@ from coingro.constants import (
 )
 from coingro.enums import State
 from coingro.exceptions import ExchangeError, OperationalException, TemporaryError
+from coingro.exchange import timeframe_to_next_date
+from coingro.metrics import WORKER_DEADLINE, registry
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +70,7 @@ class Worker:
         internals_config = self._config.get("internals", {})
         self._throttle_secs = internals_config.get("process_throttle_secs", PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get("heartbeat_interval", 60)
+        self._timeframes = self._candle_timeframes()
 
         self._sd_notify = (
             sdnotify.SystemdNotifier()
@@ -127,7 +131,11 @@ class Worker:
             # Ping systemd watchdog before throttling
             self._notify("WATCHDOG=1\nSTATUS=State: RUNNING.")
 
-            self._throttle(func=self._process_running, throttle_secs=self._throttle_secs)
+            self._throttle(
+                func=self._process_running,
+                throttle_secs=self._throttle_secs,
+                timeframes=self._timeframes,
+            )
 
         if self._heartbeat_interval:
             now = time.time()
@@ -143,26 +151,67 @@ class Worker:
 
         return state
 
-    def _throttle(self, func: Callable[..., Any], throttle_secs: float, *args, **kwargs) -> Any:
+    def _candle_timeframes(self) -> List[str]:
+        """
+        Timeframes whose candle close should trigger an iteration -
+        the strategy timeframe and all informative timeframes.
+        """
+        strategy = self.coingro.strategy
+        timeframes = {strategy.timeframe}
+        timeframes.update(timeframe for _, timeframe, _ in strategy.gather_informative_pairs())
+        return sorted(timeframes)
+
+    def _throttle(
+        self,
+        func: Callable[..., Any],
+        throttle_secs: float,
+        *args,
+        timeframes: Optional[List[str]] = None,
+        **kwargs,
+    ) -> Any:
         """
         Throttles the given callable that it
         takes at least `min_secs` to finish execution.
+        With timeframes, sleeps until the next candle closed at most - so new candles
+        are processed right away instead of up to `throttle_secs` late.
         :param func: Any callable
         :param throttle_secs: throttling interation execution time limit in seconds
+        :param timeframes: Timeframes to align the iterations to (keyword only)
         :return: Any (result of execution of func)
         """
         self.last_throttle_start_time = time.time()
         logger.debug("========================================")
         result = func(*args, **kwargs)
-        time_passed = time.time() - self.last_throttle_start_time
-        sleep_duration = max(throttle_secs - time_passed, 0.0)
+        now = time.time()
+        time_passed = now - self.last_throttle_start_time
+        sleep_duration = throttle_secs - time_passed
+        # Deadlines of the next run of each phase: the regular tick (order management)
+        # and the close of the next candle (new signals)
+        registry.set_gauge(
+            WORKER_DEADLINE, now + max(sleep_duration, 0.0), phase="order_management"
+        )
+        if timeframes:
+            next_candle = min(timeframe_to_next_date(timeframe) for timeframe in timeframes)
+            registry.set_gauge(WORKER_DEADLINE, next_candle.timestamp(), phase="candle_close")
+            until_candle = next_candle.timestamp() - now
+            until_candle_offset = until_candle + CANDLE_CLOSE_OFFSET_SECS
+            if until_candle < sleep_duration < until_candle_offset:
+                # Don't wake up right before the exchange issued the new candle
+                sleep_duration = until_candle_offset
+            sleep_duration = min(sleep_duration, until_candle_offset)
+        sleep_duration = max(sleep_duration, 0.0)
         logger.debug(
             f"Throttling with '{func.__name__}()': sleep for {sleep_duration:.2f} s, "
             f"last iteration took {time_passed:.2f} s."
         )
-        time.sleep(sleep_duration)
+        self._sleep(sleep_duration)
         return result
 
+    @staticmethod
+    def _sleep(sleep_duration: float) -> None:
+        """Local sleep method - to improve testability"""
+        time.sleep(sleep_duration)
+
     def _process_stopped(self) -> None:
         self.coingro.process_stopped()
 
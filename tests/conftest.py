@@ -485,7 +485,7 @@ def get_default_conf(testdatadir):
         "strategy_path": str(Path(__file__).parent / "strategy" / "strats"),
         "strategy": CURRENT_TEST_STRATEGY,
         "disableparamexport": True,
-        "internals": {},
+        "internals": {"rpc_queue_size": 0},
         "export": "none",
         "candle_type_def": CandleType.SPOT,
     }
@@ -1,5 +1,6 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import re
 import uuid
@@ -18,6 +19,7 @@ from coingro.data.converter import ohlcv_to_dataframe
 from coingro.data.history.hdf5datahandler import HDF5DataHandler
 from coingro.data.history.history_utils import (
     _download_pair_history,
+    _download_pairs_history,
     _download_trades_history,
     _load_cached_data_for_updating,
     convert_trades_to_ohlcv,
@@ -32,6 +34,7 @@ from coingro.data.history.history_utils import (
 from coingro.data.history.idatahandler import IDataHandler, get_datahandler, get_datahandlerclass
 from coingro.data.history.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from coingro.enums import CandleType, TradingMode
+from coingro.exceptions import DependencyException
 from coingro.exchange import timeframe_to_minutes
 from coingro.misc import file_dump_json
 from coingro.resolvers import StrategyResolver
@@ -374,6 +377,9 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
     json_dump_mock = mocker.patch(
         "coingro.data.history.jsondatahandler.JsonDataHandler.ohlcv_store", return_value=None
     )
+    json_append_mock = mocker.patch(
+        "coingro.data.history.jsondatahandler.JsonDataHandler.ohlcv_append", return_value=None
+    )
     mocker.patch("coingro.exchange.Exchange.get_historic_ohlcv", return_value=tick)
     exchange = get_patched_exchange(mocker, default_conf)
     _download_pair_history(
@@ -397,7 +403,38 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Cached data is only appended to
+    assert json_dump_mock.call_count == 1
+    assert json_append_mock.call_count == 2
+
+
+def test_download_pair_history_append(mocker, default_conf, tmpdir) -> None:
+    candles = [[1511686200000 + i * 300000, 1.0, 1.0, 1.0, 1.0, float(i)] for i in range(10)]
+    exchange = get_patched_exchange(mocker, default_conf)
+    tmpdir1 = Path(tmpdir)
+    mocker.patch("coingro.exchange.Exchange.get_historic_ohlcv", return_value=candles[:5])
+    store_mock = mocker.spy(JsonDataHandler, "ohlcv_store")
+    append_mock = mocker.spy(JsonDataHandler, "ohlcv_append")
+    assert _download_pair_history(
+        datadir=tmpdir1, exchange=exchange, pair="MEME/BTC", timeframe="5m", candle_type="spot"
+    )
+    assert store_mock.call_count == 1
+    assert append_mock.call_count == 0
+
+    # Download restarts at the last cached candle - only newer candles are appended
+    mocker.patch("coingro.exchange.Exchange.get_historic_ohlcv", return_value=candles[2:])
+    assert _download_pair_history(
+        datadir=tmpdir1, exchange=exchange, pair="MEME/BTC", timeframe="5m", candle_type="spot"
+    )
+    assert store_mock.call_count == 1
+    assert append_mock.call_count == 1
+    appended = append_mock.call_args_list[0][1]["data"]
+    assert list(appended["volume"]) == [3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+
+    data = JsonDataHandler(tmpdir1).ohlcv_load(
+        "MEME/BTC", "5m", CandleType.SPOT, fill_missing=False, drop_incomplete=False
+    )
+    assert list(data["volume"]) == [float(i) for i in range(9)]
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmpdir) -> None:
@@ -561,7 +598,10 @@ def test_validate_backtest_data(default_conf, mocker, caplog, testdatadir) -> No
 def test_refresh_backtest_ohlcv_data(
     mocker, default_conf, markets, caplog, testdatadir, trademode, callcount
 ):
-    dl_mock = mocker.patch("coingro.data.history.history_utils._download_pair_history", MagicMock())
+    dl_mock = mocker.patch(
+        "coingro.data.history.history_utils._download_pairs_history",
+        MagicMock(return_value=[("XRP/BTC", "5m", "spot")]),
+    )
     mocker.patch("coingro.exchange.Exchange.markets", PropertyMock(return_value=markets))
     mocker.patch.object(Path, "exists", MagicMock(return_value=True))
     mocker.patch.object(Path, "unlink", MagicMock())
@@ -578,10 +618,57 @@ def test_refresh_backtest_ohlcv_data(
         trading_mode=trademode,
     )
 
-    assert dl_mock.call_count == callcount
+    # All downloads are handed to the download pipeline at once
+    assert dl_mock.call_count == 1
+    assert len(dl_mock.call_args[0][0]) == callcount
     assert dl_mock.call_args[1]["timerange"].starttype == "date"
 
     assert log_has("Downloading pair ETH/BTC, interval 1m.", caplog)
+    assert log_has("Could not download data for XRP/BTC, 5m, spot.", caplog)
+
+
+def test_download_pairs_history(mocker, default_conf, caplog, tmpdir) -> None:
+    candles = [[1511686200000 + i * 300000, 1.0, 1.0, 1.0, 1.0, float(i)] for i in range(10)]
+    failures = {"XRP/BTC": 1, "NEO/BTC": 10}
+    running = 0
+    max_running = 0
+
+    async def get_historic_ohlcv(pair, timeframe, since_ms, candle_type, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # Let other downloads start
+        await asyncio.sleep(0.05)
+        running -= 1
+        if failures.get(pair):
+            failures[pair] -= 1
+            raise DependencyException("Temporary failure")
+        return pair, timeframe, candle_type, candles
+
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch.object(exchange, "_async_get_historic_ohlcv", get_historic_ohlcv)
+    data_handler = get_datahandler(Path(tmpdir), "json")
+    downloads = [
+        (pair, tf, "spot")
+        for pair in ("ETH/BTC", "XRP/BTC", "LTC/BTC", "NEO/BTC")
+        for tf in ("5m", "1h")
+    ]
+    failed = _download_pairs_history(
+        downloads,
+        datadir=Path(tmpdir),
+        exchange=exchange,
+        data_handler=data_handler,
+        concurrency=3,
+    )
+    assert max_running == 3
+    # XRP/BTC succeeded on retry
+    assert failed == [("NEO/BTC", "5m", "spot"), ("NEO/BTC", "1h", "spot")]
+    assert log_has("Retrying 3 failed downloads.", caplog)
+    assert log_has_re(r"\(\d/8\) - Downloaded 10 candles for ETH/BTC, 5m, spot\.", caplog)
+
+    for pair, timeframe, candle_type in downloads:
+        data = data_handler.ohlcv_load(pair, timeframe, candle_type, warn_no_data=False)
+        assert data.empty == (pair == "NEO/BTC")
 
 
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
@@ -904,15 +991,65 @@ def test_jsondatahandler_trades_purge(mocker, testdatadir):
 
 
 @pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
-def test_datahandler_ohlcv_append(
-    datahandler,
-    testdatadir,
-):
-    dh = get_datahandler(testdatadir, datahandler)
-    with pytest.raises(NotImplementedError):
-        dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.SPOT)
-    with pytest.raises(NotImplementedError):
-        dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
+@pytest.mark.parametrize("candle_type", [CandleType.SPOT, CandleType.MARK])
+def test_datahandler_ohlcv_append(datahandler, candle_type, testdatadir, tmpdir):
+    data = get_datahandler(testdatadir, "json").ohlcv_load(
+        "UNITTEST/BTC", "5m", CandleType.SPOT, fill_missing=False, drop_incomplete=False
+    )
+    dh = get_datahandler(Path(tmpdir), datahandler)
+    # Nothing stored yet
+    dh.ohlcv_append("UNITTEST/ETH", "5m", data.iloc[:100], candle_type)
+    dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), candle_type)
+
+    # Overlapping candles are replaced
+    overlap = data.iloc[90:200].copy()
+    overlap.loc[overlap.index[:10], "volume"] = 1.0
+    dh.ohlcv_append("UNITTEST/ETH", "5m", overlap, candle_type)
+    dh.ohlcv_append("UNITTEST/ETH", "5m", data.iloc[200:], candle_type)
+
+    expected = data.copy()
+    expected.loc[expected.index[90:100], "volume"] = 1.0
+    loaded = dh.ohlcv_load(
+        "UNITTEST/ETH", "5m", candle_type, fill_missing=False, drop_incomplete=False
+    )
+    assert_frame_equal(loaded, expected)
+
+    assert dh.ohlcv_purge("UNITTEST/ETH", "5m", candle_type)
+    assert dh.ohlcv_load("UNITTEST/ETH", "5m", candle_type, warn_no_data=False).empty
+    assert not list(Path(tmpdir).rglob("UNITTEST_ETH*"))
+
+
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
+def test_jsondatahandler_ohlcv_append_chunks(datahandler, testdatadir, tmpdir, mocker):
+    mocker.patch.object(JsonDataHandler, "_max_ohlcv_chunks", 2)
+    data = get_datahandler(testdatadir, "json").ohlcv_load(
+        "UNITTEST/BTC", "5m", CandleType.SPOT, fill_missing=False, drop_incomplete=False
+    )
+    dh = get_datahandler(Path(tmpdir), datahandler)
+    filename = dh._pair_data_filename(Path(tmpdir), "UNITTEST/ETH", "5m", CandleType.SPOT)
+
+    dh.ohlcv_store("UNITTEST/ETH", "5m", data.iloc[:100], CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/ETH", "5m", data.iloc[100:150], CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/ETH", "5m", data.iloc[150:200], CandleType.SPOT)
+    assert [f.name for f in dh._ohlcv_chunk_files(filename)] == [
+        f"{filename.name}.part0001",
+        f"{filename.name}.part0002",
+    ]
+    assert dh.ohlcv_get_pairs(Path(tmpdir), "5m", CandleType.SPOT) == ["UNITTEST/ETH"]
+
+    # Chunks are merged into the main file
+    dh.ohlcv_append("UNITTEST/ETH", "5m", data.iloc[200:], CandleType.SPOT)
+    assert dh._ohlcv_chunk_files(filename) == []
+    loaded = dh.ohlcv_load(
+        "UNITTEST/ETH", "5m", CandleType.SPOT, fill_missing=False, drop_incomplete=False
+    )
+    assert_frame_equal(loaded, data)
+
+    # Storing replaces all chunks
+    dh.ohlcv_append("UNITTEST/ETH", "5m", data.iloc[-10:], CandleType.SPOT)
+    assert len(dh._ohlcv_chunk_files(filename)) == 1
+    dh.ohlcv_store("UNITTEST/ETH", "5m", data.iloc[:50], CandleType.SPOT)
+    assert dh._ohlcv_chunk_files(filename) == []
 
 
 @pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from coingro.data.converter import ohlcv_to_dataframe
+from coingro.enums import CandleType
+from coingro.exchange import timeframe_to_msecs
+from coingro.exchange.candle_store import CandleStore
+
+KEY = ("UNITTEST/BTC", "5m", CandleType.SPOT)
+TF_MS = timeframe_to_msecs("5m")
+START = 1_600_000_200_000 // TF_MS * TF_MS
+
+
+def make_candles(start_idx: int, count: int):
+    return [
+        [START + i * TF_MS, i, i + 2, i - 1, i + 1, 10 + i]
+        for i in range(start_idx, start_idx + count)
+    ]
+
+
+@pytest.mark.parametrize("drop_incomplete", [True, False])
+def test_candle_store_update(drop_incomplete) -> None:
+    store = CandleStore()
+    assert store.last_date(KEY) is None
+    candles = make_candles(0, 120)
+    store.update(KEY, candles, maxlen=100, incremental=False)
+    assert store.candle_count(KEY) == 100
+    assert store.last_date(KEY) == candles[-1][0]
+
+    df = store.get_dataframe(KEY, "5m", drop_incomplete=drop_incomplete)
+    expected = ohlcv_to_dataframe(
+        candles[-100:], "5m", KEY[0], fill_missing=True, drop_incomplete=drop_incomplete
+    )
+    pd.testing.assert_frame_equal(df, expected)
+    # Read-only view into the store
+    with pytest.raises(ValueError, match=r"read-only"):
+        df.loc[0, "close"] = 5
+    assert not df["close"].to_numpy().flags.writeable
+    assert np.shares_memory(df["close"].to_numpy(), store._buffers[KEY].values)
+
+    # Incomplete candle is replaced, new candles are added
+    nbytes = store.nbytes
+    candles[-1] = [candles[-1][0], 1, 5000, 0, 4000, 99]
+    candles.extend(make_candles(120, 3))
+    store.update(KEY, candles[-4:], maxlen=100, incremental=True)
+    new_df = store.get_dataframe(KEY, "5m", drop_incomplete=drop_incomplete)
+    expected_new = ohlcv_to_dataframe(
+        candles[-100:], "5m", KEY[0], fill_missing=True, drop_incomplete=drop_incomplete
+    )
+    pd.testing.assert_frame_equal(new_df, expected_new)
+    assert store.nbytes == nbytes
+
+    # Many updates - bounded memory, complete candles in old views are never overwritten
+    for i in range(123, 600, 7):
+        new_candles = make_candles(i - 1, 8)
+        store.update(KEY, new_candles, maxlen=100, incremental=True)
+        assert store.candle_count(KEY) == 100
+    assert store.nbytes == nbytes
+    pd.testing.assert_frame_equal(df.iloc[:-1], expected.iloc[:-1])
+    assert store.last_date(KEY) == new_candles[-1][0]
+
+    # Full refresh replaces all candles
+    store.update(KEY, make_candles(0, 10), maxlen=100, incremental=False)
+    assert store.candle_count(KEY) == 10
+    store.remove(KEY)
+    assert KEY not in store
+    assert store.nbytes == 0
+
+
+def test_candle_store_gaps() -> None:
+    store = CandleStore()
+    candles = make_candles(0, 20)
+    del candles[5:8]
+    store.update(KEY, candles, maxlen=100, incremental=False)
+    df = store.get_dataframe(KEY, "5m", drop_incomplete=True)
+    assert len(df) == 19
+    pd.testing.assert_frame_equal(
+        df, ohlcv_to_dataframe(candles, "5m", KEY[0], fill_missing=True, drop_incomplete=True)
+    )
+    # Cleaned candles are a copy
+    assert df["close"].to_numpy().flags.writeable
+
+    store.update(KEY, [], maxlen=100, incremental=False)
+    df = store.get_dataframe(KEY, "5m", drop_incomplete=True)
+    assert df.empty
+    assert list(df.columns) == ["date", "open", "high", "low", "close", "volume"]
@@ -3,6 +3,7 @@ import logging
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import isclose
+from pathlib import Path
 from random import randint
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
@@ -684,6 +685,88 @@ def test_reload_markets_exception(default_conf, mocker, caplog):
     assert log_has_re(r"Could not reload markets.*", caplog)
 
 
+def test_markets_cache(default_conf, mocker, tmpdir, caplog):
+    default_conf["user_data_dir"] = Path(tmpdir)
+    default_conf["trading_mode"] = "futures"
+    default_conf["margin_mode"] = "isolated"
+    default_conf["stake_currency"] = "USDT"
+    default_conf["exchange"]["markets_cache_ttl"] = 60
+    markets = {"ETH/USDT:USDT": {"id": "ETHUSDT", "symbol": "ETH/USDT:USDT"}}
+    currencies = {"ETH": {"id": "ETH", "code": "ETH"}}
+    tiers = {
+        "ETH/USDT:USDT": [
+            {
+                "minNotional": 0,
+                "maxNotional": 10000,
+                "maintenanceMarginRate": 0.01,
+                "maxLeverage": 75,
+                "info": {"cum": "0.0"},
+            }
+        ]
+    }
+    parsed_tiers = {
+        "ETH/USDT:USDT": [{"min": 0, "max": 10000, "mmr": 0.01, "lev": 75, "maintAmt": 0.0}]
+    }
+    api_mock = MagicMock()
+    api_mock.load_markets = MagicMock(return_value=markets)
+    api_mock.currencies = currencies
+    load_tiers = mocker.patch(
+        "coingro.exchange.binance.Binance.load_leverage_tiers", return_value=tiers
+    )
+
+    # No cache yet - markets are loaded from the exchange and cached
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, mock_markets=False)
+    cache_file = exchange._markets_cache.file
+    assert cache_file.parent == Path(tmpdir) / "markets_cache"
+    assert cache_file.is_file()
+    assert api_mock.load_markets.call_count == 1
+    assert load_tiers.call_count == 1
+    assert exchange._markets_refresh_thread is None
+
+    # Markets, currencies and parsed leverage tiers are loaded from the cache,
+    # and refreshed in the background.
+    api_mock.load_markets.reset_mock()
+    load_tiers.reset_mock()
+    api_mock.markets = markets
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, mock_markets=False)
+    assert log_has("Loaded 1 markets from the markets cache.", caplog)
+    api_mock.set_markets.assert_called_with(markets, currencies)
+    assert exchange.markets == markets
+    assert exchange._leverage_tiers == parsed_tiers
+    assert exchange._last_markets_refresh > 0
+    exchange._markets_refresh_thread.join()
+    api_mock.load_markets.assert_called_once_with(reload=True)
+    assert load_tiers.call_count == 1
+    assert exchange._leverage_tiers == parsed_tiers
+    assert log_has("Markets refreshed.", caplog)
+
+    # A different stake currency uses its own cache, and leaves the existing one alone
+    default_conf["stake_currency"] = "BUSD"
+    api_mock.set_markets.reset_mock()
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, mock_markets=False)
+    assert api_mock.set_markets.call_count == 0
+    assert exchange._markets_refresh_thread is None
+    assert exchange._markets_cache.file != cache_file
+    assert sorted(cache_file.parent.iterdir()) == sorted([cache_file, exchange._markets_cache.file])
+
+
+def test_markets_cache_expired(default_conf, mocker, tmpdir, caplog, time_machine):
+    start = datetime(2022, 4, 1, 12, 0, 0, tzinfo=timezone.utc)
+    time_machine.move_to(start, tick=False)
+    default_conf["user_data_dir"] = Path(tmpdir)
+    default_conf["exchange"]["markets_cache_ttl"] = 60
+    api_mock = MagicMock()
+    api_mock.load_markets = MagicMock(return_value={"ETH/BTC": {"symbol": "ETH/BTC"}})
+    api_mock.currencies = {}
+    get_patched_exchange(mocker, default_conf, api_mock, mock_markets=False)
+
+    time_machine.move_to(start + timedelta(minutes=61), tick=False)
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, mock_markets=False)
+    assert log_has("Markets cache is outdated (61 minutes old), ignoring it.", caplog)
+    assert api_mock.load_markets.call_count == 2
+    assert exchange._markets_refresh_thread is None
+
+
 @pytest.mark.parametrize("stake_currency", ["ETH", "BTC", "USDT"])
 def test_validate_stakecurrency(default_conf, stake_currency, mocker, caplog):
     default_conf["stake_currency"] = stake_currency
@@ -1899,6 +1982,15 @@ def test_get_tickers(default_conf, mocker, exchange_name):
     assert api_mock.fetch_tickers.call_count == 1
     assert api_mock.fetch_bids_asks.call_count == 0
 
+    # Tickers of selected pairs are neither read from nor stored in the cache
+    api_mock.fetch_tickers.reset_mock()
+    api_mock.fetch_tickers.return_value = {"ETH/BTC": tick["ETH/BTC"]}
+    assert exchange.get_tickers(symbols=["ETH/BTC"], cached=True) == {"ETH/BTC": tick["ETH/BTC"]}
+    api_mock.fetch_tickers.assert_called_once_with(["ETH/BTC"])
+    assert exchange.get_tickers(cached=True) == tickers
+    assert api_mock.fetch_tickers.call_count == 1
+    api_mock.fetch_tickers.return_value = tick
+
     ccxt_exceptionhandlers(
         mocker, default_conf, api_mock, exchange_name, "get_tickers", "fetch_tickers"
     )
@@ -2210,6 +2302,62 @@ def test_refresh_latest_ohlcv(mocker, default_conf, caplog, candle_type) -> None
         assert len(res) == 1
 
 
+@pytest.mark.parametrize("call_count", [1, 2])
+def test_refresh_latest_ohlcv_incremental(mocker, default_conf, caplog, call_count) -> None:
+    tf_ms = timeframe_to_msecs("5m")
+    start = int(date_minus_candles("5m", 1202).timestamp() * 1000)
+    candles = [[start + i * tf_ms, i, i + 2, i - 1, i + 1, 10 + i] for i in range(1200)]
+
+    async def fetch_ohlcv(pair, timeframe, since=None, limit=None, params={}):
+        if since is None:
+            return candles[-limit:]
+        return [c for c in candles if since <= c[0] < since + limit * tf_ms]
+
+    caplog.set_level(logging.DEBUG)
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange.required_candle_call_count = call_count
+    exchange._api_async.fetch_ohlcv = MagicMock(side_effect=fetch_ohlcv)
+    pair = ("IOTA/ETH", "5m", CandleType.SPOT)
+    window = exchange.ohlcv_candle_limit("5m", CandleType.SPOT) * call_count
+
+    exchange.refresh_latest_ohlcv([pair])
+    assert exchange._klines_store.candle_count(pair) == min(window, len(candles))
+    last_cached = candles[-1][0]
+
+    # Incomplete candle gets updated, 3 new candles arrive
+    candles[-1] = [last_cached, 1, 5000, 0, 4000, 99]
+    candles.extend(
+        [[last_cached + i * tf_ms, i, i + 2, i - 1, i + 1, 10 + i] for i in range(1, 4)]
+    )
+    exchange._api_async.fetch_ohlcv.reset_mock()
+    exchange._pairs_last_refresh_time = {}
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+    assert exchange._api_async.fetch_ohlcv.call_args[1]["since"] == last_cached
+    assert exchange._klines_store.candle_count(pair) == min(window, len(candles))
+
+    exchange._api_async.fetch_ohlcv.reset_mock()
+    full = exchange.refresh_latest_ohlcv([pair], cache=False)
+    assert exchange._api_async.fetch_ohlcv.call_count == call_count
+    assert res[pair].equals(full[pair])
+    assert res[pair].iloc[-1]["close"] == candles[-2][4]
+
+    # Time jump - cache is evicted and the full window downloaded again
+    mocker.patch.object(exchange._klines_store, "last_date", return_value=start)
+    exchange._api_async.fetch_ohlcv.reset_mock()
+    exchange._pairs_last_refresh_time = {}
+    exchange.refresh_latest_ohlcv([pair])
+    assert log_has_re(r"Time jump detected\. Evicting cache for IOTA/ETH, 5m.*", caplog)
+    assert exchange._api_async.fetch_ohlcv.call_count == call_count
+
+    # Disabled incremental refresh downloads the full window
+    exchange._ohlcv_incremental_refresh = False
+    exchange._api_async.fetch_ohlcv.reset_mock()
+    exchange._pairs_last_refresh_time = {}
+    exchange.refresh_latest_ohlcv([pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == call_count
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 async def test__async_get_candle_history(default_conf, mocker, caplog, exchange_name):
@@ -2655,6 +2803,78 @@ def test_get_exit_rate_exception(default_conf, mocker, is_short):
     assert exchange.get_rate(pair, refresh=True, side="exit", is_short=is_short) == 0.13
 
 
+def test_prefetch_rates_tickers(default_conf, mocker, caplog):
+    default_conf["exit_pricing"]["price_side"] = "bid"
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch("coingro.exchange.Exchange.exchange_has", return_value=True)
+    get_tickers = mocker.patch(
+        "coingro.exchange.Exchange.get_tickers",
+        return_value={
+            "ETH/BTC": {"ask": 0.13, "bid": 0.12, "last": 0.125},
+            "LTC/BTC": {"ask": 0.023, "bid": None, "last": 0.022},
+        },
+    )
+    fetch_ticker = mocker.patch(
+        "coingro.exchange.Exchange.fetch_ticker",
+        return_value={"ask": 0.024, "bid": 0.021, "last": 0.022},
+    )
+    # Single pairs are not worth a batch request
+    exchange.prefetch_rates(["ETH/BTC"], "exit")
+    assert get_tickers.call_count == 0
+
+    exchange.prefetch_rates(["ETH/BTC", "LTC/BTC", "XRP/BTC", "ETH/BTC"], "exit")
+    assert get_tickers.call_count == 1
+    assert get_tickers.call_args.kwargs["symbols"] == ["ETH/BTC", "LTC/BTC", "XRP/BTC"]
+    assert exchange.get_rate("ETH/BTC", side="exit", is_short=False, refresh=True) == 0.12
+    assert fetch_ticker.call_count == 0
+    # Missing bid side and missing pairs are fetched individually
+    assert exchange.get_rate("LTC/BTC", side="exit", is_short=False, refresh=True) == 0.021
+    assert exchange.get_rate("XRP/BTC", side="exit", is_short=False, refresh=True) == 0.021
+    assert fetch_ticker.call_count == 2
+
+    exchange.clear_rate_snapshot()
+    assert exchange.get_rate("ETH/BTC", side="exit", is_short=False, refresh=True) == 0.021
+    assert fetch_ticker.call_count == 3
+
+    get_tickers.side_effect = TemporaryError("Network down")
+    exchange.prefetch_rates(["ETH/BTC", "LTC/BTC"], "exit")
+    assert log_has("Could not prefetch tickers: Network down", caplog)
+    assert exchange._rate_snapshot["exit"] == {}
+
+
+def test_prefetch_rates_async(default_conf, mocker, caplog, order_book_l2):
+    default_conf["exit_pricing"]["price_side"] = "bid"
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch("coingro.exchange.Exchange.exchange_has", return_value=False)
+    fetch_ticker = mocker.patch(
+        "coingro.exchange.Exchange.fetch_ticker",
+        return_value={"ask": 0.024, "bid": 0.021, "last": 0.022},
+    )
+
+    def ticker(pair):
+        if pair == "LTC/BTC":
+            raise ccxt.NetworkError("Timeout")
+        return {"ask": 0.13, "bid": 0.12, "last": 0.125}
+
+    exchange._api_async.fetch_ticker = get_mock_coro(side_effect=ticker)
+    exchange.prefetch_rates(["ETH/BTC", "LTC/BTC"], "exit")
+    assert exchange._api_async.fetch_ticker.call_count == 2
+    assert log_has_re(r"Async request for LTC/BTC failed: NetworkError\('Timeout'\)", caplog)
+    assert exchange.get_rate("ETH/BTC", side="exit", is_short=False, refresh=True) == 0.12
+    assert exchange.get_rate("LTC/BTC", side="exit", is_short=False, refresh=True) == 0.021
+    assert fetch_ticker.call_count == 1
+
+    # Order books are always fetched concurrently
+    default_conf["exit_pricing"]["use_order_book"] = True
+    default_conf["exit_pricing"]["order_book_top"] = 1
+    fetch_l2_order_book = mocker.patch("coingro.exchange.Exchange.fetch_l2_order_book")
+    exchange._api_async.fetch_l2_order_book = get_mock_coro(return_value=order_book_l2())
+    exchange.prefetch_rates(["ETH/BTC", "LTC/BTC"], "exit")
+    assert exchange._api_async.fetch_l2_order_book.call_count == 2
+    assert exchange.get_rate("ETH/BTC", side="exit", is_short=False, refresh=True) == 0.043936
+    assert fetch_l2_order_book.call_count == 0
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 @pytest.mark.asyncio
 async def test___async_get_candle_history_sort(default_conf, mocker, exchange_name):
@@ -3316,6 +3536,51 @@ def test_fetch_order_or_stoploss_order(default_conf, mocker):
     assert fetch_stoploss_order_mock.call_args_list[0][0][1] == "ETH/BTC"
 
 
+def test_fetch_orders_bulk(default_conf, mocker, caplog):
+    default_conf["dry_run"] = False
+    api_mock = MagicMock()
+    api_mock.has = {"fetchOpenOrders": True}
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, id="binance")
+
+    def fetch_order(order_id, pair):
+        if order_id == "4":
+            raise ccxt.OrderNotFound("Order not found")
+        return {"id": order_id, "symbol": pair, "status": "closed"}
+
+    exchange._api_async.fetch_open_orders = get_mock_coro(
+        return_value=[
+            {"id": "1", "symbol": "ETH/BTC", "status": "open"},
+            {"id": "5", "symbol": "ETH/BTC", "status": "open"},
+        ]
+    )
+    exchange._api_async.fetch_order = get_mock_coro(side_effect=fetch_order)
+    orders = [("1", "ETH/BTC"), ("2", "ETH/BTC"), ("3", "XRP/BTC"), ("4", "LTC/BTC")]
+
+    result = exchange.fetch_orders_bulk(orders)
+    # One request for the open orders of ETH/BTC, all others are fetched individually
+    assert exchange._api_async.fetch_open_orders.call_count == 1
+    assert exchange._api_async.fetch_open_orders.call_args_list[0][0][0] == "ETH/BTC"
+    assert exchange._api_async.fetch_order.call_count == 3
+    assert result == {
+        "1": {"id": "1", "symbol": "ETH/BTC", "status": "open"},
+        "2": {"id": "2", "symbol": "ETH/BTC", "status": "closed"},
+        "3": {"id": "3", "symbol": "XRP/BTC", "status": "closed"},
+    }
+    assert log_has_re(r"Async request for 4 failed: OrderNotFound.*", caplog)
+
+    # Single orders and dry-run orders are not worth a bulk request
+    exchange._api_async.fetch_order.reset_mock()
+    assert exchange.fetch_orders_bulk(orders[:1]) == {}
+    exchange._config["dry_run"] = True
+    assert exchange.fetch_orders_bulk(orders) == {}
+    assert exchange._api_async.fetch_order.call_count == 0
+
+    exchange._config["dry_run"] = False
+    exchange._cg_has["stoploss_fetch_bulk"] = False
+    assert exchange.fetch_orders_bulk(orders, stoploss_order=True) == {}
+    assert len(exchange.fetch_orders_bulk(orders, stoploss_order=False)) == 3
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_name(default_conf, mocker, exchange_name):
     exchange = get_patched_exchange(mocker, default_conf, id=exchange_name)
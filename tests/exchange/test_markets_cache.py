@@ -0,0 +1,69 @@
+import gzip
+from pathlib import Path
+
+import rapidjson
+
+from coingro.exchange.markets_cache import MarketsCache
+from tests.conftest import log_has, log_has_re
+
+KEY = {"exchange": "binance", "sandbox": False, "trading_mode": "spot", "stake_currency": "BTC"}
+MARKETS = {"ETH/BTC": {"symbol": "ETH/BTC", "precision": {"amount": 0.001, "price": None}}}
+
+
+def test_markets_cache_disabled(tmpdir) -> None:
+    for cache in [MarketsCache(None, KEY, 3600), MarketsCache(Path(tmpdir), KEY, 0)]:
+        assert not cache.enabled
+        cache.save(MARKETS, {}, {}, {})
+        assert cache.load() is None
+    assert not list(Path(tmpdir).iterdir())
+
+
+def test_markets_cache_save_load(tmpdir) -> None:
+    cache = MarketsCache(Path(tmpdir) / "markets_cache", KEY, 3600)
+    assert cache.enabled
+    assert cache.load() is None
+
+    # Nothing to cache
+    cache.save({}, {}, {}, {})
+    assert cache.load() is None
+
+    cache.save(MARKETS, {"ETH": {"code": "ETH"}}, {"ETH/BTC": {"maker": 0.001}}, {})
+    data = cache.load()
+    assert data["markets"] == MARKETS
+    assert data["currencies"] == {"ETH": {"code": "ETH"}}
+    assert data["trading_fees"] == {"ETH/BTC": {"maker": 0.001}}
+    assert data["leverage_tiers"] == {}
+    assert [f for f in (Path(tmpdir) / "markets_cache").iterdir()] == [cache.file]
+    assert cache.file.name.startswith("binance_spot_")
+
+    # Settings of the same exchange and trading mode use their own cache file
+    other_cache = MarketsCache(Path(tmpdir) / "markets_cache", {**KEY, "sandbox": True}, 3600)
+    assert other_cache.file != cache.file
+    assert other_cache.load() is None
+    other_cache.save(MARKETS, {}, {}, {})
+    assert cache.load()["currencies"] == {"ETH": {"code": "ETH"}}
+    assert other_cache.load()["currencies"] == {}
+
+
+def test_markets_cache_invalid(tmpdir, caplog) -> None:
+    cache = MarketsCache(Path(tmpdir), KEY, 3600)
+    cache_file = cache.file
+    cache_file.write_text("not gzipped")
+    assert cache.load() is None
+    assert log_has_re(r"Could not read markets cache .*", caplog)
+
+    cache.save(MARKETS, {}, {}, {})
+    with gzip.open(cache_file) as fp:
+        data = rapidjson.load(fp)
+    data["version"] = 0
+    with gzip.open(cache_file, "w") as fp:
+        rapidjson.dump(data, fp)
+    assert cache.load() is None
+    assert log_has("Markets cache was created with different settings, ignoring it.", caplog)
+
+    # Data which can't be serialized does not replace the cache
+    cache.save({"ETH/BTC": {"info": object()}}, {}, {}, {})
+    assert log_has_re(r"Could not write markets cache .*", caplog)
+    assert [f for f in Path(tmpdir).iterdir()] == [cache_file]
+    with gzip.open(cache_file) as fp:
+        assert rapidjson.load(fp)["version"] == 0
@@ -23,6 +23,7 @@ from coingro.enums import ExitType, RunMode
 from coingro.exceptions import DependencyException, OperationalException
 from coingro.exchange.exchange import timeframe_to_next_date
 from coingro.optimize.backtest_caching import get_strategy_run_id
+from coingro.optimize.backtest_columnar import DetailCandles
 from coingro.optimize.backtesting import Backtesting
 from coingro.persistence import LocalTrade
 from coingro.resolvers import StrategyResolver
@@ -574,6 +575,9 @@ def test_backtest__enter_trade(default_conf, fee, mocker) -> None:
     trade = backtesting._enter_trade(pair, row=row, direction="long")
     assert isinstance(trade, LocalTrade)
     assert trade.stake_amount == 495
+    # Float math is limited to trades of the backtest
+    assert trade.use_float_math
+    assert not LocalTrade.use_float_math
 
     # Fake 2 trades, so there's not enough amount for the next trade left.
     LocalTrade.trades_open.append(trade)
@@ -866,6 +870,33 @@ def test_backtest__get_sell_trade_entry(default_conf, fee, mocker) -> None:
     assert sell_order is not None
 
 
+def test_detail_candles(testdatadir) -> None:
+    data = history.load_pair_history(pair="UNITTEST/BTC", timeframe="1m", datadir=testdatadir)
+    detail = DetailCandles(data, "5m")
+    assert detail.source is data
+
+    candle = timeframe_to_next_date("5m", data["date"].iat[100].to_pydatetime())
+    start, end = detail.candle_slice(candle)
+    expected = data.loc[
+        (data["date"] >= candle) & (data["date"] < candle + timedelta(minutes=5))
+    ].index
+    assert end - start == 5
+    assert list(range(start, end)) == list(expected)
+    row = detail.row(start, [1, 0, 0, 0, "tag", None])
+    assert row[0] == candle
+    assert row[1:5] == data.loc[start, ["open", "high", "low", "close"]].tolist()
+    assert row[5:] == [1, 0, 0, 0, "tag", None]
+
+    # Not aligned to the candle grid - same result via fallback
+    start, end = detail.candle_slice(candle + timedelta(minutes=1))
+    assert list(range(start, end)) == list(range(expected[0] + 1, expected[-1] + 2))
+    # Out of range
+    assert detail.candle_slice(candle - timedelta(days=100)) == (0, 0)
+
+    empty = DetailCandles(data.iloc[0:0], "5m")
+    assert empty.candle_slice(candle) == (0, 0)
+
+
 def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
     default_conf["use_exit_signal"] = False
     mocker.patch("coingro.exchange.Exchange.get_fee", fee)
@@ -1287,6 +1318,74 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+@pytest.mark.parametrize("max_open_trades", [0, 1, 3])
+@pytest.mark.parametrize("position_stacking", [True, False])
+@pytest.mark.parametrize("use_protections", [True, False])
+def test_backtest_columnar_engine_parity(
+    default_conf, fee, mocker, testdatadir, max_open_trades, position_stacking, use_protections
+):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        dataframe["enter_tag"] = np.where(dataframe.index % 3 == 0, "tag_a", "tag_b")
+        return dataframe
+
+    mocker.patch("coingro.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch("coingro.exchange.Exchange.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch("coingro.exchange.Exchange.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs)
+    data = trim_dictlist(data, -500)
+    # Missing start for one pair, missing end for another
+    data["DASH/BTC"] = data["DASH/BTC"][50:].reset_index()
+    data["LTC/BTC"] = data["LTC/BTC"][:-80].reset_index()
+    default_conf["timeframe"] = "5m"
+    default_conf["stoploss"] = -0.01
+    default_conf["enable_protections"] = use_protections
+    default_conf["protections"] = [
+        {"method": "CooldownPeriod", "stop_duration_candles": 5},
+        {
+            "method": "StoplossGuard",
+            "lookback_period_candles": 50,
+            "trade_limit": 2,
+            "stop_duration_candles": 10,
+        },
+    ]
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed),
+            start_date=min_date,
+            end_date=max_date,
+            max_open_trades=max_open_trades,
+            position_stacking=position_stacking,
+            enable_protections=use_protections,
+        )
+        assert backtesting.progress.progress == 1
+
+    loop_res, columnar_res = results["loop"], results["columnar"]
+    assert len(loop_res["results"]) > 0
+    pd.testing.assert_frame_equal(loop_res["results"], columnar_res["results"])
+    for key in ("rejected_signals", "final_balance", "timedout_entry_orders"):
+        assert loop_res[key] == columnar_res[key]
+    assert len(loop_res["locks"]) == len(columnar_res["locks"])
+    if max_open_trades == 1:
+        assert loop_res["rejected_signals"] > 0
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
 
     patch_exchange(mocker)
@@ -0,0 +1,137 @@
+from copy import deepcopy
+
+import pandas as pd
+import pytest
+
+from coingro.configuration import TimeRange
+from coingro.data import history
+from coingro.data.history import get_timerange
+from coingro.exceptions import OperationalException
+from coingro.optimize.backtesting import Backtesting
+from coingro.optimize.exit_space import ExitParams, ExitSpaceEvaluator
+from tests.conftest import patch_exchange
+
+COMPARED_COLUMNS = [
+    "pair",
+    "open_date",
+    "close_date",
+    "open_rate",
+    "close_rate",
+    "profit_ratio",
+    "exit_reason",
+    "trade_duration",
+    "is_open",
+    "enter_tag",
+]
+
+CANDIDATES = [
+    ExitParams(minimal_roi={0: 0.02, 30: 0.01, 60: 0}, stoploss=-0.1),
+    ExitParams(minimal_roi={0: 0.05, 100: 0.01}, stoploss=-0.01),
+    ExitParams(minimal_roi={0: 10}, stoploss=-0.02, trailing_stop=True),
+    ExitParams(
+        minimal_roi={0: 0.1, 40: 0.02},
+        stoploss=-0.03,
+        trailing_stop=True,
+        trailing_stop_positive=0.005,
+        trailing_stop_positive_offset=0.01,
+        trailing_only_offset_is_reached=True,
+    ),
+    ExitParams(
+        minimal_roi={0: 0.03, 20: -1},
+        stoploss=-0.05,
+        trailing_stop=True,
+        trailing_stop_positive=0.01,
+    ),
+]
+
+
+@pytest.fixture
+def exit_space_backtesting(default_conf, fee, mocker, testdatadir):
+    default_conf.update(
+        {
+            "strategy": "StrategyTestV2",
+            "timeframe": "5m",
+            "max_open_trades": -1,
+            "stake_amount": 0.001,
+        }
+    )
+    mocker.patch("coingro.exchange.Exchange.get_fee", fee)
+    mocker.patch("coingro.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch("coingro.exchange.Exchange.get_max_pair_stake_amount", return_value=float("inf"))
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(
+        datadir=testdatadir,
+        timeframe="5m",
+        pairs=["UNITTEST/BTC", "ADA/BTC", "ETH/BTC", "XLM/BTC"],
+        timerange=TimeRange("date", None, 1517000000, 0),
+    )
+    return backtesting, backtesting.strategy.advise_all_indicators(data)
+
+
+def _backtest_trades(backtesting, processed, params: ExitParams) -> pd.DataFrame:
+    strategy = backtesting.strategy
+    strategy.minimal_roi = params.minimal_roi
+    strategy.stoploss = params.stoploss
+    strategy.trailing_stop = params.trailing_stop
+    strategy.trailing_stop_positive = params.trailing_stop_positive
+    strategy.trailing_stop_positive_offset = params.trailing_stop_positive_offset
+    strategy.trailing_only_offset_is_reached = params.trailing_only_offset_is_reached
+    min_date, max_date = get_timerange(processed)
+    results = backtesting.backtest(
+        processed=deepcopy(processed),
+        start_date=min_date,
+        end_date=max_date,
+        max_open_trades=0,
+        position_stacking=False,
+    )["results"]
+    return results[COMPARED_COLUMNS].sort_values(["pair", "open_date"]).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("use_exit_signal", [False, True])
+@pytest.mark.parametrize("horizon", [256, 7])
+def test_exit_space_evaluate(exit_space_backtesting, horizon, use_exit_signal) -> None:
+    backtesting, processed = exit_space_backtesting
+    backtesting.strategy.use_exit_signal = use_exit_signal
+    min_date, max_date = get_timerange(processed)
+
+    evaluator = ExitSpaceEvaluator(
+        backtesting, deepcopy(processed), min_date, max_date, horizon=horizon
+    )
+    assert not evaluator.approximate
+    results = evaluator.evaluate(CANDIDATES)
+    assert len(results) == len(CANDIDATES)
+
+    exit_reasons = set()
+    for params, result in zip(CANDIDATES, results):
+        expected = _backtest_trades(backtesting, processed, params)
+        assert len(expected) > 0
+        result = result.sort_values(["pair", "open_date"]).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        exit_reasons.update(result["exit_reason"])
+    assert exit_reasons >= {"roi", "stop_loss", "trailing_stop_loss", "force_exit"}
+    assert ("exit_signal" in exit_reasons) == use_exit_signal
+
+
+def test_exit_space_approximate(exit_space_backtesting) -> None:
+    backtesting, processed = exit_space_backtesting
+    min_date, max_date = get_timerange(processed)
+    evaluator = ExitSpaceEvaluator(backtesting, processed, min_date, max_date, max_open_trades=3)
+    assert evaluator.approximate
+    evaluator = ExitSpaceEvaluator(
+        backtesting, processed, min_date, max_date, enable_protections=True
+    )
+    assert evaluator.approximate
+
+
+def test_exit_space_unsupported(exit_space_backtesting) -> None:
+    backtesting, processed = exit_space_backtesting
+    min_date, max_date = get_timerange(processed)
+    backtesting.strategy.use_custom_stoploss = True
+    backtesting.timeframe_detail = "1m"
+    with pytest.raises(
+        OperationalException,
+        match=r"does not support timeframe_detail, custom stoploss\.",
+    ):
+        ExitSpaceEvaluator(backtesting, processed, min_date, max_date)
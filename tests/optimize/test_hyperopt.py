@@ -1,6 +1,9 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+import gc
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List
 from unittest.mock import ANY, MagicMock
 
 import pandas as pd
@@ -12,6 +15,7 @@ from coingro.commands.optimize_commands import setup_optimize_configuration, sta
 from coingro.data.history import load_data
 from coingro.enums import ExitType, RunMode
 from coingro.exceptions import OperationalException
+from coingro.optimize import hyperopt as hyperopt_module
 from coingro.optimize.hyperopt import Hyperopt
 from coingro.optimize.hyperopt_auto import HyperOptAuto
 from coingro.optimize.hyperopt_tools import HyperoptTools
@@ -332,7 +336,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("coingro.optimize.hyperopt.dump")
+    dumper = mocker.patch("coingro.optimize.hyperopt.dump_dataframes")
     dumper2 = mocker.patch("coingro.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
 
@@ -345,17 +349,15 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
     )
 
-    parallel = mocker.patch(
-        "coingro.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+    optimizer_mock = mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {"buy": {}, "sell": {}, "roi": {}, "stoploss": 0.0},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {"buy": {}, "sell": {}, "roi": {}, "stoploss": 0.0},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -368,7 +370,9 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    optimizer_mock.assert_called_once()
+    # Converted signals are released once hyperopt finished
+    assert hyperopt.backtesting.signal_cache_id is None
 
     out, err = capsys.readouterr()
     assert "Best result:\n\n*    1/1: foo result Objective: 1.00000\n" in out
@@ -527,7 +531,9 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     patch_exchange(mocker)
     mocker.patch.object(Path, "open")
     mocker.patch("coingro.configuration.config_validation.validate_config_schema")
-    mocker.patch("coingro.optimize.hyperopt.load", return_value={"XRP/BTC": None})
+    mocker.patch(
+        "coingro.optimize.hyperopt.load_dataframes", return_value={"XRP/BTC": pd.DataFrame()}
+    )
 
     optimizer_param = {
         "buy_plusdi": 0.02,
@@ -603,12 +609,12 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("coingro.optimize.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
-    assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
+    assert unlinkmock.call_count == 4
+    assert log_has(f"Removing `{h.data_file}`.", caplog)
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("coingro.optimize.hyperopt.dump")
+    dumper = mocker.patch("coingro.optimize.hyperopt.dump_dataframes")
     dumper2 = mocker.patch("coingro.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
 
@@ -621,24 +627,22 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
     )
 
-    parallel = mocker.patch(
-        "coingro.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+    optimizer_mock = mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "params_details": {
-                        "buy": {"mfi-value": None},
-                        "sell": {"sell-mfi-value": None},
-                        "roi": {},
-                        "stoploss": {"stoploss": None},
-                        "trailing": {"trailing_stop": None},
-                    },
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "params_details": {
+                    "buy": {"mfi-value": None},
+                    "sell": {"sell-mfi-value": None},
+                    "roi": {},
+                    "stoploss": {"stoploss": None},
+                    "trailing": {"trailing_stop": None},
+                },
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -657,7 +661,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    optimizer_mock.assert_called_once()
 
     out, err = capsys.readouterr()
     result_str = (
@@ -671,7 +675,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("coingro.optimize.hyperopt.dump")
+    dumper = mocker.patch("coingro.optimize.hyperopt.dump_dataframes")
     dumper2 = mocker.patch("coingro.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
     mocker.patch(
@@ -683,23 +687,21 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
     )
 
-    parallel = mocker.patch(
-        "coingro.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+    optimizer_mock = mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "params_details": {
-                        "buy": {"mfi-value": None},
-                        "sell": {"sell-mfi-value": None},
-                        "roi": {},
-                        "stoploss": {"stoploss": None},
-                    },
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "params_details": {
+                    "buy": {"mfi-value": None},
+                    "sell": {"sell-mfi-value": None},
+                    "roi": {},
+                    "stoploss": {"stoploss": None},
+                },
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -712,7 +714,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    optimizer_mock.assert_called_once()
 
     out, err = capsys.readouterr()
     assert (
@@ -725,7 +727,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("coingro.optimize.hyperopt.dump")
+    dumper = mocker.patch("coingro.optimize.hyperopt.dump_dataframes")
     dumper2 = mocker.patch("coingro.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
     mocker.patch(
@@ -737,18 +739,16 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
     )
 
-    parallel = mocker.patch(
-        "coingro.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+    optimizer_mock = mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "params_details": {"roi": {}, "stoploss": {"stoploss": None}},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "params_details": {"roi": {}, "stoploss": {"stoploss": None}},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -767,7 +767,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    optimizer_mock.assert_called_once()
 
     out, err = capsys.readouterr()
     assert '{"minimal_roi":{},"stoploss":null}' in out
@@ -777,7 +777,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("coingro.optimize.hyperopt.dump")
+    dumper = mocker.patch("coingro.optimize.hyperopt.dump_dataframes")
     dumper2 = mocker.patch("coingro.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
     mocker.patch(
@@ -789,17 +789,15 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
     )
 
-    parallel = mocker.patch(
-        "coingro.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+    optimizer_mock = mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {"stoploss": 0.0},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {"stoploss": 0.0},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -812,7 +810,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    optimizer_mock.assert_called_once()
 
     out, err = capsys.readouterr()
     assert "Best result:\n\n*    1/1: foo result Objective: 1.00000\n" in out
@@ -827,7 +825,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("coingro.optimize.hyperopt.dump", MagicMock())
+    mocker.patch("coingro.optimize.hyperopt.dump_dataframes", MagicMock())
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
     mocker.patch(
         "coingro.optimize.backtesting.Backtesting.load_bt_data",
@@ -865,7 +863,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("coingro.optimize.hyperopt.dump")
+    dumper = mocker.patch("coingro.optimize.hyperopt.dump_dataframes")
     dumper2 = mocker.patch("coingro.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
     mocker.patch(
@@ -877,17 +875,15 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
     )
 
-    parallel = mocker.patch(
-        "coingro.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+    optimizer_mock = mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -900,7 +896,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    optimizer_mock.assert_called_once()
 
     out, err = capsys.readouterr()
     assert "Best result:\n\n*    1/1: foo result Objective: 1.00000\n" in out
@@ -915,7 +911,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("coingro.optimize.hyperopt.dump")
+    dumper = mocker.patch("coingro.optimize.hyperopt.dump_dataframes")
     dumper2 = mocker.patch("coingro.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
     mocker.patch(
@@ -927,17 +923,15 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13))),
     )
 
-    parallel = mocker.patch(
-        "coingro.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+    optimizer_mock = mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -954,7 +948,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    optimizer_mock.assert_called_once()
 
     out, err = capsys.readouterr()
     assert "Best result:\n\n*    1/1: foo result Objective: 1.00000\n" in out
@@ -977,7 +971,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("coingro.optimize.hyperopt.dump", MagicMock())
+    mocker.patch("coingro.optimize.hyperopt.dump_dataframes", MagicMock())
     mocker.patch("coingro.optimize.hyperopt.file_dump_json")
     mocker.patch(
         "coingro.optimize.backtesting.Backtesting.load_bt_data",
@@ -1041,6 +1035,201 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmpdir, fee) -> None:
         hyperopt.get_optimizer([], 2)
 
 
+@pytest.mark.parametrize("engine", ["loop", "columnar"])
+def test_generate_optimizer_signal_cache(mocker, hyperopt_conf, tmpdir, fee, engine) -> None:
+    patch_exchange(mocker)
+    mocker.patch("coingro.exchange.Exchange.get_fee", fee)
+    (Path(tmpdir) / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": Path(tmpdir),
+            "spaces": ["buy", "stoploss"],
+            "backtest_engine": engine,
+        }
+    )
+    # Backtesting instances from prior tests reset PairLocks.use_db when garbage collected
+    gc.collect()
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    hyperopt.init_spaces()
+    hyperopt.prepare_hyperopt_data()
+    assert [d.name for d in hyperopt.dimensions] == ["buy_plusdi", "buy_rsi", "stoploss"]
+
+    strategy = hyperopt.backtesting.strategy
+    advise_entry = mocker.spy(strategy, "advise_entry")
+    load_mock = mocker.spy(hyperopt_module, "load_dataframes")
+    preprocessed_mock = mocker.spy(hyperopt, "_get_preprocessed")
+    # Compare raw backtest results
+    mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt._get_results_dict",
+        side_effect=lambda bt_results, *args, **kwargs: bt_results,
+    )
+    points = [[0.02, 30, -0.1], [0.02, 30, -0.05], [0.02, 40, -0.05], [0.02, 40, -0.2]]
+    cached = [hyperopt.generate_optimizer(point) for point in points]
+    # Signals are only regenerated (and data only loaded) when the buy space changed
+    assert advise_entry.call_count == 4
+    assert preprocessed_mock.call_count == 2
+    # Preprocessed data is only loaded once
+    assert load_mock.call_count == 1
+
+    hyperopt.backtesting.clear_signal_cache()
+    assert hyperopt.backtesting._signal_cache is None
+    for point, result in zip(points, cached):
+        uncached = hyperopt.generate_optimizer(point)
+        assert len(uncached["results"]) > 0
+        pd.testing.assert_frame_equal(uncached["results"], result["results"])
+        assert uncached["rejected_signals"] == result["rejected_signals"]
+    assert preprocessed_mock.call_count == 6
+    assert load_mock.call_count == 1
+
+
+def test_generate_optimizer_exit_space(mocker, hyperopt_conf, tmpdir, fee, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch("coingro.exchange.Exchange.get_fee", fee)
+    (Path(tmpdir) / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "user_data_dir": Path(tmpdir),
+            "spaces": ["roi", "stoploss"],
+            "stake_amount": 0.001,
+            "use_max_market_positions": False,
+        }
+    )
+    # Backtesting instances from prior tests reset PairLocks.use_db when garbage collected
+    gc.collect()
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.backtesting.exchange.get_max_leverage = MagicMock(return_value=1.0)
+    hyperopt.backtesting.exchange.get_min_pair_stake_amount = MagicMock(return_value=0.00001)
+    hyperopt.init_spaces()
+    hyperopt.init_exit_space()
+    assert hyperopt.use_exit_space
+    assert log_has("Only exit spaces are optimized - using the exit space evaluation.", caplog)
+    hyperopt.prepare_hyperopt_data()
+
+    backtest_mock = mocker.spy(hyperopt.backtesting, "backtest")
+    # Compare raw backtest results
+    mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt._get_results_dict",
+        side_effect=lambda bt_results, *args, **kwargs: bt_results,
+    )
+    point = [60, 30, 10, 0.02, 0.02, 0.03, -0.05]
+    result = hyperopt.generate_optimizer(point)
+    assert backtest_mock.call_count == 0
+    assert len(result["results"]) > 0
+    assert result["final_balance"] == pytest.approx(
+        hyperopt_conf["dry_run_wallet"] + result["results"]["profit_abs"].sum()
+    )
+
+    # Same trades as a backtest of the same parameters
+    hyperopt.use_exit_space = False
+    expected = hyperopt.generate_optimizer(point)
+    assert backtest_mock.call_count == 1
+    columns = ["pair", "open_date", "close_date", "close_rate", "exit_reason", "profit_abs"]
+    pd.testing.assert_frame_equal(
+        result["results"][columns].sort_values(["pair", "open_date"]).reset_index(drop=True),
+        expected["results"][columns].sort_values(["pair", "open_date"]).reset_index(drop=True),
+        check_dtype=False,
+    )
+    assert result["final_balance"] == pytest.approx(expected["final_balance"])
+
+    # Evaluations limited by max_open_trades are labeled
+    hyperopt.use_exit_space = True
+    hyperopt._exit_space.approximate = True
+    mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt._get_results_dict",
+        return_value={"results_explanation": "10 trades."},
+    )
+    result = hyperopt.generate_optimizer(point)
+    assert result == {"results_explanation": "10 trades. (approximate)", "is_approximate": True}
+
+
+def test_init_exit_space(mocker, hyperopt_conf, caplog) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"spaces": ["roi", "stoploss", "trailing"]})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.init_exit_space()
+    assert hyperopt.use_exit_space
+    # max_open_trades still applies to Backtesting, but not to the exit space evaluation
+    assert log_has_re(r"Results are approximate, .*", caplog)
+
+    caplog.clear()
+    hyperopt_conf.update({"spaces": ["default"]})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.init_exit_space()
+    assert not hyperopt.use_exit_space
+
+    hyperopt_conf.update({"spaces": ["stoploss"], "stake_amount": "unlimited"})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.init_exit_space()
+    assert not hyperopt.use_exit_space
+    assert log_has(
+        "Not using the exit space evaluation, as unlimited stake amount is not supported.", caplog
+    )
+    assert not log_has_re(r"Results are approximate, .*", caplog)
+
+
+def test_run_optimizer_async(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"epochs": 7, "spaces": ["roi", "stoploss"]})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.init_spaces()
+    hyperopt.random_state = 42
+    hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+    mocker.patch(
+        "coingro.optimize.hyperopt.Hyperopt.generate_optimizer",
+        side_effect=lambda raw_params: {"loss": raw_params[-1], "params": raw_params},
+    )
+    tell_mock = mocker.spy(hyperopt.opt, "tell")
+
+    class FakeExecutor:
+        def __init__(self, max_workers, initializer, initargs):
+            self.max_workers = max_workers
+            self.running: List[Future] = []
+            self.submitted: List[List] = []
+            initializer(*initargs)
+
+        def submit(self, fn, raw_params):
+            future: Future = Future()
+            future.task = (fn, raw_params)
+            self.running.append(future)
+            self.submitted.append(raw_params)
+            assert len(self.running) <= self.max_workers
+            return future
+
+        def shutdown(self, **kwargs):
+            pass
+
+    executor = None
+
+    def fake_executor(**kwargs):
+        nonlocal executor
+        executor = FakeExecutor(**kwargs)
+        return executor
+
+    def fake_wait(futures, return_when):
+        # The most recent evaluation finishes first
+        future = list(futures)[-1]
+        executor.running.remove(future)
+        fn, raw_params = future.task
+        future.set_result(fn(raw_params))
+        return {future}, set(futures) - {future}
+
+    mocker.patch("coingro.optimize.hyperopt.ProcessPoolExecutor", side_effect=fake_executor)
+    mocker.patch("coingro.optimize.hyperopt.wait", side_effect=fake_wait)
+
+    results = list(hyperopt.run_optimizer_async(3))
+    assert len(results) == 7
+    evaluated = [val["params"] for val, _ in results]
+    assert all(evaluated.count(point) == 1 for point in evaluated)
+    # Every result is told to the optimizer as soon as it is available
+    assert tell_mock.call_count == 7
+    assert [call[0][0] for call in tell_mock.call_args_list] == evaluated
+    # The first submitted point finished last - without holding back the others
+    assert results[-1][0]["params"] == executor.submitted[0]
+    assert len(hyperopt.opt.Xi) == 7
+
+
 def test_SKDecimal():
     space = SKDecimal(1, 2, decimals=2)
     assert 1.5 in space
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pandas as pd
+
+from coingro.data.history import load_pair_history
+from coingro.optimize.hyperopt_data import dump_dataframes, get_data_files, load_dataframes
+
+
+def test_dump_load_dataframes(testdatadir, tmpdir) -> None:
+    filename = Path(tmpdir) / "hyperopt_tickerdata.bin"
+    df = load_pair_history(pair="UNITTEST/BTC", timeframe="5m", datadir=testdatadir)
+    df["rsi_int"] = (df["close"] * 100).astype(int)
+    df["trend"] = "up"
+    df["flag"] = df["close"] > df["open"]
+    data = {
+        "UNITTEST/BTC": df,
+        "UNITTEST/USDT": df.iloc[10:20],
+        "XRP/BTC": df.iloc[:5].set_index("date", drop=False),
+        "ETH/BTC": df.iloc[:0],
+    }
+
+    dump_dataframes(data, filename)
+    assert all(f.is_file() for f in get_data_files(filename))
+
+    loaded = load_dataframes(filename)
+    assert list(loaded.keys()) == list(data.keys())
+    for pair, df_pair in data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df_pair)
+
+    # Numeric columns are read-only views into the arena
+    close = loaded["UNITTEST/BTC"]["close"].to_numpy()
+    assert not close.flags.owndata
+    assert not close.flags.writeable
+    assert not loaded["UNITTEST/BTC"]["date"].array.asi8.flags.owndata
+
+    # Object file is removed if no longer needed
+    dump_dataframes({"UNITTEST/BTC": df[["date", "close"]]}, filename)
+    assert not get_data_files(filename)[2].is_file()
+    loaded = load_dataframes(filename)
+    pd.testing.assert_frame_equal(loaded["UNITTEST/BTC"], df[["date", "close"]])
@@ -364,6 +364,36 @@ def test__rpc_timeunit_profit(
         rpc._rpc_timeunit_profit(0, stake_currency, fiat_display_currency)
 
 
+@pytest.mark.parametrize("timeunit", ["weeks", "months"])
+def test__rpc_timeunit_profit_grouped(default_conf_usdt, fee, markets, mocker, timeunit) -> None:
+    mocker.patch("coingro.rpc.telegram.Telegram", MagicMock())
+    mocker.patch.multiple("coingro.exchange.Exchange", markets=PropertyMock(return_value=markets))
+
+    coingrobot = get_patched_coingrobot(mocker, default_conf_usdt)
+    create_mock_trades_usdt(fee)
+    rpc = RPC(coingrobot)
+    daily_profit = mocker.spy(Trade, "get_daily_profit")
+
+    res = rpc._rpc_timeunit_trade_profit(2, "USDT", "USD", timeunit)
+    # All periods are calculated from one query
+    assert daily_profit.call_count == 1
+    data = res["data"]
+    assert len(data) == 2
+    # The trade closed 2 days ago is in one of the 2 periods
+    assert sum(d["trade_count"] for d in data) == 3
+    assert sum(d["abs_profit"] for d in data) == pytest.approx(9.83)
+    assert data[0]["starting_balance"] == pytest.approx(
+        coingrobot.wallets.get_total_stake_amount() - data[0]["abs_profit"]
+    )
+    for d in data:
+        assert d["rel_profit"] in (
+            0.0,
+            pytest.approx(-0.2),
+            pytest.approx(13.83 / 230),
+            pytest.approx(9.83 / 250),
+        )
+
+
 @pytest.mark.parametrize("is_short", [True, False])
 def test_rpc_trade_history(mocker, default_conf, markets, fee, is_short):
     mocker.patch("coingro.rpc.telegram.Telegram", MagicMock())
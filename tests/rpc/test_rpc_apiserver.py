@@ -22,6 +22,7 @@ from coingro.enums import CandleType, RunMode, State, TradingMode
 from coingro.exceptions import ExchangeError, OperationalException
 from coingro.exchange.common import SUPPORTED_EXCHANGES
 from coingro.loggers import setup_logging, setup_logging_pre
+from coingro.metrics import PROCESS_PHASE_DURATION, MetricsRegistry
 from coingro.persistence import PairLocks, Trade
 from coingro.rpc import RPC
 from coingro.rpc.api_server import ApiServer
@@ -612,7 +613,7 @@ def test_api_show_config(botclient):
     assert "unfilledtimeout" in response
     assert "version" in response
     assert "api_version" in response
-    assert 2.1 <= response["api_version"] <= 3.1
+    assert 2.1 <= response["api_version"] <= 3.3
 
 
 def test_api_daily(botclient, mocker, ticker, fee, markets):
@@ -897,9 +898,9 @@ def test_api_profit(botclient, mocker, ticker, fee, markets, is_short, expected)
         "profit_all_coin": expected["profit_all_coin"],
         "profit_all_fiat": expected["profit_all_fiat"],
         "profit_all_percent_mean": expected["profit_all_percent_mean"],
-        "profit_all_ratio_mean": expected["profit_all_ratio_mean"],
+        "profit_all_ratio_mean": pytest.approx(expected["profit_all_ratio_mean"]),
         "profit_all_percent_sum": expected["profit_all_percent_sum"],
-        "profit_all_ratio_sum": expected["profit_all_ratio_sum"],
+        "profit_all_ratio_sum": pytest.approx(expected["profit_all_ratio_sum"]),
         "profit_all_percent": expected["profit_all_percent"],
         "profit_all_ratio": expected["profit_all_ratio"],
         "profit_closed_coin": expected["profit_closed_coin"],
@@ -950,6 +951,41 @@ def test_api_stats(botclient, mocker, ticker, fee, markets, is_short):
     assert "draws" in rc.json()["durations"]
 
 
+def test_api_stats_rebuild(botclient, fee, caplog):
+    _, client = botclient
+    create_mock_trades(fee)
+
+    rc = client_post(client, f"{BASE_URI}/stats/rebuild")
+    assert_response(rc, 200)
+    assert rc.json() == {"status": "Rebuilt trade statistics."}
+
+    # Closed trade modified outside of this bot
+    Trade.get_trade_statistics().closed_trade_count += 1
+    rc = client_post(client, f"{BASE_URI}/stats/rebuild")
+    assert_response(rc, 200)
+    assert rc.json() == {
+        "status": "Rebuilt trade statistics. Cached statistics were inconsistent."
+    }
+    assert log_has("Cached trade statistics did not match the database.", caplog)
+
+
+def test_api_metrics(botclient, mocker):
+    _, client = botclient
+    mocker.patch("coingro.rpc.rpc.registry", MetricsRegistry())
+    rc = client_get(client, f"{BASE_URI}/metrics")
+    assert rc.status_code == 200
+    assert rc.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert rc.text == ""
+
+    registry = MetricsRegistry()
+    registry.observe(PROCESS_PHASE_DURATION, 0.5, phase="analyze")
+    mocker.patch("coingro.rpc.rpc.registry", registry)
+    rc = client_get(client, f"{BASE_URI}/metrics")
+    assert rc.status_code == 200
+    assert 'coingro_process_phase_seconds{phase="analyze",quantile="0.5"} 0.5' in rc.text
+    assert 'coingro_process_phase_seconds_count{phase="analyze"} 1' in rc.text
+
+
 def test_api_performance(botclient, fee):
     cgbot, client = botclient
     patch_get_signal(cgbot)
@@ -0,0 +1,118 @@
+from threading import Event
+from unittest.mock import MagicMock
+
+from coingro.enums import RPCMessageType
+from coingro.metrics import RPC_MESSAGES, MetricsRegistry
+from coingro.rpc.dispatcher import RPCDispatchQueue, coalesce_messages
+from tests.conftest import log_has, log_has_re
+
+
+def get_handler(side_effect=None):
+    handler = MagicMock()
+    handler.name = "dummy"
+    handler.send_msg = MagicMock(side_effect=side_effect)
+    return handler
+
+
+def test_coalesce_messages() -> None:
+    msgs = [
+        {"type": RPCMessageType.ENTRY_FILL, "trade_id": 1, "amount": 1, "open_rate": 10},
+        {"type": RPCMessageType.ENTRY_FILL, "trade_id": 2, "amount": 1, "open_rate": 5},
+        {"type": RPCMessageType.STATUS, "status": "test"},
+        {"type": RPCMessageType.ENTRY_FILL, "trade_id": 1, "amount": 3, "open_rate": 14},
+        {"type": RPCMessageType.EXIT_FILL, "trade_id": 1, "amount": 4, "close_rate": 15},
+        {"type": RPCMessageType.STATUS, "status": "test"},
+    ]
+    assert coalesce_messages(msgs) == [
+        msgs[1],
+        msgs[2],
+        {
+            "type": RPCMessageType.ENTRY_FILL,
+            "trade_id": 1,
+            "amount": 4,
+            "open_rate": 13,
+            "limit": 13,
+            "fill_count": 2,
+        },
+        msgs[4],
+        msgs[5],
+    ]
+    # Messages are not modified
+    assert "fill_count" not in msgs[3]
+
+
+def test_coalesce_messages_exit_fills() -> None:
+    # Exit fills carry the state of the whole trade - the latest one summarizes the burst
+    msgs = [
+        {"type": RPCMessageType.EXIT_FILL, "trade_id": 1, "amount": 2, "close_rate": 12},
+        {"type": RPCMessageType.EXIT_FILL, "trade_id": 1, "amount": 2, "close_rate": 13},
+    ]
+    assert coalesce_messages(msgs) == [dict(msgs[1], fill_count=2)]
+
+
+def test_dispatch_queue(caplog, mocker) -> None:
+    metrics = mocker.patch("coingro.rpc.dispatcher.registry", MetricsRegistry())
+    release = Event()
+    started = Event()
+
+    def send_msg(msg):
+        started.set()
+        release.wait(5)
+
+    handler = get_handler(send_msg)
+    queue = RPCDispatchQueue(handler, maxsize=4)
+    assert metrics.get_gauge(RPC_MESSAGES, module="dummy", state="sent") == 0
+
+    # Doesn't wait for the (blocked) handler
+    assert queue.put({"type": RPCMessageType.STATUS, "status": "first"})
+    assert started.wait(5)
+    assert queue.put({"type": RPCMessageType.ENTRY_FILL, "trade_id": 1, "amount": 1})
+    assert queue.put({"type": RPCMessageType.ENTRY_FILL, "trade_id": 1, "amount": 2})
+    assert queue.put({"type": RPCMessageType.STATUS, "status": "last"})
+    assert queue.put({"type": RPCMessageType.STATUS, "status": "last"})
+    assert not queue.put({"type": RPCMessageType.STATUS, "status": "dropped"})
+    assert log_has("rpc.dummy queue is full, dropping message of type 'status'.", caplog)
+    assert not queue.flush(timeout=0.01)
+    assert queue.stats()["queued"] == 4
+    assert metrics.get_gauge(RPC_MESSAGES, module="dummy", state="queued") == 4
+    assert metrics.get_gauge(RPC_MESSAGES, module="dummy", state="dropped") == 1
+
+    release.set()
+    assert queue.flush(timeout=5)
+    sent = [c[0][0] for c in handler.send_msg.call_args_list]
+    # The burst of fills is delivered as one message, repeated status messages are not merged
+    assert [msg.get("status", msg.get("amount")) for msg in sent] == ["first", 3, "last", "last"]
+    assert sent[1]["fill_count"] == 2
+    expected = {"queued": 0, "sent": 4, "failed": 0, "dropped": 1, "coalesced": 1}
+    assert queue.stats() == expected
+    for state, value in expected.items():
+        assert metrics.get_gauge(RPC_MESSAGES, module="dummy", state=state) == value
+    queue.stop(timeout=5)
+    assert not queue._thread.is_alive()
+
+
+def test_dispatch_queue_errors(caplog) -> None:
+    handler = get_handler([NotImplementedError, ValueError("bad"), None])
+    queue = RPCDispatchQueue(handler)
+    for i in range(3):
+        queue.put({"type": RPCMessageType.STATUS, "status": f"test {i}"})
+    queue.stop(timeout=5)
+
+    assert not queue._thread.is_alive()
+    assert handler.send_msg.call_count == 3
+    assert log_has("Message type 'status' not implemented by handler dummy.", caplog)
+    assert log_has_re(r"Exception while sending message to rpc\.dummy\.", caplog)
+    assert queue.stats()["sent"] == 1
+    assert queue.stats()["failed"] == 2
+
+
+def test_dispatch_queue_synchronous() -> None:
+    handler = get_handler()
+    queue = RPCDispatchQueue(handler, maxsize=0)
+    assert queue._thread is None
+
+    assert queue.put({"type": RPCMessageType.STATUS, "status": "test"})
+    assert handler.send_msg.call_count == 1
+    assert queue.flush(timeout=0)
+    queue.stop()
+    assert queue.stats() == {"queued": 0, "sent": 1, "failed": 0, "dropped": 0, "coalesced": 0}
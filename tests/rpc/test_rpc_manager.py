@@ -4,6 +4,7 @@ import time
 from unittest.mock import MagicMock
 
 from coingro.enums import RPCMessageType
+from coingro.metrics import RPC_MESSAGES, MetricsRegistry
 from coingro.rpc import RPCManager
 from coingro.rpc.api_server.webserver import ApiServer
 from tests.conftest import get_patched_coingrobot, log_has
@@ -79,15 +80,19 @@ def test_send_msg_telegram_disabled(mocker, default_conf, caplog) -> None:
 
 
 def test_send_msg_telegram_enabled(mocker, default_conf, caplog) -> None:
+    metrics = mocker.patch("coingro.rpc.dispatcher.registry", MetricsRegistry())
     telegram_mock = mocker.patch("coingro.rpc.telegram.Telegram.send_msg", MagicMock())
     mocker.patch("coingro.rpc.telegram.Telegram._init", MagicMock())
+    default_conf["internals"] = {"rpc_queue_size": 10}
 
     coingrobot = get_patched_coingrobot(mocker, default_conf)
     rpc_manager = RPCManager(coingrobot)
     rpc_manager.send_msg({"type": RPCMessageType.STATUS, "status": "test"})
+    assert rpc_manager._dispatch_queues["telegram"].flush(timeout=5)
 
     assert log_has("Sending rpc message: {'type': status, 'status': 'test'}", caplog)
     assert telegram_mock.call_count == 1
+    assert metrics.get_gauge(RPC_MESSAGES, module="telegram", state="sent") == 1
 
 
 def test_init_webhook_disabled(mocker, default_conf, caplog) -> None:
@@ -1821,24 +1821,23 @@ def test_send_msg_entry_fill_notification(
     default_conf["telegram"]["notification_settings"]["entry_fill"] = "on"
     telegram, _, msg_mock = get_telegram_testobject(mocker, default_conf)
 
-    telegram.send_msg(
-        {
-            "type": message_type,
-            "trade_id": 1,
-            "enter_tag": enter_signal,
-            "exchange": "Binance",
-            "pair": "ETH/BTC",
-            "leverage": leverage,
-            "stake_amount": 0.01465333,
-            "direction": entered,
-            # 'stake_amount_fiat': 0.0,
-            "stake_currency": "BTC",
-            "fiat_currency": "USD",
-            "open_rate": 1.099e-05,
-            "amount": 1333.3333333333335,
-            "open_date": arrow.utcnow().shift(hours=-1),
-        }
-    )
+    msg = {
+        "type": message_type,
+        "trade_id": 1,
+        "enter_tag": enter_signal,
+        "exchange": "Binance",
+        "pair": "ETH/BTC",
+        "leverage": leverage,
+        "stake_amount": 0.01465333,
+        "direction": entered,
+        # 'stake_amount_fiat': 0.0,
+        "stake_currency": "BTC",
+        "fiat_currency": "USD",
+        "open_rate": 1.099e-05,
+        "amount": 1333.3333333333335,
+        "open_date": arrow.utcnow().shift(hours=-1),
+    }
+    telegram.send_msg(msg.copy())
     leverage_text = f"*Leverage:* `{leverage}`\n" if leverage != 1.0 else ""
     assert msg_mock.call_args[0][0] == (
         f"\N{CHECK MARK} *Binance (dry):* {entered}ed ETH/BTC (#1)\n"
@@ -1849,6 +1848,10 @@ def test_send_msg_entry_fill_notification(
         "*Total:* `(0.01465333 BTC, 180.895 USD)`"
     )
 
+    # Fills merged by the rpc dispatcher
+    telegram.send_msg(dict(msg, fill_count=3))
+    assert "*Open Rate:* `0.00001099`\n*Fills:* `3`\n" in msg_mock.call_args[0][0]
+
 
 def test_send_msg_sell_notification(default_conf, mocker) -> None:
 
@@ -401,7 +401,7 @@ def test__send_msg(default_conf, mocker, caplog):
     webhook = Webhook(RPC(get_patched_coingrobot(mocker, default_conf)), default_conf)
     msg = {"value1": "DEADBEEF", "value2": "ALIVEBEEF", "value3": "COINGRO"}
     post = MagicMock()
-    mocker.patch("coingro.rpc.webhook.post", post)
+    mocker.patch("coingro.rpc.webhook.Session.post", post)
     webhook._send_msg(msg)
 
     assert post.call_count == 1
@@ -409,7 +409,7 @@ def test__send_msg(default_conf, mocker, caplog):
     assert post.call_args[0] == (default_conf["webhook"]["url"],)
 
     post = MagicMock(side_effect=RequestException)
-    mocker.patch("coingro.rpc.webhook.post", post)
+    mocker.patch("coingro.rpc.webhook.Session.post", post)
     webhook._send_msg(msg)
     assert log_has("Could not call webhook url. Exception: ", caplog)
 
@@ -420,7 +420,7 @@ def test__send_msg_with_json_format(default_conf, mocker, caplog):
     webhook = Webhook(RPC(get_patched_coingrobot(mocker, default_conf)), default_conf)
     msg = {"text": "Hello"}
     post = MagicMock()
-    mocker.patch("coingro.rpc.webhook.post", post)
+    mocker.patch("coingro.rpc.webhook.Session.post", post)
     webhook._send_msg(msg)
 
     assert post.call_args[1] == {"json": msg}
@@ -432,7 +432,7 @@ def test__send_msg_with_raw_format(default_conf, mocker, caplog):
     webhook = Webhook(RPC(get_patched_coingrobot(mocker, default_conf)), default_conf)
     msg = {"data": "Hello"}
     post = MagicMock()
-    mocker.patch("coingro.rpc.webhook.post", post)
+    mocker.patch("coingro.rpc.webhook.Session.post", post)
     webhook._send_msg(msg)
 
     assert post.call_args[1] == {"data": msg["data"], "headers": {"Content-Type": "text/plain"}}
@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import arrow
+import pandas as pd
 import pytest
 from pandas import DataFrame
 
@@ -134,6 +135,46 @@ def test_analyze_pair_empty(default_conf, mocker, caplog, ohlcv_history):
     assert log_has("Empty dataframe for pair ETH/BTC", caplog)
 
 
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analyze(default_conf, mocker, ohlcv_history, workers):
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY})
+    default_conf["internals"] = {"analysis_workers": workers}
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    mocker.patch.object(
+        strategy.dp, "ohlcv", side_effect=lambda *args, **kwargs: ohlcv_history.copy()
+    )
+    set_cached_mock = mocker.spy(strategy.dp, "_set_cached_df")
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC", "NEO/BTC", "TKN/BTC"]
+
+    strategy.analyze(pairs)
+
+    # Stored in pair order
+    assert [c[0][0] for c in set_cached_mock.call_args_list] == pairs
+    assert set(strategy.analysis_timings) == set(pairs)
+    assert all(t >= 0 for t in strategy.analysis_timings.values())
+    for pair in pairs:
+        dataframe, _ = strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)
+        assert "enter_long" in dataframe
+    assert (strategy._analysis_executor is not None) == (workers > 1)
+    assert strategy._analyzed_pending is None
+
+    # Analysis errors are raised
+    set_cached_mock.reset_mock()
+    strategy.process_only_new_candles = False
+    mocker.patch.object(strategy, "analyze_pair", side_effect=ValueError("Oops"))
+    with pytest.raises(ValueError, match="Oops"):
+        strategy.analyze(pairs)
+    assert set_cached_mock.call_count == 0
+    assert strategy._analyzed_pending is None
+
+    executor = strategy._analysis_executor
+    strategy.cg_bot_cleanup()
+    assert strategy._analysis_executor is None
+    if executor:
+        assert executor._shutdown
+
+
 def test_get_signal_empty(default_conf, caplog):
     assert (None, None) == _STRATEGY.get_latest_candle(
         "foo", default_conf["timeframe"], DataFrame()
@@ -756,6 +797,40 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+def test__analyze_ticker_internal_incremental(testdatadir, mocker) -> None:
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC"])["UNITTEST/BTC"]
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.incremental_analysis = True
+    metadata = {"pair": "UNITTEST/BTC"}
+    analyze_mock = mocker.spy(strategy, "analyze_ticker")
+
+    first = strategy._analyze_ticker_internal(data.iloc[:300].reset_index(drop=True), metadata)
+    assert len(analyze_mock.call_args[0][0]) == 300
+
+    # 3 new candles - only these (and the startup candles) are analyzed
+    window = data.iloc[3:303].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(window.copy(), metadata)
+    assert analyze_mock.call_count == 2
+    assert len(analyze_mock.call_args[0][0]) == 3 + strategy.startup_candle_count
+    assert len(ret) == len(window)
+    assert (ret["date"] == window["date"]).all()
+    pd.testing.assert_frame_equal(ret.iloc[:-3], first.iloc[3:].reset_index(drop=True))
+    full = StrategyTestV3({}).analyze_ticker(window.copy(), metadata)
+    pd.testing.assert_series_equal(ret["bb_middleband"].iloc[-3:], full["bb_middleband"].iloc[-3:])
+    analyzed, _ = strategy.dp.get_analyzed_dataframe("UNITTEST/BTC", strategy.timeframe)
+    assert analyzed is ret
+
+    # Gap to the previous analysis - analyze all candles
+    window = data.iloc[310:610].reset_index(drop=True)
+    strategy._analyze_ticker_internal(window, metadata)
+    assert len(analyze_mock.call_args[0][0]) == 300
+
+    strategy.incremental_analysis = False
+    strategy._analyze_ticker_internal(data.iloc[311:611].reset_index(drop=True), metadata)
+    assert len(analyze_mock.call_args[0][0]) == 300
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]
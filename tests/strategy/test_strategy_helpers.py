@@ -240,12 +240,11 @@ def test_informative_decorator(mocker, default_conf_usdt, trading_mode):
     for inf_pair in informative_pairs:
         assert inf_pair in strategy.gather_informative_pairs()
 
-    def test_historic_ohlcv(pair, timeframe, candle_type):
-        return data[
-            (pair, timeframe or strategy.timeframe, CandleType.from_string(candle_type))
-        ].copy()
+    def test_historic_ohlcv(pair, timeframe, candle_type, copy=True):
+        df = data[(pair, timeframe or strategy.timeframe, CandleType.from_string(candle_type))]
+        return df.copy() if copy else df
 
-    mocker.patch(
+    historic_mock = mocker.patch(
         "coingro.data.dataprovider.DataProvider.historic_ohlcv", side_effect=test_historic_ohlcv
     )
 
@@ -266,3 +265,36 @@ def test_informative_decorator(mocker, default_conf_usdt, trading_mode):
     for _, dataframe in analyzed.items():
         for col in expected_columns:
             assert col in dataframe.columns
+
+    # Informatives are populated once per asset and reused for all pairs
+    populated = []
+
+    def count_calls(populate_fn):
+        def wrapper(self, dataframe, metadata):
+            populated.append((metadata["pair"], metadata["timeframe"]))
+            return populate_fn(self, dataframe, metadata)
+
+        return wrapper
+
+    strategy._cg_informative = [(inf, count_calls(fn)) for inf, fn in strategy._cg_informative]
+    historic_mock.reset_mock()
+    analyzed2 = strategy.advise_all_indicators(
+        {p: data[(p, strategy.timeframe, candle_def)] for p in ("XRP/USDT", "LTC/USDT")}
+    )
+    assert sorted(populated) == [
+        ("ETH/BTC", "1h"),
+        ("ETH/USDT", "30m"),
+        ("LTC/USDT", "1h"),
+        ("LTC/USDT", "30m"),
+        ("NEO/USDT", "1h"),
+        ("NEO/USDT", "30m"),
+        ("XRP/USDT", "1h"),
+        ("XRP/USDT", "30m"),
+    ]
+    # Decorated informatives are looked up without copying the candles - only the strategy's
+    # own get_pair_dataframe() call gets a copy.
+    copied = [call.kwargs["pair"] for call in historic_mock.call_args_list if call.kwargs["copy"]]
+    assert copied == ["NEO/USDT", "NEO/USDT"]
+    assert strategy._cg_informative_cache == {}
+    for pair, dataframe in analyzed2.items():
+        pd.testing.assert_frame_equal(dataframe, analyzed[pair])
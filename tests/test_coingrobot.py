@@ -4,6 +4,7 @@
 import logging
 import time
 from copy import deepcopy
+from datetime import datetime, timezone
 from math import isclose
 from typing import List
 from unittest.mock import ANY, MagicMock, PropertyMock, patch
@@ -32,6 +33,7 @@ from coingro.exceptions import (
     PricingError,
     TemporaryError,
 )
+from coingro.metrics import SIGNAL_LATENCY, MetricsRegistry
 from coingro.persistence import Order, PairLocks, Trade
 from coingro.persistence.models import PairLock
 from coingro.plugins.protections.iprotection import ProtectionReturn
@@ -103,9 +105,11 @@ def test_bot_cleanup(mocker, default_conf_usdt, caplog) -> None:
     mock_cleanup = mocker.patch("coingro.coingrobot.cleanup_db")
     coo_mock = mocker.patch("coingro.coingrobot.CoingroBot.cancel_all_open_orders")
     coingro = get_patched_coingrobot(mocker, default_conf_usdt)
+    strategy_cleanup = mocker.spy(coingro.strategy, "cg_bot_cleanup")
     coingro.cleanup()
     assert log_has("Cleaning up modules ...", caplog)
     assert mock_cleanup.call_count == 1
+    assert strategy_cleanup.call_count == 1
     assert coo_mock.call_count == 0
 
     coingro.config["cancel_open_orders_on_exit"] = True
@@ -365,6 +369,46 @@ def test_create_trade(
     assert whitelist == default_conf_usdt["exchange"]["pair_whitelist"]
 
 
+def test_signal_latency(default_conf_usdt, ticker_usdt, fee, mocker, time_machine) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        "coingro.exchange.Exchange",
+        fetch_ticker=ticker_usdt,
+        get_fee=fee,
+        _is_dry_limit_order_filled=MagicMock(return_value=False),
+    )
+    time_machine.move_to("2022-09-01 05:05:03 +00:00", tick=False)
+    metrics = MetricsRegistry()
+    mocker.patch("coingro.coingrobot.registry", metrics)
+    coingro = CoingroBot(default_conf_usdt)
+    patch_get_signal(coingro)
+    candle_date = datetime(2022, 9, 1, 5, 0, tzinfo=timezone.utc)
+    mocker.patch.object(
+        coingro.dataprovider,
+        "get_analyzed_dataframe",
+        return_value=(DataFrame({"date": [candle_date]}), candle_date),
+    )
+
+    assert coingro.create_trade("ETH/USDT")
+    assert list(metrics.get(SIGNAL_LATENCY).values) == [3.0]
+
+    trade = Trade.query.first()
+    time_machine.move_to("2022-09-01 05:05:05 +00:00", tick=False)
+    mocker.patch.object(coingro, "execute_trade_exit", return_value=True)
+    mocker.patch.object(
+        coingro.strategy,
+        "should_exit",
+        return_value=[ExitCheckTuple(exit_type=ExitType.ROI)],
+    )
+    assert coingro._check_and_execute_exit(trade, 2.0, False, False, None)
+    assert list(metrics.get(SIGNAL_LATENCY).values) == [3.0]
+
+    coingro.strategy.should_exit.return_value = [ExitCheckTuple(exit_type=ExitType.EXIT_SIGNAL)]
+    assert coingro._check_and_execute_exit(trade, 2.0, False, True, None)
+    assert list(metrics.get(SIGNAL_LATENCY).values) == [3.0, 5.0]
+
+
 def test_create_trade_no_stake_amount(default_conf_usdt, ticker_usdt, fee, mocker) -> None:
     patch_RPCManager(mocker)
     patch_exchange(mocker)
@@ -711,6 +755,41 @@ def test_process_trade_handling(
     assert len(trades) == 1
 
 
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("position_adjustment", [True, False])
+def test_process_prefetch_rates(default_conf_usdt, fee, mocker, position_adjustment) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    default_conf_usdt["position_adjustment_enable"] = position_adjustment
+    prefetch_rates = mocker.patch("coingro.exchange.Exchange.prefetch_rates")
+    clear_rate_snapshot = mocker.patch("coingro.exchange.Exchange.clear_rate_snapshot")
+    coingro = get_patched_coingrobot(mocker, default_conf_usdt)
+    mocker.patch.multiple(
+        coingro,
+        update_closed_trades_without_assigned_fees=MagicMock(),
+        manage_open_orders=MagicMock(),
+        exit_positions=MagicMock(),
+        process_open_trade_positions=MagicMock(),
+        enter_positions=MagicMock(),
+    )
+    create_mock_trades(fee)
+
+    coingro.process()
+    # Trades with an open order are not checked for exits
+    pairs = [trade.pair for trade in Trade.get_open_trades() if trade.open_order_id is None]
+    assert prefetch_rates.call_count == (2 if position_adjustment else 1)
+    assert prefetch_rates.call_args_list[0][0] == (pairs, "exit")
+    assert clear_rate_snapshot.call_count == 1
+
+    # Prefetched rates and synced orders are also discarded if the iteration fails
+    coingro.exit_positions.side_effect = TemporaryError("Timeout")
+    coingro._fetch_orders_bulk = MagicMock(return_value={"123": {"id": "123"}})
+    with pytest.raises(TemporaryError):
+        coingro.process()
+    assert clear_rate_snapshot.call_count == 2
+    assert coingro._synced_orders == {}
+
+
 def test_process_trade_no_whitelist_pair(
     default_conf_usdt, ticker_usdt, limit_buy_order_usdt, fee, mocker
 ) -> None:
@@ -2578,6 +2657,51 @@ def test_manage_open_orders_entry(
     assert coingro.strategy.adjust_entry_price.call_count == 0
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_manage_open_orders_synced(
+    default_conf_usdt, ticker_usdt, limit_buy_order_old, open_trade, fee, mocker
+) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    limit_buy_order_old["id"] = open_trade.open_order_id
+    partial_order = deepcopy(limit_buy_order_old)
+    partial_order["filled"] = 20.0
+    partial_order["remaining"] = limit_buy_order_old["amount"] - 20.0
+    fetch_order_mock = MagicMock(return_value=partial_order)
+    mocker.patch.multiple(
+        "coingro.exchange.Exchange",
+        fetch_ticker=ticker_usdt,
+        fetch_order=fetch_order_mock,
+        get_fee=fee,
+    )
+    coingro = CoingroBot(default_conf_usdt)
+    update_trade_state_mock = mocker.patch.object(coingro, "update_trade_state", return_value=False)
+    replace_order_mock = mocker.patch.object(coingro, "replace_order")
+    mocker.patch.object(coingro.strategy, "cg_check_timed_out", return_value=False)
+
+    order = open_trade.orders[0]
+    order.status = "open"
+    order.cg_is_open = True
+    order.amount = limit_buy_order_old["amount"]
+    order.filled = 0.0
+    order.remaining = order.amount
+    Trade.query.session.add(open_trade)
+
+    # Unchanged order from the bulk fetch
+    coingro._synced_orders = {open_trade.open_order_id: limit_buy_order_old}
+    coingro.manage_open_orders()
+    assert fetch_order_mock.call_count == 0
+    assert update_trade_state_mock.call_count == 0
+    assert replace_order_mock.call_count == 1
+    assert coingro._synced_orders == {}
+
+    # Orders from the bulk fetch are used once - the partial fill is applied
+    coingro.manage_open_orders()
+    assert fetch_order_mock.call_count == 1
+    assert update_trade_state_mock.call_count == 1
+    assert replace_order_mock.call_count == 2
+
+
 @pytest.mark.parametrize("is_short", [False, True])
 def test_adjust_entry_cancel(
     default_conf_usdt,
@@ -0,0 +1,134 @@
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from coingro.exceptions import TemporaryError
+from coingro.exchange.common import retrier
+from coingro.metrics import (
+    DB_QUERY_DURATION,
+    EXCHANGE_CALL_DURATION,
+    PROCESS_DURATION,
+    PROCESS_PHASE_DURATION,
+    WORKER_DEADLINE,
+    MetricsRegistry,
+    RollingSummary,
+    registry,
+)
+from coingro.persistence import Trade
+from tests.conftest import get_patched_coingrobot, patch_get_signal
+
+
+def test_rolling_summary() -> None:
+    summary = RollingSummary(window=4)
+    assert math.isnan(summary.quantile(0.5))
+    for value in [5, 1, 3, 2, 4]:
+        summary.observe(value)
+    # Only the latest 4 values are kept for quantiles
+    assert list(summary.values) == [1, 3, 2, 4]
+    assert summary.quantile(0.5) == 2
+    assert summary.quantile(0.9) == 4
+    assert summary.quantile(0) == 1
+    assert summary.count == 5
+    assert summary.sum == 15
+
+
+def test_metrics_registry(mocker) -> None:
+    metrics = MetricsRegistry()
+    assert metrics.render() == ""
+    assert metrics.get(PROCESS_PHASE_DURATION, phase="analyze") is None
+
+    mocker.patch("coingro.metrics.time.perf_counter", side_effect=[10.0, 10.25, 20.0, 21.0])
+    with metrics.timer(PROCESS_PHASE_DURATION, phase="analyze"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.timer(PROCESS_PHASE_DURATION, phase='exit "positions"'):
+            raise ValueError()
+    metrics.observe("custom_metric", 2)
+
+    assert metrics.get(PROCESS_PHASE_DURATION, phase="analyze").sum == 0.25
+    assert metrics.render() == (
+        "# HELP coingro_process_phase_seconds Duration of the phases of a bot iteration.\n"
+        "# TYPE coingro_process_phase_seconds summary\n"
+        'coingro_process_phase_seconds{phase="analyze",quantile="0.5"} 0.25\n'
+        'coingro_process_phase_seconds{phase="analyze",quantile="0.9"} 0.25\n'
+        'coingro_process_phase_seconds{phase="analyze",quantile="0.99"} 0.25\n'
+        'coingro_process_phase_seconds_sum{phase="analyze"} 0.25\n'
+        'coingro_process_phase_seconds_count{phase="analyze"} 1\n'
+        'coingro_process_phase_seconds{phase="exit \\"positions\\"",quantile="0.5"} 1.0\n'
+        'coingro_process_phase_seconds{phase="exit \\"positions\\"",quantile="0.9"} 1.0\n'
+        'coingro_process_phase_seconds{phase="exit \\"positions\\"",quantile="0.99"} 1.0\n'
+        'coingro_process_phase_seconds_sum{phase="exit \\"positions\\""} 1.0\n'
+        'coingro_process_phase_seconds_count{phase="exit \\"positions\\""} 1\n'
+        "# TYPE custom_metric summary\n"
+        'custom_metric{quantile="0.5"} 2.0\n'
+        'custom_metric{quantile="0.9"} 2.0\n'
+        'custom_metric{quantile="0.99"} 2.0\n'
+        "custom_metric_sum 2.0\n"
+        "custom_metric_count 1\n"
+    )
+
+    metrics.reset()
+    assert metrics.render() == ""
+
+
+def test_metrics_registry_gauges() -> None:
+    metrics = MetricsRegistry()
+    assert metrics.get_gauge(WORKER_DEADLINE, phase="candle_close") is None
+    metrics.set_gauge(WORKER_DEADLINE, 1662008700, phase="candle_close")
+    metrics.set_gauge(WORKER_DEADLINE, 1662008530, phase="order_management")
+    metrics.set_gauge(WORKER_DEADLINE, 1662008540.5, phase="order_management")
+    assert metrics.get_gauge(WORKER_DEADLINE, phase="order_management") == 1662008540.5
+    assert metrics.render() == (
+        "# HELP coingro_worker_deadline_timestamp_seconds "
+        "Time the worker schedules the next run of each phase for.\n"
+        "# TYPE coingro_worker_deadline_timestamp_seconds gauge\n"
+        'coingro_worker_deadline_timestamp_seconds{phase="candle_close"} 1662008700.0\n'
+        'coingro_worker_deadline_timestamp_seconds{phase="order_management"} 1662008540.5\n'
+    )
+    metrics.reset()
+    assert metrics.render() == ""
+
+
+def test_metrics_exchange_calls(mocker) -> None:
+    mocker.patch("coingro.exchange.common.time.sleep")
+    fetch = MagicMock(side_effect=[TemporaryError("Timeout"), 42])
+
+    @retrier(retries=1)
+    def fetch_something():
+        return fetch()
+
+    before = registry.get(EXCHANGE_CALL_DURATION, method="fetch_something")
+    assert before is None
+    assert fetch_something() == 42
+    # Every attempt is recorded
+    assert registry.get(EXCHANGE_CALL_DURATION, method="fetch_something").count == 2
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_metrics_process(mocker, default_conf_usdt, fee) -> None:
+    coingro = get_patched_coingrobot(mocker, default_conf_usdt)
+    patch_get_signal(coingro)
+    mocker.patch.multiple(
+        coingro,
+        exit_positions=MagicMock(),
+        enter_positions=MagicMock(),
+    )
+
+    def count(name, **labels):
+        summary = registry.get(name, **labels)
+        return summary.count if summary else 0
+
+    phases = ["reload_markets", "refresh_data", "analyze", "exit_positions", "enter_positions"]
+    process_count = count(PROCESS_DURATION)
+    phase_counts = {phase: count(PROCESS_PHASE_DURATION, phase=phase) for phase in phases}
+    query_count = count(DB_QUERY_DURATION, statement="SELECT")
+
+    coingro.process()
+    assert count(PROCESS_DURATION) == process_count + 1
+    for phase in phases:
+        assert count(PROCESS_PHASE_DURATION, phase=phase) == phase_counts[phase] + 1
+    assert count(PROCESS_PHASE_DURATION, phase="funding_fees") == 0
+    assert count(DB_QUERY_DURATION, statement="SELECT") > query_count
+
+    Trade.query.session.rollback()
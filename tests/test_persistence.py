@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring, C0103
+import random
 from datetime import datetime, timedelta, timezone
 from math import isclose
 from pathlib import Path
@@ -8,13 +9,25 @@ from unittest.mock import MagicMock
 import arrow
 import pytest
 from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
 
 from coingro import constants
 from coingro.enums import TradingMode
 from coingro.exceptions import DependencyException, OperationalException
-from coingro.persistence import LocalTrade, Order, Trade, init_db
-from coingro.persistence.migrations import get_last_sequence_ids, set_sequence_ids
-from tests.conftest import create_mock_trades, create_mock_trades_with_leverage, log_has, log_has_re
+from coingro.persistence import LocalOrder, LocalTrade, Order, Trade, init_db, trade_model
+from coingro.persistence.migrations import (
+    create_index,
+    get_last_sequence_ids,
+    set_sequence_ids,
+)
+from tests.conftest import (
+    create_mock_trades,
+    create_mock_trades_usdt,
+    create_mock_trades_with_leverage,
+    log_has,
+    log_has_re,
+)
+from tests.conftest_trades_usdt import mock_trade_usdt_3
 
 spot, margin, futures = TradingMode.SPOT, TradingMode.MARGIN, TradingMode.FUTURES
 
@@ -39,6 +52,55 @@ def test_init_custom_db_url(default_conf, tmpdir):
     assert r.first() == ("wal",)
 
 
+def test_init_create_missing_indexes(default_conf, tmpdir, caplog):
+    filename = f"{tmpdir}/coingro2_test.sqlite"
+    default_conf.update({"db_url": f"sqlite:///{filename}"})
+    init_db(default_conf["db_url"], default_conf["dry_run"])
+    Trade._session.execute(text("drop index ix_trades_bot_id_dry_run_is_open"))
+    Trade.commit()
+
+    init_db(default_conf["db_url"], default_conf["dry_run"])
+    assert log_has("Creating index ix_trades_bot_id_dry_run_is_open on trades.", caplog)
+    indexes = Trade._session.execute(text("PRAGMA index_list('trades')")).all()
+    assert "ix_trades_bot_id_dry_run_is_open" in [index[1] for index in indexes]
+
+
+def test_init_create_missing_indexes_concurrently(default_conf, tmpdir, mocker, caplog):
+    filename = f"{tmpdir}/coingro2_test.sqlite"
+    default_conf.update({"db_url": f"sqlite:///{filename}"})
+    init_db(default_conf["db_url"], default_conf["dry_run"])
+    Trade._session.execute(text("drop index ix_trades_bot_id_dry_run_is_open"))
+    Trade.commit()
+
+    # Another bot sharing the database created the index in the meantime
+    mocker.patch(
+        "coingro.persistence.migrations.create_index",
+        side_effect=ProgrammingError("CREATE INDEX", {}, Exception("already exists")),
+    )
+    init_db(default_conf["db_url"], default_conf["dry_run"])
+    assert log_has_re(r"Could not create index ix_trades_bot_id_dry_run_is_open .*", caplog)
+
+
+def test_create_index_postgres(mocker):
+    engine = MagicMock()
+    engine.dialect.name = "postgresql"
+    connection = engine.connect.return_value.execution_options.return_value.__enter__()
+    index = next(iter(trade_model.Trade.__table__.indexes))
+
+    def create(bind, checkfirst):
+        assert bind == connection
+        assert checkfirst
+        assert index.dialect_options["postgresql"]["concurrently"]
+
+    mocker.patch.object(index, "create", side_effect=create)
+    create_index(engine, index)
+    assert index.create.call_count == 1
+    engine.connect.return_value.execution_options.assert_called_once_with(
+        isolation_level="AUTOCOMMIT"
+    )
+    assert not index.dialect_options["postgresql"]["concurrently"]
+
+
 def test_init_invalid_db_url():
     # Update path to a value other than default, but still in-memory
     with pytest.raises(OperationalException, match=r".*no valid database URL*"):
@@ -1146,6 +1208,49 @@ def test_calc_profit(
     assert pytest.approx(trade.calc_profit_ratio(rate=close_rate)) == round(profit_ratio, 8)
 
 
+@pytest.mark.parametrize(
+    "trading_mode,is_short", [(spot, False), (futures, False), (futures, True)]
+)
+def test_calc_profit_float_math(mocker, trading_mode, is_short):
+    rng = random.Random(42)
+    trades = []
+    for _ in range(500):
+        trades.append(
+            LocalTrade(
+                pair="ADA/USDT",
+                stake_amount=60.0,
+                amount=rng.uniform(0.001, 1e5),
+                open_rate=rng.uniform(1e-8, 1e5),
+                open_date=datetime.now(tz=timezone.utc) - timedelta(minutes=10),
+                exchange="binance",
+                is_short=is_short,
+                leverage=rng.choice([1.0, 3.0]),
+                fee_open=rng.choice([0.0, 0.001, 0.0025]),
+                fee_close=rng.choice([0.0, 0.001, 0.0025]),
+                trading_mode=trading_mode,
+                funding_fees=rng.uniform(-1, 1) if trading_mode == futures else None,
+            )
+        )
+    rates = [trade.open_rate * rng.uniform(0.5, 1.5) for trade in trades]
+    expected = [
+        (trade.open_trade_value, trade.calc_close_trade_value(rate), trade.calc_profit_ratio(rate))
+        for trade, rate in zip(trades, rates)
+    ]
+    decimal_mock = mocker.spy(trade_model, "Decimal")
+
+    for trade, rate, (open_value, close_value, profit_ratio) in zip(trades, rates, expected):
+        trade.use_float_math = True
+        trade.recalc_open_trade_value()
+        assert trade.open_trade_value == pytest.approx(open_value, rel=1e-14)
+        assert trade.calc_close_trade_value(rate) == pytest.approx(close_value, rel=1e-14)
+        assert trade.calc_profit_ratio(rate) == pytest.approx(profit_ratio, abs=1.1e-8)
+    assert decimal_mock.call_count == 0
+
+    # Other trades keep using Decimal
+    assert not LocalTrade.use_float_math
+    assert not Trade.use_float_math
+
+
 # def test_migrate_new(mocker, default_conf, fee, caplog):
 #     """
 #     Test Database migration (starting with new pairformat)
@@ -2086,6 +2191,67 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_get_trades_proxy_closed_index(fee):
+    Trade.use_db = False
+    Trade.reset_trades()
+    base = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+    def closed_trade(pair, minutes, profit):
+        trade = LocalTrade(
+            pair=pair,
+            stake_amount=0.001,
+            amount=1,
+            open_rate=1,
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            open_date=base + timedelta(minutes=minutes - 30),
+            close_date=base + timedelta(minutes=minutes),
+            is_open=False,
+            exchange="binance",
+        )
+        trade.close_profit_abs = profit
+        return trade
+
+    for minutes, pair in enumerate(["ETH/BTC", "XRP/BTC", "ETH/BTC", "ADA/BTC"] * 5):
+        LocalTrade.add_bt_trade(closed_trade(pair, minutes * 10, 0.001))
+    # Closed out of order
+    late = closed_trade("ETH/BTC", 55, -0.002)
+    LocalTrade.add_bt_trade(late)
+
+    trades = Trade.get_trades_proxy(is_open=False, close_date=base + timedelta(minutes=40))
+    assert len(trades) == 16
+    assert [t.close_date for t in trades] == sorted(t.close_date for t in trades)
+
+    trades = Trade.get_trades_proxy(
+        pair="ETH/BTC", is_open=False, close_date=base + timedelta(minutes=40)
+    )
+    assert len(trades) == 8
+    assert trades[0] is late
+    assert all(t.pair == "ETH/BTC" for t in trades)
+
+    trades = Trade.get_trades_proxy(
+        pair="ETH/BTC",
+        is_open=False,
+        open_date=base + timedelta(minutes=40),
+        close_date=base + timedelta(minutes=40),
+    )
+    assert len(trades) == 6
+    assert Trade.get_trades_proxy(pair="NOPE/BTC", is_open=False) == []
+    assert len(Trade.get_trades_proxy(pair="XRP/BTC", is_open=False)) == 5
+    assert pytest.approx(Trade.get_total_closed_profit()) == 0.018
+
+    # Direct modification of LocalTrade.trades rebuilds the index
+    LocalTrade.trades.append(closed_trade("XRP/BTC", 1000, 0.001))
+    assert len(Trade.get_trades_proxy(pair="XRP/BTC", is_open=False)) == 6
+    assert pytest.approx(Trade.get_total_closed_profit()) == 0.019
+
+    Trade.reset_trades()
+    assert Trade.get_trades_proxy(pair="XRP/BTC", is_open=False) == []
+    assert Trade.get_total_closed_profit() == 0
+    Trade.use_db = True
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades_query(fee, is_short):
@@ -2126,6 +2292,83 @@ def test_get_overall_performance(fee):
     assert "count" in res[0]
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_trade_statistics(fee):
+    create_mock_trades_usdt(fee)
+    trade_stats = Trade.get_trade_statistics()
+    assert trade_stats.closed_trade_count == 3
+    assert trade_stats.profit_closed_coin == pytest.approx(9.83)
+    assert trade_stats.winning_trades == 2
+    assert trade_stats.losing_trades == 1
+    # Closed 2 days ago first, so the loss is not a drawdown
+    assert trade_stats.max_drawdown_abs == 0.0
+    assert Trade.get_trade_statistics() is trade_stats
+    assert Trade.rebuild_trade_statistics()
+
+    # Closing a trade updates the cached statistics
+    trade_stats = Trade.get_trade_statistics()
+    trade = Trade.get_trades([Trade.is_open.is_(True)]).first()
+    trade.close(trade.open_rate * 0.9)
+    Trade.commit()
+    assert Trade.get_trade_statistics() is trade_stats
+    assert trade_stats.closed_trade_count == 4
+    assert trade_stats.losing_trades == 2
+    assert trade_stats.max_drawdown_abs == pytest.approx(-trade.close_profit_abs)
+    assert trade_stats.summary() == Trade.load_trade_statistics().summary()
+    # Served from the statistics - and matching the database query
+    assert Trade.get_overall_performance() == Trade.get_overall_performance(minutes=60 * 24 * 7)
+
+    # Rolled back changes invalidate the statistics
+    trade = Trade.get_trades([Trade.is_open.is_(True)]).first()
+    trade.close(trade.open_rate)
+    Trade.query.session.flush()
+    assert Trade._trade_stats is trade_stats
+    assert trade_stats.closed_trade_count == 5
+    Trade.query.session.rollback()
+    assert Trade._trade_stats is None
+    assert Trade.get_trade_statistics().closed_trade_count == 4
+
+    # Modified or deleted closed trades invalidate the statistics
+    trade = Trade.get_trades([Trade.is_open.is_(False)]).first()
+    trade.close_profit_abs = 10
+    Trade.commit()
+    assert Trade._trade_stats is None
+    Trade.get_trade_statistics()
+    trade.delete()
+    assert Trade._trade_stats is None
+    assert Trade.get_trade_statistics().closed_trade_count == 3
+
+    # Inconsistent statistics are detected on rebuild
+    Trade.get_trade_statistics().winning_trades += 1
+    assert not Trade.rebuild_trade_statistics()
+    assert Trade.rebuild_trade_statistics()
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_daily_profit(fee):
+    start = datetime.now(timezone.utc) - timedelta(days=7)
+    assert Trade.get_daily_profit(start) == {}
+
+    create_mock_trades_usdt(fee)
+    # Trades of other bots and live trades are ignored
+    for attr, value in (("bot_id", "other-bot"), ("dry_run", False)):
+        trade = mock_trade_usdt_3(fee, False)
+        trade.orders = []
+        setattr(trade, attr, value)
+        Trade.query.session.add(trade)
+    Trade.commit()
+
+    res = Trade.get_daily_profit(start)
+    assert sum(day["count"] for day in res.values()) == 3
+    assert sum(day["profit_abs"] for day in res.values()) == pytest.approx(9.83)
+    assert sum(day["stake_amount"] for day in res.values()) == 250.0
+    day = (datetime.now(timezone.utc) - timedelta(days=2, minutes=5)).date()
+    assert res[day] == {"profit_abs": -4.0, "stake_amount": 20.0, "count": 1}
+
+    res = Trade.get_daily_profit(datetime.now(timezone.utc) - timedelta(days=1))
+    assert sum(day["count"] for day in res.values()) == 2
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize(
     "is_short,pair,profit",
@@ -2230,6 +2473,82 @@ def test_update_order_from_ccxt(caplog):
     Order.update_orders([o], {"id": "1234"})
 
 
+def test_order_is_unchanged():
+    ccxt_order = {
+        "id": "1234",
+        "side": "buy",
+        "symbol": "ADA/USDT",
+        "type": "limit",
+        "price": 1234.5,
+        "amount": 20.0,
+        "filled": 9,
+        "remaining": 11,
+        "status": "open",
+    }
+    o = Order.parse_from_ccxt_object(ccxt_order, "ADA/USDT", "buy")
+    assert o.is_unchanged(ccxt_order)
+    assert o.is_unchanged({"id": "1234", "status": "open"})
+    assert not o.is_unchanged({**ccxt_order, "filled": 10, "remaining": 10})
+    assert not o.is_unchanged({**ccxt_order, "price": 1234.6})
+    assert not o.is_unchanged({**ccxt_order, "status": "canceled"})
+
+    o.update_from_ccxt_object({**ccxt_order, "status": "closed"})
+    assert not o.is_unchanged({**ccxt_order, "status": "closed"})
+
+
+def test_local_order(fee):
+    order_args = dict(
+        id=1,
+        cg_trade_id=1,
+        cg_pair="ADA/USDT",
+        order_id="1",
+        symbol="ADA/USDT",
+        cg_order_side="buy",
+        side="buy",
+        order_type="limit",
+        status="open",
+        cg_is_open=True,
+        order_date=datetime(2022, 1, 1, 12, 0),
+        price=2.0,
+        average=2.0,
+        amount=30.0,
+        filled=0,
+        remaining=30.0,
+        cost=60.0,
+    )
+    order = LocalOrder(**order_args)
+    assert not hasattr(order, "__dict__")
+    assert order.stop_price is None
+    assert order.safe_amount_after_fee == 0.0
+
+    db_order = Order(**order_args)
+    assert isinstance(db_order, LocalOrder)
+    assert order.to_json("buy") == db_order.to_json("buy")
+    assert order.to_ccxt_object() == db_order.to_ccxt_object()
+
+    trade = LocalTrade(
+        pair="ADA/USDT",
+        stake_amount=60.0,
+        amount=30.0,
+        open_rate=2.0,
+        open_date=datetime(2022, 1, 1, 12, 0, tzinfo=timezone.utc),
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        exchange="binance",
+        orders=[order],
+    )
+    assert trade.select_order("buy", is_open=True) is order
+    assert trade.select_order("sell") is None
+
+    order.close_bt_order(datetime(2022, 1, 1, 12, 5, tzinfo=timezone.utc), trade)
+    assert not order.cg_is_open
+    assert order.filled == 30.0
+    assert order.status == "closed"
+    assert trade.select_order("buy", is_open=True) is None
+    assert trade.select_order("buy", is_open=False) is order
+    assert trade.nr_of_successful_entries == 1
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_select_order(fee, is_short):
@@ -2305,6 +2624,14 @@ def test_Trade_object_idem():
         "get_exit_reason_performance",
         "get_enter_tag_performance",
         "get_mix_tag_performance",
+        "get_daily_profit",
+        "load_trade_statistics",
+        "get_trade_statistics",
+        "reset_trade_statistics",
+        "rebuild_trade_statistics",
+        "update_trade_statistics",
+        "commit_trade_statistics",
+        "rollback_trade_statistics",
         "get_trading_volume",
     )
 
@@ -2318,7 +2645,7 @@ def test_Trade_object_idem():
     for item in localtrade:
         if (
             not item.startswith("__")
-            and item not in ("trades", "trades_open", "total_profit")
+            and item not in ("trades", "trades_open", "total_profit", "trade_index")
             and type(getattr(LocalTrade, item)) not in (property, FunctionType)
         ):
             assert item in trade
@@ -1,9 +1,11 @@
 import logging
 import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, PropertyMock
 
 from coingro.data.dataprovider import DataProvider
 from coingro.enums import State
+from coingro.metrics import WORKER_DEADLINE, MetricsRegistry
 from coingro.worker import Worker
 from tests.conftest import get_patched_worker, log_has, log_has_re
 
@@ -79,6 +81,60 @@ def test_throttle_with_assets(mocker, default_conf) -> None:
     assert result == -1
 
 
+def test_throttle_candle_close(mocker, default_conf, time_machine) -> None:
+    def throttled_func():
+        return 42
+
+    time_machine.move_to("2022-09-01 05:02:00 +00:00", tick=False)
+    sleep_mock = mocker.patch("coingro.worker.Worker._sleep")
+    metrics = MetricsRegistry()
+    mocker.patch("coingro.worker.registry", metrics)
+    worker = get_patched_worker(mocker, default_conf)
+    assert worker._timeframes == ["5m"]
+
+    def deadline(phase):
+        timestamp = metrics.get_gauge(WORKER_DEADLINE, phase=phase)
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp else None
+
+    # Regular throttling without timeframe
+    worker._throttle(throttled_func, throttle_secs=10)
+    assert sleep_mock.call_args_list[-1][0][0] == 10
+    assert deadline("candle_close") is None
+
+    # Next candle closes in 3 minutes - regular throttling applies
+    worker._throttle(throttled_func, throttle_secs=10, timeframes=worker._timeframes)
+    assert sleep_mock.call_args_list[-1][0][0] == 10
+    assert deadline("candle_close") == datetime(2022, 9, 1, 5, 5, tzinfo=timezone.utc)
+    assert deadline("order_management") == datetime(2022, 9, 1, 5, 2, 10, tzinfo=timezone.utc)
+
+    # Positional arguments are passed to the throttled function
+    assert worker._throttle(lambda value: value, 10, 7, timeframes=worker._timeframes) == 7
+
+    # Wake up right after the candle closed
+    time_machine.move_to("2022-09-01 05:04:55 +00:00", tick=False)
+    worker._throttle(throttled_func, throttle_secs=10, timeframes=worker._timeframes)
+    assert sleep_mock.call_args_list[-1][0][0] == 6
+
+    # Don't wake up between the candle close and the offset
+    time_machine.move_to("2022-09-01 05:04:51 +00:00", tick=False)
+    worker._throttle(throttled_func, throttle_secs=9.5, timeframes=worker._timeframes)
+    assert sleep_mock.call_args_list[-1][0][0] == 10
+
+    # Smallest timeframe wins
+    time_machine.move_to("2022-09-01 05:04:55 +00:00", tick=False)
+    worker._throttle(throttled_func, throttle_secs=10, timeframes=["1h", "1m"])
+    assert sleep_mock.call_args_list[-1][0][0] == 6
+    assert deadline("candle_close") == datetime(2022, 9, 1, 5, 5, tzinfo=timezone.utc)
+
+
+def test_worker_candle_timeframes(mocker, default_conf) -> None:
+    worker = get_patched_worker(mocker, default_conf)
+    worker.coingro.strategy.gather_informative_pairs = MagicMock(
+        return_value=[("ETH/BTC", "1h", ""), ("XRP/BTC", "5m", ""), ("LTC/BTC", "1d", "")]
+    )
+    assert worker._candle_timeframes() == ["1d", "1h", "5m"]
+
+
 def test_worker_heartbeat_running(default_conf, mocker, caplog):
     message = r"Bot heartbeat\. PID=.*state='RUNNING'"
 